@@ -0,0 +1,73 @@
+"""Measures nested acquisition of contexts.
+
+Run with `python benchmarks/bench_context_nesting.py [depth] [iterations]`.
+"""
+
+import asyncio
+import sys
+import time
+
+from gyver.context import AsyncContext
+from gyver.context import Context
+
+
+class Client:
+    pass
+
+
+class Adapter:
+    def new(self) -> Client:
+        return Client()
+
+    def release(self, client: Client) -> None:
+        pass
+
+    def is_closed(self, client: Client) -> bool:
+        return False
+
+
+class AsyncAdapter:
+    async def new(self) -> Client:
+        return Client()
+
+    async def release(self, client: Client) -> None:
+        pass
+
+    async def is_closed(self, client: Client) -> bool:
+        return False
+
+
+def nest(context: Context[Client], depth: int) -> None:
+    if depth:
+        with context:
+            nest(context, depth - 1)
+
+
+async def async_nest(context: AsyncContext[Client], depth: int) -> None:
+    if depth:
+        async with context:
+            await async_nest(context, depth - 1)
+
+
+def report(name: str, elapsed: float, iterations: int, depth: int) -> None:
+    per_enter = elapsed / (iterations * depth) * 1e9
+    print(f"{name:<14} {elapsed:8.3f}s {per_enter:10.1f}ns/enter")
+
+
+async def main(depth: int, iterations: int) -> None:
+    context = Context(Adapter())
+    start = time.perf_counter()
+    for _ in range(iterations):
+        nest(context, depth)
+    report("Context", time.perf_counter() - start, iterations, depth)
+
+    async_context = AsyncContext(AsyncAdapter())
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await async_nest(async_context, depth)
+    report("AsyncContext", time.perf_counter() - start, iterations, depth)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    asyncio.run(main(*args) if args else main(5, 20_000))
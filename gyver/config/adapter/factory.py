@@ -1,8 +1,8 @@
 import contextlib
+import threading
 import typing
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
-from dataclasses import is_dataclass
 from pathlib import Path
 from typing import (
     Any,
@@ -20,14 +20,14 @@ from config.utils import LiteralType, boolean_cast, literal_cast
 from gyver.attrs import define, mark_factory
 from gyver.attrs.utils.functions import disassemble_type
 from gyver.attrs.utils.typedef import DisassembledType
+from gyver.ds.cache import LRUCache
 from gyver.misc import autodiscovery
 from gyver.misc.strings import make_lex_separator
 from gyver.utils import json, panic
 
-from .dataclass import DataclassResolverStrategy
-from .gattrs import GyverAttrsResolverStrategy
 from .interface import FieldResolverStrategy
 from .mark import is_config
+from .registry import strategy_registry
 
 DEFAULT_CONFIG = Config()
 
@@ -72,6 +72,29 @@ def _loads(val: Any) -> Any:
     return json.loads(val) if isinstance(val, str) else val
 
 
+@define
+class _FieldPlan:
+    init_name: str
+    names: Sequence[str]
+    resolver: FieldResolverStrategy
+    cast: Any
+    nested: "_LoadPlan | None"
+
+
+@define
+class _LoadPlan:
+    model_cls: type
+    fields: tuple[_FieldPlan, ...]
+
+
+MAX_PLANS = 512
+
+# compiled load plans by (factory class, model class, prefix, separator), bounded
+# so per-tenant or per-request prefixes do not pile up
+_PLANS: LRUCache[tuple[type, type, str, str], _LoadPlan] = LRUCache(MAX_PLANS)
+_PLANS_LOCK = threading.Lock()
+
+
 @define
 class AdapterConfigFactory:
     """
@@ -92,27 +115,30 @@ class AdapterConfigFactory:
 
         Returns:
             type[FieldResolverStrategy]: The strategy class for resolving fields.
+
+        Raises:
+            ValueError: If no strategy handles the class.
+        """
+        return strategy_registry.resolve(config_class.origin or config_class.type_)
+
+    @staticmethod
+    def register_strategy(
+        matcher: Callable[[type], bool],
+        strategy: type[FieldResolverStrategy],
+    ) -> None:
+        """
+        Register a strategy for resolving the fields of other kinds of classes.
+
+        Strategies registered later are matched first, so they can also
+        replace the built-in ones.
+
+        Args:
+            matcher (Callable[[type], bool]): Whether the strategy handles a class.
+            strategy (type[FieldResolverStrategy]): The strategy class.
         """
-        klass = config_class.origin or config_class.type_
-        try:
-            from pydantic import BaseModel, v1
-
-            base_model_cls = [BaseModel, v1.BaseModel]
-        except ImportError:
-            base_model_cls = []
-        if hasattr(klass, "__gyver_attrs__"):
-            return GyverAttrsResolverStrategy
-        elif is_dataclass(klass):
-            return DataclassResolverStrategy
-        elif base_model_cls and issubclass(klass, tuple(base_model_cls)):
-            from .pydantic import PydanticResolverStrategy
-
-            return PydanticResolverStrategy
-        elif hasattr(klass, "__attrs_attrs__"):
-            from .attrs import AttrsResolverStrategy
-
-            return AttrsResolverStrategy
-        raise ValueError("Unknown class definition")
+        strategy_registry.register(matcher, strategy)
+        with _PLANS_LOCK:
+            _PLANS.clear()
 
     def load(
         self,
@@ -136,24 +162,17 @@ class AdapterConfigFactory:
         Returns:
             T: The loaded configuration instance.
         """
-        presets = presets or {}
-        strategy_class = self.get_strategy_class(disassemble_type(model_cls))
-        resolvers = tuple(
-            resolver
-            for field in strategy_class.iterfield(model_cls)
-            if (resolver := strategy_class(field)).init_name() not in presets
-        )
-        result = {
-            resolver.init_name(): self._get_value(
-                model_cls,
-                resolver,
-                __prefix__,
-                __sep__,
-                defaults,
-            )
-            for resolver in resolvers
-        }
-        return model_cls(**result | presets)
+        plan = self._get_plan(model_cls, __prefix__, __sep__)
+        return self._execute(plan, presets or {}, defaults)
+
+    @staticmethod
+    def clear_plans() -> None:
+        """
+        Discard the compiled load plans, e.g., after changing the fields or the
+        `__prefix__` of a model class that was already loaded.
+        """
+        with _PLANS_LOCK:
+            _PLANS.clear()
 
     def maker(
         self,
@@ -185,28 +204,55 @@ class AdapterConfigFactory:
 
         return load
 
-    def _get_value(
-        self,
-        model_cls: type,
-        resolver: FieldResolverStrategy,
-        prefix: str,
-        sep: str,
-        defaults: Mapping[str, Any],
-    ):
-        names = self.resolve_names(model_cls, resolver, prefix)
-        default = next(
-            (result for name in names if (result := defaults.get(name))),
-            resolver.default(),
-        )
-        cast, _is_config = _resolve_cast(resolver.cast())
-        if _is_config:
-            return self.load(
-                cast,
-                f"{next(iter(names))}{sep}",
-                sep,
-                defaults=defaults,
+    def _get_plan(self, model_cls: type, prefix: str, sep: str) -> _LoadPlan:
+        key = (type(self), model_cls, prefix, sep)
+        with _PLANS_LOCK:
+            plan = _PLANS.get(key)
+        if plan is None:
+            plan = self._compile(model_cls, prefix, sep)
+            with _PLANS_LOCK:
+                _PLANS.set(key, plan)
+        return plan
+
+    def _compile(self, model_cls: type, prefix: str, sep: str) -> _LoadPlan:
+        strategy_class = self.get_strategy_class(disassemble_type(model_cls))
+        fields = []
+        for field in strategy_class.iterfield(model_cls):
+            resolver = strategy_class(field)
+            names = tuple(self.resolve_names(model_cls, resolver, prefix))
+            cast, _is_config = _resolve_cast(resolver.cast())
+            nested = (
+                self._get_plan(cast, f"{next(iter(names))}{sep}", sep)
+                if _is_config
+                else None
+            )
+            fields.append(
+                _FieldPlan(resolver.init_name(), names, resolver, cast, nested)
+            )
+        return _LoadPlan(model_cls, tuple(fields))
+
+    def _execute(
+        self, plan: _LoadPlan, presets: dict[str, Any], defaults: Mapping[str, Any]
+    ) -> Any:
+        result = {}
+        for field in plan.fields:
+            if field.init_name in presets:
+                continue
+            if field.nested is not None:
+                # nested models receive the defaults under the "defaults" key
+                result[field.init_name] = self._execute(
+                    field.nested, {}, {"defaults": defaults}
+                )
+                continue
+            # evaluated on every load since strategies may call default factories
+            default = next(
+                (value for name in field.names if (value := defaults.get(name))),
+                field.resolver.default(),
+            )
+            result[field.init_name] = _try_each(
+                *field.names, default=default, cast=field.cast, config=self.config
             )
-        return _try_each(*names, default=default, cast=cast, config=self.config)
+        return plan.model_cls(**result | presets)
 
     def resolve_names(
         self, model_cls: type, resolver: FieldResolverStrategy, prefix: str
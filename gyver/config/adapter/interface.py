@@ -12,10 +12,19 @@ if TYPE_CHECKING:
 
     from attrs import Attribute
     from gyver.attrs.field import Field as GField
+    from msgspec.structs import FieldInfo as StructField
 
     from .pydantic import FieldWrapper
 
-T_co = TypeVar("T_co", "FieldWrapper", "Attribute", "Field", "GField", covariant=True)
+T_co = TypeVar(
+    "T_co",
+    "FieldWrapper",
+    "Attribute",
+    "Field",
+    "GField",
+    "StructField",
+    covariant=True,
+)
 
 
 class FieldResolverStrategy(Protocol[T_co]):
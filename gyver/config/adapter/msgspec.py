@@ -0,0 +1,39 @@
+from typing import Any
+from collections.abc import Generator
+from collections.abc import Sequence
+
+from config import MISSING
+from gyver.attrs import define
+from msgspec import NODEFAULT
+from msgspec import Struct
+from msgspec.structs import FieldInfo
+from msgspec.structs import fields
+
+from gyver.config.adapter.interface import FieldResolverStrategy
+
+
+@define
+class MsgspecResolverStrategy(FieldResolverStrategy[FieldInfo]):
+    field: FieldInfo
+
+    def cast(self) -> type:
+        return self.field.type
+
+    def names(self) -> Sequence[str]:
+        return (self.field.name, self.field.encode_name)
+
+    def init_name(self) -> str:
+        return self.field.name
+
+    def default(self) -> Any | type[MISSING]:
+        if self.field.default not in (None, NODEFAULT):
+            return self.field.default
+        return (
+            MISSING
+            if self.field.default_factory is NODEFAULT
+            else self.field.default_factory
+        )
+
+    @staticmethod
+    def iterfield(config_class: type[Struct]) -> Generator[FieldInfo, Any, Any]:
+        yield from fields(config_class)
@@ -0,0 +1,158 @@
+import functools
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import is_dataclass
+
+from .dataclass import DataclassResolverStrategy
+from .gattrs import GyverAttrsResolverStrategy
+from .interface import FieldResolverStrategy
+
+StrategyMatcher = Callable[[type], bool]
+StrategyLoader = Callable[[], type[FieldResolverStrategy]]
+
+
+@functools.cache
+def _pydantic_bases() -> tuple[type, ...]:
+    try:
+        from pydantic import BaseModel, v1
+    except ImportError:
+        return ()
+    return (BaseModel, v1.BaseModel)
+
+
+@functools.cache
+def _msgspec_bases() -> tuple[type, ...]:
+    try:
+        from msgspec import Struct
+    except ImportError:
+        return ()
+    return (Struct,)
+
+
+def _is_pydantic(klass: type) -> bool:
+    bases = _pydantic_bases()
+    return bool(bases) and isinstance(klass, type) and issubclass(klass, bases)
+
+
+def _is_msgspec(klass: type) -> bool:
+    bases = _msgspec_bases()
+    return bool(bases) and isinstance(klass, type) and issubclass(klass, bases)
+
+
+def _load_pydantic() -> type[FieldResolverStrategy]:
+    from .pydantic import PydanticResolverStrategy
+
+    return PydanticResolverStrategy
+
+
+def _load_attrs() -> type[FieldResolverStrategy]:
+    from .attrs import AttrsResolverStrategy
+
+    return AttrsResolverStrategy
+
+
+def _load_msgspec() -> type[FieldResolverStrategy]:
+    from .msgspec import MsgspecResolverStrategy
+
+    return MsgspecResolverStrategy
+
+
+class StrategyRegistry:
+    """Finds the field resolver strategy of configuration classes.
+
+    Strategies are matched in order, and the result for each class,
+    including the lack of one, is cached after its first resolution for
+    as long as the class is alive.
+    Strategies whose library is optional are only imported when a class
+    from that library is resolved.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[StrategyMatcher, StrategyLoader]] = []
+        self._resolved: weakref.WeakKeyDictionary[
+            type, type[FieldResolverStrategy] | None
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        matcher: StrategyMatcher,
+        strategy: type[FieldResolverStrategy],
+        prepend: bool = True,
+    ) -> None:
+        """
+        Register a strategy for the classes accepted by `matcher`.
+
+        Args:
+            matcher (Callable[[type], bool]): Whether the strategy handles a class.
+            strategy (type[FieldResolverStrategy]): The strategy class.
+            prepend (bool, optional): Whether to match it before the strategies
+                already registered. Defaults to True.
+        """
+        self.register_loader(matcher, lambda: strategy, prepend)
+
+    def register_loader(
+        self, matcher: StrategyMatcher, loader: StrategyLoader, prepend: bool = True
+    ) -> None:
+        """
+        Register a strategy imported by `loader` on its first match.
+
+        Args:
+            matcher (Callable[[type], bool]): Whether the strategy handles a class.
+            loader (Callable[[], type[FieldResolverStrategy]]): Returns the strategy class.
+            prepend (bool, optional): Whether to match it before the strategies
+                already registered. Defaults to True.
+        """
+        with self._lock:
+            if prepend:
+                self._entries.insert(0, (matcher, loader))
+            else:
+                self._entries.append((matcher, loader))
+            self._resolved.clear()
+
+    def resolve(self, klass: type) -> type[FieldResolverStrategy]:
+        """
+        Get the strategy for resolving the fields of a class.
+
+        Args:
+            klass (type): The configuration class.
+
+        Returns:
+            type[FieldResolverStrategy]: The strategy class.
+
+        Raises:
+            ValueError: If no strategy handles the class.
+        """
+        try:
+            strategy = self._resolved[klass]
+        except KeyError:
+            strategy = self._resolved[klass] = self._find(klass)
+        except TypeError:
+            # unhashable or not weakly referenceable type hints are not cached
+            strategy = self._find(klass)
+        if strategy is None:
+            raise ValueError("Unknown class definition")
+        return strategy
+
+    def _find(self, klass: type) -> type[FieldResolverStrategy] | None:
+        with self._lock:
+            entries = tuple(self._entries)
+        for matcher, loader in entries:
+            if matcher(klass):
+                return loader()
+        return None
+
+
+strategy_registry = StrategyRegistry()
+strategy_registry.register(
+    lambda klass: hasattr(klass, "__gyver_attrs__"),
+    GyverAttrsResolverStrategy,
+    prepend=False,
+)
+strategy_registry.register(is_dataclass, DataclassResolverStrategy, prepend=False)
+strategy_registry.register_loader(_is_pydantic, _load_pydantic, prepend=False)
+strategy_registry.register_loader(
+    lambda klass: hasattr(klass, "__attrs_attrs__"), _load_attrs, prepend=False
+)
+strategy_registry.register_loader(_is_msgspec, _load_msgspec, prepend=False)
@@ -1,10 +1,27 @@
+from .atomic_ import AsyncAtomicRetry
+from .atomic_ import AsyncGroupCommit
+from .atomic_ import AtomicRetry
 from .atomic_ import atomic
+from .composite import AsyncCompositeContext
 from .context import AsyncContext
 from .context import Context
+from .instrument import AsyncInstrumentedAdapter
+from .instrument import ContextEvent
+from .instrument import ContextStats
+from .instrument import InstrumentedAdapter
+from .instrument import Instrumentation
 from .interfaces.adapter import Adapter
 from .interfaces.adapter import AsyncAdapter
 from .interfaces.adapter import AtomicAdapter
 from .interfaces.adapter import AtomicAsyncAdapter
+from .interfaces.adapter import SavepointAdapter
+from .interfaces.adapter import SavepointAsyncAdapter
+from .pool import AsyncPoolAdapter
+from .pool import PoolAdapter
+from .routing import AsyncRoutingContext
+from .routing import RoutingContext
+from .scoped import AsyncScopedContext
+from .scoped import ScopedContext
 
 __all__ = [
     "Context",
@@ -14,4 +31,21 @@ __all__ = [
     "atomic",
     "AtomicAsyncAdapter",
     "AtomicAdapter",
+    "AsyncScopedContext",
+    "PoolAdapter",
+    "AsyncPoolAdapter",
+    "ScopedContext",
+    "SavepointAdapter",
+    "SavepointAsyncAdapter",
+    "AtomicRetry",
+    "AsyncAtomicRetry",
+    "Instrumentation",
+    "InstrumentedAdapter",
+    "AsyncInstrumentedAdapter",
+    "ContextStats",
+    "ContextEvent",
+    "RoutingContext",
+    "AsyncRoutingContext",
+    "AsyncGroupCommit",
+    "AsyncCompositeContext",
 ]
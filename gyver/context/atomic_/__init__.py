@@ -2,7 +2,10 @@ from .bound import AsyncBoundContext
 from .bound import BoundContext
 from .core import AsyncAtomicContext
 from .core import AtomicContext
+from .group import AsyncGroupCommit
 from .resolver import atomic
+from .retry import AsyncAtomicRetry
+from .retry import AtomicRetry
 
 __all__ = [
     "atomic",
@@ -10,4 +13,7 @@ __all__ = [
     "AsyncBoundContext",
     "AtomicContext",
     "AsyncAtomicContext",
+    "AtomicRetry",
+    "AsyncAtomicRetry",
+    "AsyncGroupCommit",
 ]
@@ -1,14 +1,68 @@
+import asyncio
+import threading
+import weakref
+from typing import Any
 from typing import Generic
 
 from gyver.context.context import AsyncContext, Context
 from gyver.context.interfaces.adapter import AtomicAdapter, AtomicAsyncAdapter
+from gyver.context.scoped import AsyncScopedContext, ScopedContext
 from gyver.context.typedef import T
 
+from .hooks import TransactionCallbacks
+from .hooks import TransactionHooks
+from .hooks import async_run_callbacks
+from .hooks import run_callbacks
+from .savepoint import NO_SAVEPOINT
+from .savepoint import supports_savepoints
 
-class BoundContext(Context[T], Generic[T]):
+
+class _BoundState:
+    """The stack, savepoints and transaction of a bound context."""
+
+    def __init__(self) -> None:
+        self.stack = 0
+        self.savepoints: list[Any] = []
+        self.transaction: TransactionHooks | None = None
+
+
+class _ThreadBoundState(_BoundState, threading.local):
+    """The state of a bound context, kept for each thread."""
+
+
+class _ScopedState:
+    """Reads the state of the bound context from `_current_state`, so
+    contexts wrapping a scoped context keep one per scope of its clients."""
+
+    def _current_state(self) -> _BoundState:
+        raise NotImplementedError
+
+    @property
+    def _stack(self) -> int:
+        return self._current_state().stack
+
+    @_stack.setter
+    def _stack(self, value: int) -> None:
+        self._current_state().stack = value
+
+    @property
+    def _savepoints(self) -> list[Any]:
+        return self._current_state().savepoints
+
+    @property
+    def _transaction(self) -> TransactionHooks | None:
+        return self._current_state().transaction
+
+    @_transaction.setter
+    def _transaction(self, value: TransactionHooks | None) -> None:
+        self._current_state().transaction = value
+
+
+class BoundContext(_ScopedState, Context[T], TransactionCallbacks, Generic[T]):
     """A context manager for managing atomic transactions with an adapter."""
 
     adapter: AtomicAdapter[T]
+    _deferrable = False  # the transaction begins on enter
 
     def __new__(cls, adapter: AtomicAdapter[T], context: Context[T]):
         if not isinstance(context, cls) or adapter is not context.adapter:
@@ -27,10 +81,19 @@ class BoundContext(Context[T], Generic[T]):
         """
         if self._already_inited:
             return
+        # each thread holds its own client of a scoped context, so it needs
+        # its own transaction
+        self._state = (
+            _ThreadBoundState() if isinstance(context, ScopedContext) else _BoundState()
+        )
         super().__init__(adapter)
         self._context = context
+        self._use_savepoints = supports_savepoints(adapter)
         self._already_inited = True
 
+    def _current_state(self) -> _BoundState:
+        return self._state
+
     def acquire(self):
         """
         Acquire the context for a transaction and begin an atomic operation.
@@ -40,8 +103,19 @@ class BoundContext(Context[T], Generic[T]):
         """
         with self._lock:
             client = self._context.acquire()
+            # nested in a transaction, possibly started by another atomic scope
+            is_savepoint = self._use_savepoints and bool(
+                self._stack or self.adapter.in_atomic(client)
+            )
+            if is_savepoint:
+                self._savepoints.append(self.adapter.savepoint(client))  # type: ignore
+            else:
+                self._savepoints.append(NO_SAVEPOINT)
+                self.adapter.begin(client)
+            self._transaction = TransactionHooks.enter(client)
+            if is_savepoint:
+                self._transaction.savepoint()
             self._stack += 1
-            self.adapter.begin(client)
         return client
 
     def release(self, commit: bool = True):
@@ -52,14 +126,31 @@ class BoundContext(Context[T], Generic[T]):
             commit (bool, optional): Whether to commit the transaction. Defaults to True.
         """
         with self._lock:
-            if self._stack == 1:
-                if self.adapter.in_atomic(self._context.client):
+            client = self._context.client
+            transaction = self._transaction
+            savepoint = self._savepoints.pop() if self._savepoints else NO_SAVEPOINT
+            try:
+                if savepoint is not NO_SAVEPOINT:
+                    if commit:
+                        self.adapter.release_savepoint(client, savepoint)  # type: ignore
+                        transaction.release_savepoint()  # type: ignore
+                    else:
+                        self.adapter.rollback_savepoint(client, savepoint)  # type: ignore
+                        transaction.rollback_savepoint()  # type: ignore
+                elif self._stack == 1 and self.adapter.in_atomic(client):
                     if commit:
-                        self.adapter.commit(self._context.client)
+                        self.adapter.commit(client)
                     else:
-                        self.adapter.rollback(self._context.client)
+                        self.adapter.rollback(client)
+            finally:
+                # leaves the transaction even if the adapter failed, so its hooks
+                # are unregistered
+                self._stack -= 1
+                callbacks = [] if transaction is None else transaction.exit(commit)
+                if self._stack <= 0:
+                    self._transaction = None
                 self._context.release()
-            self._stack -= 1
+        run_callbacks(callbacks)
 
     def __exit__(self, *exc):
         """
@@ -71,10 +162,13 @@ class BoundContext(Context[T], Generic[T]):
         self.release(not any(exc))
 
 
-class AsyncBoundContext(AsyncContext[T], Generic[T]):
+class AsyncBoundContext(
+    _ScopedState, AsyncContext[T], TransactionCallbacks, Generic[T]
+):
     """An asynchronous context manager for managing atomic transactions with an async adapter."""
 
     adapter: AtomicAsyncAdapter[T]
+    _deferrable = False  # the transaction begins on enter
 
     def __new__(cls, adapter: AtomicAsyncAdapter[T], context: AsyncContext[T]):
         if not isinstance(context, cls) or adapter is not context.adapter:
@@ -95,10 +189,25 @@ class AsyncBoundContext(AsyncContext[T], Generic[T]):
         """
         if self._already_inited:
             return
+        self._state = _BoundState()
+        self._task_states: weakref.WeakKeyDictionary | None = None
+        if isinstance(context, AsyncScopedContext):
+            # each task holds its own client, so it needs its own transaction
+            self._task_states = weakref.WeakKeyDictionary()
         super().__init__(adapter)
         self._context = context
+        self._use_savepoints = supports_savepoints(adapter)
         self._already_inited = True
 
+    def _current_state(self) -> _BoundState:
+        if self._task_states is None:
+            return self._state
+        task = asyncio.current_task()
+        state = self._task_states.get(task)  # type: ignore
+        if state is None:
+            state = self._task_states[task] = _BoundState()  # type: ignore
+        return state
+
     async def acquire(self):
         """
         Acquire the async context for a transaction and begin an atomic operation.
@@ -108,8 +217,19 @@ class AsyncBoundContext(AsyncContext[T], Generic[T]):
         """
         async with self._lock:
             client = await self._context.acquire()
-            if self._stack == 0:
-                await self.adapter.begin(client)
+            # nested in a transaction, possibly started by another atomic scope
+            is_savepoint = self._use_savepoints and bool(
+                self._stack or await self.adapter.in_atomic(client)
+            )
+            if is_savepoint:
+                self._savepoints.append(await self.adapter.savepoint(client))  # type: ignore
+            else:
+                self._savepoints.append(NO_SAVEPOINT)
+                if self._stack == 0:
+                    await self.adapter.begin(client)
+            self._transaction = TransactionHooks.enter(client)
+            if is_savepoint:
+                self._transaction.savepoint()
             self._stack += 1
             return client
 
@@ -122,13 +242,30 @@ class AsyncBoundContext(AsyncContext[T], Generic[T]):
         """
         async with self._lock:
             client = await self._context.client()
-            if self._stack == 1:
-                if commit:
-                    await self.adapter.commit(client)
-                else:
-                    await self.adapter.rollback(client)
-            self._stack -= 1
-        await self._context.release()
+            transaction = self._transaction
+            savepoint = self._savepoints.pop() if self._savepoints else NO_SAVEPOINT
+            try:
+                if savepoint is not NO_SAVEPOINT:
+                    if commit:
+                        await self.adapter.release_savepoint(client, savepoint)  # type: ignore
+                        transaction.release_savepoint()  # type: ignore
+                    else:
+                        await self.adapter.rollback_savepoint(client, savepoint)  # type: ignore
+                        transaction.rollback_savepoint()  # type: ignore
+                elif self._stack == 1:
+                    if commit:
+                        await self.adapter.commit(client)
+                    else:
+                        await self.adapter.rollback(client)
+            finally:
+                # leaves the transaction even if the adapter failed, so its hooks
+                # are unregistered
+                self._stack -= 1
+                callbacks = [] if transaction is None else transaction.exit(commit)
+                if self._stack <= 0:
+                    self._transaction = None
+                await self._context.release()
+        await async_run_callbacks(callbacks)
 
     async def __aexit__(self, *exc):
         """
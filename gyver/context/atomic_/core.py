@@ -1,3 +1,4 @@
+from typing import Any
 from typing import Generic
 
 from lazyfields import dellazy
@@ -9,12 +10,22 @@ from gyver.context.interfaces.adapter import AtomicAdapter
 from gyver.context.interfaces.adapter import AtomicAsyncAdapter
 from gyver.context.typedef import T
 
+from .hooks import TransactionCallbacks
+from .hooks import TransactionHooks
+from .hooks import async_run_callbacks
+from .hooks import run_callbacks
+from .savepoint import NO_SAVEPOINT
+from .savepoint import supports_savepoints
 
-class AtomicContext(Context[T], Generic[T]):
+
+class AtomicContext(Context[T], TransactionCallbacks, Generic[T]):
     adapter: AtomicAdapter[T]
+    _deferrable = False  # the transaction begins on enter
 
     def __init__(self, adapter: AtomicAdapter[T]) -> None:
         super().__init__(adapter)
+        self._use_savepoints = supports_savepoints(adapter)
+        self._savepoints: list[Any] = []
 
     @lazyfield
     def client(self):
@@ -24,52 +35,110 @@ class AtomicContext(Context[T], Generic[T]):
         with self._lock:
             if self.adapter.is_closed(self.client):
                 dellazy(self, "client")
+            is_savepoint = bool(self._stack and self._use_savepoints)
+            if is_savepoint:
+                self._savepoints.append(self.adapter.savepoint(self.client))  # type: ignore
+            else:
+                self._savepoints.append(NO_SAVEPOINT)
+                self.adapter.begin(self.client)
+            self._transaction = TransactionHooks.enter(self.client)
+            if is_savepoint:
+                self._transaction.savepoint()
             self._stack += 1
-            self.adapter.begin(self.client)
         return self.client
 
     def release(self, commit: bool = True):
         with self._lock:
-            if self._stack == 1:
-                if self.adapter.in_atomic(self.client):
+            transaction = self._transaction
+            savepoint = self._savepoints.pop() if self._savepoints else NO_SAVEPOINT
+            try:
+                if savepoint is not NO_SAVEPOINT:
                     if commit:
-                        self.adapter.commit(self.client)
+                        self.adapter.release_savepoint(self.client, savepoint)  # type: ignore
+                        transaction.release_savepoint()  # type: ignore
                     else:
-                        self.adapter.rollback(self.client)
-                self.adapter.release(self.client)
-                dellazy(self, "client")
-            self._stack -= 1
+                        self.adapter.rollback_savepoint(self.client, savepoint)  # type: ignore
+                        transaction.rollback_savepoint()  # type: ignore
+                elif self._stack == 1:
+                    try:
+                        if self.adapter.in_atomic(self.client):
+                            if commit:
+                                self.adapter.commit(self.client)
+                            else:
+                                self.adapter.rollback(self.client)
+                    finally:
+                        self.adapter.release(self.client)
+                        dellazy(self, "client")
+            finally:
+                # leaves the transaction even if the adapter failed, so its hooks
+                # are unregistered
+                self._stack -= 1
+                callbacks = [] if transaction is None else transaction.exit(commit)
+                if self._stack <= 0:
+                    self._transaction = None
+        run_callbacks(callbacks)
 
     def __exit__(self, *exc):
         self.release(not any(exc))
 
 
-class AsyncAtomicContext(AsyncContext[T], Generic[T]):
+class AsyncAtomicContext(AsyncContext[T], TransactionCallbacks, Generic[T]):
     adapter: AtomicAsyncAdapter[T]
+    _deferrable = False  # the transaction begins on enter
 
     def __init__(self, adapter: AtomicAsyncAdapter[T]) -> None:
         super().__init__(adapter)
+        self._use_savepoints = supports_savepoints(adapter)
+        self._savepoints: list[Any] = []
 
     async def acquire(self):
         async with self._lock:
-            client = await self.client()
+            client = await self._live_client()
+            is_savepoint = bool(self.stack and self._use_savepoints)
             if self.stack == 0:
                 await self.adapter.begin(client)
+                self._savepoints.append(NO_SAVEPOINT)
+            elif is_savepoint:
+                self._savepoints.append(await self.adapter.savepoint(client))  # type: ignore
+            else:
+                self._savepoints.append(NO_SAVEPOINT)
+            self._transaction = TransactionHooks.enter(client)
+            if is_savepoint:
+                self._transaction.savepoint()
             self._stack += 1
             return client
 
     async def release(self, commit: bool = True):
         async with self._lock:
             client = await self.client()
-            if self._stack == 1:
-                if await self.adapter.in_atomic(client):
+            transaction = self._transaction
+            savepoint = self._savepoints.pop() if self._savepoints else NO_SAVEPOINT
+            try:
+                if savepoint is not NO_SAVEPOINT:
                     if commit:
-                        await self.adapter.commit(client)
+                        await self.adapter.release_savepoint(client, savepoint)  # type: ignore
+                        transaction.release_savepoint()  # type: ignore
                     else:
-                        await self.adapter.rollback(client)
-                await self.adapter.release(client)
-                dellazy(self, "client")
-            self._stack -= 1
+                        await self.adapter.rollback_savepoint(client, savepoint)  # type: ignore
+                        transaction.rollback_savepoint()  # type: ignore
+                elif self._stack == 1:
+                    try:
+                        if await self.adapter.in_atomic(client):
+                            if commit:
+                                await self.adapter.commit(client)
+                            else:
+                                await self.adapter.rollback(client)
+                    finally:
+                        await self.adapter.release(client)
+                        dellazy(self, "client")
+            finally:
+                # leaves the transaction even if the adapter failed, so its hooks
+                # are unregistered
+                self._stack -= 1
+                callbacks = [] if transaction is None else transaction.exit(commit)
+                if self._stack <= 0:
+                    self._transaction = None
+        await async_run_callbacks(callbacks)
 
     async def __aexit__(self, *exc):
         await self.release(not any(exc))
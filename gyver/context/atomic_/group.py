@@ -0,0 +1,215 @@
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, Concatenate, Generic, ParamSpec, TypeVar
+
+from gyver.context.context import AsyncContext
+from gyver.context.typedef import T
+from gyver.exc import GroupCommitClosed
+from gyver.utils import panic
+
+from .resolver import atomic
+from .savepoint import supports_savepoints
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_MAX_BATCH = 100
+DEFAULT_MAX_DELAY = 0.01
+
+
+class _Unit:
+    __slots__ = ("func", "args", "kwargs", "future")
+
+    def __init__(
+        self,
+        func: Callable[..., Coroutine[Any, Any, Any]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        future: asyncio.Future,
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+
+
+class AsyncGroupCommit(Generic[T]):
+    """Runs small write units from concurrent tasks in shared transactions.
+
+    Units are queued by `submit` and run in arrival order inside a single
+    atomic scope once `max_batch` of them are waiting, or `max_delay`
+    seconds after the first one. Each submitter gets a future resolved with
+    the result of its unit when the transaction commits. If the adapter
+    supports savepoints, every unit runs in its own savepoint and a failing
+    unit only fails its own future; otherwise the transaction is rolled back
+    and the other units are run again without it.
+    """
+
+    def __init__(
+        self,
+        context: AsyncContext[T],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        bound: bool = True,
+    ) -> None:
+        """
+        Initialize a new AsyncGroupCommit.
+
+        Args:
+            context (AsyncContext[T]): The context transactions are opened on.
+            max_batch (int, optional): Number of queued units that triggers a commit. Defaults to 100.
+            max_delay (float, optional): Seconds a unit waits for others before its batch
+                is committed. Defaults to 0.01.
+            bound (bool, optional): Whether to bind the atomic scope to the context. Defaults to True.
+
+        Raises:
+            ValueError: If the adapter does not support atomic operations.
+        """
+        self._scope = atomic(context, bound=bound)
+        self._use_savepoints = supports_savepoints(context.adapter)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: list[_Unit] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self._batches = 0
+        self._committed = 0
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns how many units are waiting for their batch to start.
+        """
+        return len(self._pending)
+
+    @property
+    def batches(self) -> int:
+        """
+        Returns how many transactions were committed.
+        """
+        return self._batches
+
+    @property
+    def committed(self) -> int:
+        """
+        Returns how many units were committed.
+        """
+        return self._committed
+
+    def submit(
+        self,
+        func: Callable[Concatenate[T, P], Coroutine[Any, Any, R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> "asyncio.Future[R]":
+        """
+        Queues a unit of work, passing the client as first argument when it runs.
+
+        Args:
+            func (Callable[Concatenate[T, P], Coroutine[Any, Any, R]]): The unit of work.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            asyncio.Future[R]: Resolved with the result of the unit once its
+                transaction commits, or with the error that prevented it.
+                Cancelling it before the batch starts skips the unit.
+
+        Raises:
+            GroupCommitClosed: If the group commit was closed.
+        """
+        if self._closed:
+            raise panic(GroupCommitClosed, "Cannot submit to a closed group commit")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_Unit(func, args, kwargs, future))
+        if len(self._pending) >= self.max_batch:
+            self._start()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._start)
+        return future
+
+    async def flush(self) -> None:
+        """
+        Commits the queued units now and waits for every running batch.
+        """
+        self._start()
+        if self._running:
+            await asyncio.gather(*self._running)
+
+    async def close(self) -> None:
+        """
+        Rejects new units and waits for the queued ones to be committed.
+        """
+        self._closed = True
+        await self.flush()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    def _start(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._commit(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _commit(self, batch: list[_Unit]) -> None:
+        try:
+            # batches share the client of the context, so they run one at a time
+            async with self._lock:
+                while batch:
+                    batch = await self._run(batch)
+        finally:
+            for unit in batch:
+                if not unit.future.done():
+                    unit.future.cancel()
+
+    async def _run(self, batch: list[_Unit]) -> list[_Unit]:
+        # returns the units to run again in a new transaction
+        scope = self._scope
+        results: list[tuple[_Unit, Any]] = []
+        failed: int | None = None
+        try:
+            async with scope as client:
+                for index, unit in enumerate(batch):
+                    if unit.future.done():
+                        continue
+                    try:
+                        if self._use_savepoints:
+                            async with scope:
+                                result = await unit.func(
+                                    client, *unit.args, **unit.kwargs
+                                )
+                        else:
+                            result = await unit.func(client, *unit.args, **unit.kwargs)
+                    except Exception as e:
+                        if not unit.future.done():
+                            unit.future.set_exception(e)
+                        if self._use_savepoints:
+                            continue
+                        failed = index
+                        raise
+                    results.append((unit, result))
+        except Exception as e:
+            if failed is not None:
+                return batch[:failed] + batch[failed + 1 :]
+            for unit in batch:
+                if not unit.future.done():
+                    unit.future.set_exception(e)
+            return []
+        self._batches += 1
+        self._committed += len(results)
+        for unit, result in results:
+            if not unit.future.done():
+                unit.future.set_result(result)
+        return []
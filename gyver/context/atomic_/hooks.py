@@ -0,0 +1,133 @@
+import inspect
+import threading
+import typing
+from collections.abc import Callable
+
+from gyver.exc import ErrorGroup
+from gyver.exc import NoActiveTransaction
+from gyver.utils import panic
+
+Callback = Callable[[], typing.Any]
+
+
+class TransactionHooks:
+    """Callbacks waiting for the outcome of the transaction of a client.
+
+    Shared by every atomic scope using the same client, so callbacks
+    registered in nested scopes run once, when the outermost one releases.
+    Callbacks registered inside a savepoint that is rolled back never see a
+    commit: their `on_commit` callbacks are dropped and their `on_rollback`
+    callbacks run at the end whatever the outcome.
+    """
+
+    _registry: typing.ClassVar[dict[int, "TransactionHooks"]] = {}
+    _registry_lock: typing.ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, key: int) -> None:
+        self._key = key
+        self._depth = 0
+        self._commit: list[Callback] = []
+        self._rollback: list[Callback] = []
+        self._rolled_back: list[Callback] = []
+        self._marks: list[tuple[int, int]] = []
+
+    @classmethod
+    def enter(cls, client: typing.Any) -> "TransactionHooks":
+        """Returns the hooks of the transaction of `client`, joining it."""
+        with cls._registry_lock:
+            hooks = cls._registry.get(id(client))
+            if hooks is None:
+                hooks = cls._registry[id(client)] = cls(id(client))
+            hooks._depth += 1
+        return hooks
+
+    def exit(self, commit: bool) -> list[Callback]:
+        """Leaves the transaction, returning the callbacks to run if it ended."""
+        with self._registry_lock:
+            self._depth -= 1
+            if self._depth > 0:
+                return []
+            self._registry.pop(self._key, None)
+        callbacks = self._commit if commit else self._rollback
+        return callbacks + self._rolled_back
+
+    def on_commit(self, callback: Callback) -> None:
+        self._commit.append(callback)
+
+    def on_rollback(self, callback: Callback) -> None:
+        self._rollback.append(callback)
+
+    def savepoint(self) -> None:
+        self._marks.append((len(self._commit), len(self._rollback)))
+
+    def release_savepoint(self) -> None:
+        self._marks.pop()
+
+    def rollback_savepoint(self) -> None:
+        commit_mark, rollback_mark = self._marks.pop()
+        del self._commit[commit_mark:]
+        self._rolled_back.extend(self._rollback[rollback_mark:])
+        del self._rollback[rollback_mark:]
+
+
+def run_callbacks(callbacks: list[Callback]) -> None:
+    """Runs every callback, raising an ErrorGroup with the errors if any failed."""
+    errors = []
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        raise ErrorGroup("Transaction callbacks failed", errors)
+
+
+async def async_run_callbacks(callbacks: list[Callback]) -> None:
+    """Runs every callback, awaiting async ones, raising an ErrorGroup with the
+    errors if any failed."""
+    errors = []
+    for callback in callbacks:
+        try:
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        raise ErrorGroup("Transaction callbacks failed", errors)
+
+
+class TransactionCallbacks:
+    """Adds `on_commit` and `on_rollback` registration to atomic contexts."""
+
+    _transaction: TransactionHooks | None = None
+
+    def on_commit(self, callback: Callback) -> None:
+        """
+        Runs `callback` once the outermost atomic scope commits.
+
+        Args:
+            callback (Callable[[], Any]): The callback; async contexts also accept coroutine functions.
+
+        Raises:
+            NoActiveTransaction: If the context is not in an atomic scope.
+        """
+        self._active_transaction().on_commit(callback)
+
+    def on_rollback(self, callback: Callback) -> None:
+        """
+        Runs `callback` once the outermost atomic scope rolls back, or at its end
+        if the savepoint it was registered in rolls back.
+
+        Args:
+            callback (Callable[[], Any]): The callback; async contexts also accept coroutine functions.
+
+        Raises:
+            NoActiveTransaction: If the context is not in an atomic scope.
+        """
+        self._active_transaction().on_rollback(callback)
+
+    def _active_transaction(self) -> TransactionHooks:
+        if self._transaction is None:
+            raise panic(NoActiveTransaction, "Callbacks require an active atomic scope")
+        return self._transaction
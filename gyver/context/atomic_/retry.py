@@ -0,0 +1,266 @@
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any, Concatenate, Generic, ParamSpec, TypeVar
+
+from gyver.context.context import AsyncContext
+from gyver.context.context import Context
+from gyver.context.typedef import T
+from gyver.ds.backoff import BackoffPolicy
+from gyver.ds.backoff import ExponentialBackoff
+from gyver.ds.deadline import remaining_time
+from gyver.exc import DeadlineExceeded
+
+from .resolver import atomic
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = ExponentialBackoff(base=0.05, cap=1, jitter=True)
+
+OnRetry = Callable[[int, Exception, float], Any]
+
+
+def _resolve_is_transient(
+    context: Context[Any] | AsyncContext[Any],
+    is_transient: Callable[[Exception], bool] | None,
+) -> Callable[[Exception], bool]:
+    if is_transient is not None:
+        return is_transient
+    if not hasattr(context.adapter, "is_transient"):
+        raise ValueError(
+            "The adapter does not classify transient errors, "
+            "provide `is_transient` or implement `adapter.is_transient`"
+        )
+    return context.adapter.is_transient  # type: ignore
+
+
+def _next_delay(
+    backoff: BackoffPolicy, attempt: int, previous: float, max_attempts: int
+) -> float | None:
+    if attempt + 1 >= max_attempts:
+        return None
+    delay = backoff.compute(attempt, previous)
+    try:
+        remaining = remaining_time()
+    except DeadlineExceeded:
+        return None
+    if remaining is not None and delay >= remaining:
+        return None
+    return delay
+
+
+class _RetryStats:
+    def __init__(self) -> None:
+        self._calls = 0
+        self._retries = 0
+        self._exhausted = 0
+
+    @property
+    def calls(self) -> int:
+        """
+        Returns how many transactional calls were executed.
+        """
+        return self._calls
+
+    @property
+    def retries(self) -> int:
+        """
+        Returns how many times a transaction was re-run after a transient error.
+        """
+        return self._retries
+
+    @property
+    def exhausted(self) -> int:
+        """
+        Returns how many calls failed with a transient error after their last attempt.
+        """
+        return self._exhausted
+
+
+class AtomicRetry(_RetryStats, Generic[T]):
+    """Runs a function inside an atomic scope, re-running it on transient errors.
+
+    Meant for serialization failures and deadlocks, where the database aborts
+    the transaction and the only fix is to run it again. Errors are classified
+    by `is_transient`, or by `adapter.is_transient(error)` if not given. Only
+    the outermost transaction is retried: when bound and called inside an
+    atomic scope that is already running, the function runs once, since the
+    failure aborts the enclosing transaction as well. Unbound scopes run on
+    a client of their own, so they are always retried.
+    """
+
+    def __init__(
+        self,
+        context: Context[T],
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff: BackoffPolicy = DEFAULT_BACKOFF,
+        is_transient: Callable[[Exception], bool] | None = None,
+        on_retry: OnRetry | None = None,
+        bound: bool = True,
+    ) -> None:
+        """
+        Initialize a new AtomicRetry.
+
+        Args:
+            context (Context[T]): The context transactions are opened on.
+            max_attempts (int, optional): Maximum number of runs, including the first one. Defaults to 3.
+            backoff (BackoffPolicy, optional): Computes the delay before each retry.
+            is_transient (Callable[[Exception], bool] | None, optional): Whether an error can be retried.
+                Defaults to `adapter.is_transient`.
+            on_retry (Callable[[int, Exception, float], Any] | None, optional): Called with the attempt,
+                the error and the delay before each retry, e.g., to record metrics.
+            bound (bool, optional): Whether to bind the atomic scope to the context. Defaults to True.
+
+        Raises:
+            ValueError: If the adapter cannot classify errors and `is_transient` is not given.
+        """
+        super().__init__()
+        self._context = context
+        self.bound = bound
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.is_transient = _resolve_is_transient(context, is_transient)
+        self.on_retry = on_retry
+
+    def _is_nested(self) -> bool:
+        if not self.bound:
+            # each attempt runs on a fresh client, outside any enclosing transaction
+            return False
+        context = self._context
+        return context.is_active() and context.adapter.in_atomic(context.client)  # type: ignore
+
+    def execute(
+        self, func: Callable[Concatenate[T, P], R], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        """
+        Executes the function in a transaction, passing the client as first argument.
+
+        Args:
+            func (Callable[Concatenate[T, P], R]): The transactional function.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            R: The result of the first successful run.
+
+        Raises:
+            The last error raised by the function if it cannot be retried.
+        """
+        self._calls += 1
+        scope = atomic(self._context, bound=self.bound)
+        if self._is_nested():
+            with scope as client:
+                return func(client, *args, **kwargs)
+        delay = 0.0
+        attempt = 0
+        while True:
+            try:
+                with scope as client:
+                    return func(client, *args, **kwargs)
+            except Exception as e:
+                if not self.is_transient(e):
+                    raise
+                delay = _next_delay(self.backoff, attempt, delay, self.max_attempts)
+                if delay is None:
+                    self._exhausted += 1
+                    raise
+                self._retries += 1
+                if self.on_retry is not None:
+                    self.on_retry(attempt + 1, e, delay)
+                time.sleep(delay)
+                attempt += 1
+
+
+class AsyncAtomicRetry(_RetryStats, Generic[T]):
+    """Runs an async function inside an atomic scope, re-running it on transient errors.
+
+    Works like `AtomicRetry` with an AsyncContext.
+    """
+
+    def __init__(
+        self,
+        context: AsyncContext[T],
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff: BackoffPolicy = DEFAULT_BACKOFF,
+        is_transient: Callable[[Exception], bool] | None = None,
+        on_retry: OnRetry | None = None,
+        bound: bool = True,
+    ) -> None:
+        """
+        Initialize a new AsyncAtomicRetry.
+
+        Args:
+            context (AsyncContext[T]): The context transactions are opened on.
+            max_attempts (int, optional): Maximum number of runs, including the first one. Defaults to 3.
+            backoff (BackoffPolicy, optional): Computes the delay before each retry.
+            is_transient (Callable[[Exception], bool] | None, optional): Whether an error can be retried.
+                Defaults to `adapter.is_transient`.
+            on_retry (Callable[[int, Exception, float], Any] | None, optional): Called with the attempt,
+                the error and the delay before each retry, e.g., to record metrics.
+            bound (bool, optional): Whether to bind the atomic scope to the context. Defaults to True.
+
+        Raises:
+            ValueError: If the adapter cannot classify errors and `is_transient` is not given.
+        """
+        super().__init__()
+        self._context = context
+        self.bound = bound
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.is_transient = _resolve_is_transient(context, is_transient)
+        self.on_retry = on_retry
+
+    async def _is_nested(self) -> bool:
+        if not self.bound:
+            # each attempt runs on a fresh client, outside any enclosing transaction
+            return False
+        context = self._context
+        if not context.is_active():
+            return False
+        return await context.adapter.in_atomic(await context.client())  # type: ignore
+
+    async def execute(
+        self,
+        func: Callable[Concatenate[T, P], Coroutine[Any, Any, R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """
+        Executes the async function in a transaction, passing the client as first argument.
+
+        Args:
+            func (Callable[Concatenate[T, P], Coroutine[Any, Any, R]]): The transactional function.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            R: The result of the first successful run.
+
+        Raises:
+            The last error raised by the function if it cannot be retried.
+        """
+        self._calls += 1
+        scope = atomic(self._context, bound=self.bound)
+        if await self._is_nested():
+            async with scope as client:
+                return await func(client, *args, **kwargs)
+        delay = 0.0
+        attempt = 0
+        while True:
+            try:
+                async with scope as client:
+                    return await func(client, *args, **kwargs)
+            except Exception as e:
+                if not self.is_transient(e):
+                    raise
+                delay = _next_delay(self.backoff, attempt, delay, self.max_attempts)
+                if delay is None:
+                    self._exhausted += 1
+                    raise
+                self._retries += 1
+                if self.on_retry is not None:
+                    self.on_retry(attempt + 1, e, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
@@ -0,0 +1,11 @@
+import typing
+
+SAVEPOINT_METHODS = frozenset({"savepoint", "release_savepoint", "rollback_savepoint"})
+
+# marks the levels of an atomic context that did not create a savepoint
+NO_SAVEPOINT: typing.Any = object()
+
+
+def supports_savepoints(adapter: typing.Any) -> bool:
+    """Returns whether the adapter implements the savepoint hooks."""
+    return SAVEPOINT_METHODS.issubset(dir(adapter))
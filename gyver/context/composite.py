@@ -0,0 +1,175 @@
+import asyncio
+import contextlib
+import typing
+
+from gyver.exc import ErrorGroup
+
+from .atomic_ import atomic
+from .context import AsyncContext
+from .context import Context
+from .scoped import AsyncScopedContext
+
+AnyContext = Context[typing.Any] | AsyncContext[typing.Any]
+
+
+class _Member:
+    __slots__ = ("scope", "transactional", "task_scoped")
+
+    def __init__(self, context: AnyContext, transactional: bool) -> None:
+        self.scope: typing.Any = context
+        self.transactional = False
+        # keeps its client in the current task, so it must not run in a child task
+        self.task_scoped = isinstance(context, AsyncScopedContext)
+        if transactional:
+            with contextlib.suppress(ValueError):
+                self.scope = atomic(context)
+                self.transactional = True
+
+    async def acquire(self) -> typing.Any:
+        if isinstance(self.scope, AsyncContext):
+            return await self.scope.acquire()
+        return self.scope.acquire()
+
+    async def release(self, commit: bool) -> None:
+        result = (
+            self.scope.release(commit) if self.transactional else self.scope.release()
+        )
+        if isinstance(self.scope, AsyncContext):
+            await result
+
+
+class AsyncCompositeContext:
+    """Enters several contexts as one scope, e.g., a database, a cache and a queue.
+
+    Async contexts acquire their clients concurrently, so opening the scope
+    takes as long as the slowest connection instead of their sum; sync
+    contexts and task-scoped ones, such as AsyncScopedContext, are acquired
+    and released inline, in the calling task. Contexts whose adapters support atomic
+    operations run in a transaction. On exit, every transaction is rolled
+    back if the scope failed; otherwise they are committed one by one in
+    order, rolling back the remaining ones as soon as a commit fails, and
+    then the other contexts are released. This is best-effort: transactions
+    already committed when a later one fails stay committed.
+    """
+
+    def __init__(self, *contexts: AnyContext, transactional: bool = True) -> None:
+        """
+        Initialize a new AsyncCompositeContext.
+
+        Args:
+            *contexts (Context | AsyncContext): The contexts to enter, in commit order.
+            transactional (bool, optional): Whether to open atomic scopes on the contexts
+                whose adapters support them. Defaults to True.
+        """
+        self._members = [_Member(context, transactional) for context in contexts]
+
+    async def acquire(self) -> tuple[typing.Any, ...]:
+        """
+        Acquires every context, releasing the acquired ones if any fails.
+
+        Returns:
+            tuple[Any, ...]: The clients, in the order of the contexts.
+
+        Raises:
+            The error raised by the context, or an ErrorGroup if several errors happened.
+        """
+        results = await _call_all(self._members, lambda member: member.acquire())
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if not errors:
+            return tuple(results)
+        acquired = [
+            member
+            for member, result in zip(self._members, results)
+            if not isinstance(result, BaseException)
+        ]
+        errors.extend(await _release_all(acquired, commit=False))
+        _raise(errors, "Failed to acquire the contexts")
+
+    async def release(self, commit: bool = True) -> None:
+        """
+        Commits or rolls back the transactions and releases every context.
+
+        Args:
+            commit (bool, optional): Whether to commit the transactions. Defaults to True.
+
+        Raises:
+            The error raised while releasing, or an ErrorGroup if several errors happened.
+        """
+        transactional = [member for member in self._members if member.transactional]
+        others = [member for member in self._members if not member.transactional]
+        errors: list[BaseException] = []
+        if commit:
+            for index, member in enumerate(transactional):
+                try:
+                    await member.release(True)
+                except Exception as e:
+                    errors.append(e)
+                    errors.extend(
+                        await _release_all(transactional[index + 1 :], commit=False)
+                    )
+                    break
+        else:
+            errors.extend(await _release_all(transactional, commit=False))
+        errors.extend(await _release_all(others, commit=False))
+        if errors:
+            _raise(errors, "Failed to release the contexts")
+
+    @contextlib.asynccontextmanager
+    async def begin(self):
+        """
+        An async context manager that acquires every context and yields their clients.
+        """
+        async with self as clients:
+            yield clients
+
+    async def __aenter__(self):
+        """
+        Acquires every context, returning their clients.
+        """
+        return await self.acquire()
+
+    async def __aexit__(self, *exc):
+        """
+        Commits the transactions if no error happened, otherwise rolls them back.
+        """
+        await self.release(not any(exc))
+
+
+async def _call_all(
+    members: list[_Member],
+    call: typing.Callable[[_Member], typing.Awaitable[typing.Any]],
+) -> list[typing.Any]:
+    """Calls every member, returning the results or the errors in order.
+
+    Task-scoped members are called one by one in the current task; the
+    others concurrently, each in a task of its own.
+    """
+    results: list[typing.Any] = [None] * len(members)
+    concurrent = [i for i, member in enumerate(members) if not member.task_scoped]
+    gathered = await asyncio.gather(
+        *(call(members[i]) for i in concurrent), return_exceptions=True
+    )
+    for index, result in zip(concurrent, gathered):
+        results[index] = result
+    for index, member in enumerate(members):
+        if member.task_scoped:
+            try:
+                results[index] = await call(member)
+            except BaseException as e:
+                results[index] = e
+    return results
+
+
+async def _release_all(members: list[_Member], commit: bool) -> list[BaseException]:
+    results = await _call_all(members, lambda member: member.release(commit))
+    return [result for result in results if isinstance(result, BaseException)]
+
+
+def _raise(errors: list[BaseException], message: str) -> typing.NoReturn:
+    for error in errors:
+        # cancellation and interrupts are not grouped
+        if not isinstance(error, Exception):
+            raise error
+    if len(errors) == 1:
+        raise errors[0]
+    raise ErrorGroup(message, errors)  # type: ignore
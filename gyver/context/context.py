@@ -1,17 +1,25 @@
 import asyncio
 import contextlib
 import threading
+import time
 import typing
+from collections.abc import Callable
 
 from lazyfields import asynclazyfield
 from lazyfields import dellazy
+from lazyfields import is_initialized
 from lazyfields import lazyfield
 
 from . import interfaces
 from .typedef import T
 
+DEFAULT_CHECK_INTERVAL = 1.0
+
 
 class Context(typing.Generic[T]):
+    # whether `open(lazy=True)` may defer creating the client
+    _deferrable: typing.ClassVar[bool] = True
+
     def __init__(self, adapter: interfaces.Adapter[T]) -> None:
         """
         Initialize a new Context.
@@ -67,18 +75,35 @@ class Context(typing.Generic[T]):
         and decreases the stack count.
         """
         with self._lock:
-            if self._stack == 1:
+            if self._stack == 1 and is_initialized(self, "client"):
                 self.adapter.release(self.client)
                 dellazy(self, "client")
             self._stack -= 1
 
+    def _defer(self) -> None:
+        with self._lock:
+            self._stack += 1
+
     @contextlib.contextmanager
-    def open(self):
+    def open(self, lazy: bool = False):
         """
         A context manager that acquires and releases resources without returning it.
-        """
-        with self:
+
+        Args:
+            lazy (bool, optional): Whether to only create the client on the first
+                access to `client`, so scopes that never use it don't acquire one.
+                Ignored by atomic contexts, which begin the transaction on enter.
+                Defaults to False.
+        """
+        if not lazy or not self._deferrable:
+            with self:
+                yield
+            return
+        self._defer()
+        try:
             yield
+        finally:
+            self.release()
 
     @contextlib.contextmanager
     def begin(self):
@@ -103,16 +128,35 @@ class Context(typing.Generic[T]):
 
 
 class AsyncContext(typing.Generic[T]):
-    def __init__(self, adapter: interfaces.AsyncAdapter[T]) -> None:
+    # whether `open(lazy=True)` may defer creating the client
+    _deferrable: typing.ClassVar[bool] = True
+
+    def __init__(
+        self,
+        adapter: interfaces.AsyncAdapter[T],
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """
         Initialize a new AsyncContext.
 
         Args:
             adapter (interfaces.AsyncAdapter[T]): An async adapter that will be used to acquire and release resources.
+            check_interval (float, optional): Minimum seconds between two `adapter.is_closed`
+                checks of the client on acquire; a closed client is replaced by a new one.
+                Use 0 to check on every acquire. Defaults to 1.0.
+            clock (Callable[[], float], optional): Clock used to space the checks.
         """
         self._adapter = adapter
+        self.check_interval = check_interval
+        self._clock = clock
+        self._checked_at = 0.0
         self._stack = 0  # Keeps track of how many frames are using this context
         self._lock = asyncio.Lock()  # A lock to ensure thread safety
+        # task that acquired the client while the context was idle, and its client,
+        # so it can re-enter without waiting on the lock
+        self._owner: tuple[asyncio.Task, T] | None = None
+        self._owner_depth = 0
 
     @property
     def stack(self) -> int:
@@ -140,14 +184,46 @@ class AsyncContext(typing.Generic[T]):
         Returns the current resource being used by the context.
         Acquires a new resource if the current one is closed or doesn't exist.
         """
-        return await self._adapter.new()
+        client = await self._adapter.new()
+        self._checked_at = self._clock()
+        return client
+
+    def _check_due(self) -> bool:
+        return self._clock() - self._checked_at >= self.check_interval
+
+    async def _live_client(self) -> T:
+        if is_initialized(self, "client") and self._check_due():
+            self._checked_at = self._clock()
+            if await self.adapter.is_closed(await self.client()):
+                dellazy(self, "client")
+        return await self.client()
 
     async def acquire(self):
         """
-        Acquires a new resource from the adapter and increases the stack count.
+        Acquires a new resource from the adapter and increases the stack count,
+        replacing the current one if it was found closed.
         """
+        owner = self._owner
+        if (
+            owner is not None
+            and owner[0] is asyncio.current_task()
+            and not self._check_due()
+        ):
+            self._stack += 1
+            self._owner_depth += 1
+            return owner[1]
         async with self._lock:
-            client = await self.client()
+            client = await self._live_client()
+            task = asyncio.current_task()
+            owner = self._owner
+            if owner is not None:
+                # keeps the owner in sync if the client was replaced
+                self._owner = (owner[0], client)
+                if owner[0] is task:
+                    self._owner_depth += 1
+            elif self._stack == 0 and task is not None:
+                self._owner = (task, client)
+                self._owner_depth = 1
             self._stack += 1
             return client
 
@@ -156,19 +232,47 @@ class AsyncContext(typing.Generic[T]):
         Releases the current resource if the stack count is 1,
         and decreases the stack count.
         """
+        owner = self._owner
+        if owner is not None and owner[0] is asyncio.current_task():
+            self._owner_depth -= 1
+            if self._owner_depth > 0:
+                self._stack -= 1
+                return
+            self._owner = None
         async with self._lock:
-            if self._stack == 1:
+            if self._stack == 1 and is_initialized(self, "client"):
                 await self.adapter.release(await self.client())
                 dellazy(self, "client")
             self._stack -= 1
+            if self._stack == 0:
+                # the last release may come from a task other than the owner
+                self._owner = None
+                self._owner_depth = 0
+
+    async def _defer(self) -> None:
+        async with self._lock:
+            self._stack += 1
 
     @contextlib.asynccontextmanager
-    async def open(self):
+    async def open(self, lazy: bool = False):
         """
         An async context manager that acquires and releases resources without returning it.
-        """
-        async with self:
+
+        Args:
+            lazy (bool, optional): Whether to only create the client on the first
+                call to `client`, so scopes that never use it don't acquire one.
+                Ignored by atomic contexts, which begin the transaction on enter.
+                Defaults to False.
+        """
+        if not lazy or not self._deferrable:
+            async with self:
+                yield
+            return
+        await self._defer()
+        try:
             yield
+        finally:
+            await self.release()
 
     @contextlib.asynccontextmanager
     async def begin(self):
@@ -0,0 +1,334 @@
+import threading
+import time
+import typing
+from collections.abc import Callable
+
+from gyver.attrs import define
+from gyver.attrs import fields
+
+from .typedef import T
+
+# hooks that are only exposed if the wrapped adapter implements them
+_OPTIONAL_METHODS = frozenset(
+    {
+        "begin",
+        "commit",
+        "rollback",
+        "savepoint",
+        "release_savepoint",
+        "rollback_savepoint",
+    }
+)
+
+
+@define
+class ContextEvent:
+    """Something that happened to a client of an instrumented adapter.
+
+    Attributes:
+        name (str): One of "acquire", "release", "begin", "commit", "rollback",
+            "savepoint", "release_savepoint" or "rollback_savepoint".
+        duration (float): Seconds spent acquiring the client for "acquire",
+            holding it for "release", in the transaction for "commit" and
+            "rollback", and in the savepoint for its release or rollback;
+            0 otherwise.
+        depth (int): Savepoint depth of the transaction after the event.
+    """
+
+    name: str
+    duration: float = 0
+    depth: int = 0
+
+
+@define
+class ContextStats:
+    """A snapshot of the counters of an `Instrumentation`.
+
+    Attributes:
+        acquired (int): Clients created through `adapter.new`.
+        released (int): Clients released.
+        active (int): Clients currently held.
+        acquire_time (float): Total seconds spent in `adapter.new`.
+        hold_time (float): Total seconds clients were held, from creation to release.
+        max_hold_time (float): Longest time a client was held.
+        transactions (int): Transactions started.
+        commits (int): Transactions committed.
+        rollbacks (int): Transactions rolled back.
+        transaction_time (float): Total seconds spent in finished transactions.
+        max_transaction_time (float): Longest finished transaction.
+        savepoint_rollbacks (int): Savepoints rolled back.
+        max_depth (int): Deepest savepoint nesting seen.
+    """
+
+    acquired: int = 0
+    released: int = 0
+    active: int = 0
+    acquire_time: float = 0
+    hold_time: float = 0
+    max_hold_time: float = 0
+    transactions: int = 0
+    commits: int = 0
+    rollbacks: int = 0
+    transaction_time: float = 0
+    max_transaction_time: float = 0
+    savepoint_rollbacks: int = 0
+    max_depth: int = 0
+
+
+_STAT_FIELDS = tuple(name for name in fields(ContextStats) if name != "active")
+
+
+class Instrumentation:
+    """Collects timings and counters from instrumented adapters.
+
+    A single instance can be shared by several adapters to aggregate them.
+    """
+
+    def __init__(
+        self,
+        on_event: Callable[[ContextEvent], typing.Any] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize a new Instrumentation.
+
+        Args:
+            on_event (Callable[[ContextEvent], Any] | None, optional): Called with every event,
+                e.g., to export metrics or log long transactions.
+            clock (Callable[[], float], optional): Clock used to measure durations.
+        """
+        self.on_event = on_event
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._held: dict[int, float] = {}
+        self._transactions: dict[int, list[float]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Resets every counter. Clients and transactions in progress are still tracked.
+        """
+        with self._lock:
+            self._counters: dict[str, typing.Any] = dict.fromkeys(_STAT_FIELDS, 0)
+
+    def snapshot(self) -> ContextStats:
+        """
+        Returns the current counters.
+        """
+        with self._lock:
+            return ContextStats(**self._counters, active=len(self._held))
+
+    def _emit(self, name: str, duration: float = 0, depth: int = 0) -> None:
+        if self.on_event is not None:
+            self.on_event(ContextEvent(name, duration, depth))
+
+    def _add(self, counter: str, total: str, maximum: str, duration: float) -> None:
+        counters = self._counters
+        counters[counter] += 1
+        counters[total] += duration
+        counters[maximum] = max(counters[maximum], duration)
+
+    def acquired(self, client: typing.Any, start: float) -> None:
+        now = self.clock()
+        with self._lock:
+            self._counters["acquired"] += 1
+            self._counters["acquire_time"] += now - start
+            self._held[id(client)] = now
+        self._emit("acquire", now - start)
+
+    def released(self, client: typing.Any) -> None:
+        now = self.clock()
+        with self._lock:
+            start = self._held.pop(id(client), now)
+            # a transaction left open ends with its client, which may be reused
+            self._transactions.pop(id(client), None)
+            self._add("released", "hold_time", "max_hold_time", now - start)
+        self._emit("release", now - start)
+
+    def began(self, client: typing.Any) -> None:
+        with self._lock:
+            if id(client) in self._transactions:
+                # already in a transaction, e.g., begin called by a nested scope
+                return
+            self._transactions[id(client)] = [self.clock()]
+            self._counters["transactions"] += 1
+        self._emit("begin")
+
+    def ended(self, client: typing.Any, commit: bool) -> None:
+        now = self.clock()
+        name = "commit" if commit else "rollback"
+        with self._lock:
+            marks = self._transactions.pop(id(client), [now])
+            self._add(
+                "commits" if commit else "rollbacks",
+                "transaction_time",
+                "max_transaction_time",
+                now - marks[0],
+            )
+        self._emit(name, now - marks[0])
+
+    def savepoint(self, client: typing.Any) -> None:
+        with self._lock:
+            marks = self._transactions.setdefault(id(client), [self.clock()])
+            marks.append(self.clock())
+            depth = len(marks) - 1
+            self._counters["max_depth"] = max(self._counters["max_depth"], depth)
+        self._emit("savepoint", depth=depth)
+
+    def savepoint_ended(self, client: typing.Any, commit: bool) -> None:
+        now = self.clock()
+        with self._lock:
+            marks = self._transactions.get(id(client), [now, now])
+            start = marks.pop() if len(marks) > 1 else now
+            depth = len(marks) - 1
+            if not commit:
+                self._counters["savepoint_rollbacks"] += 1
+        self._emit(
+            "release_savepoint" if commit else "rollback_savepoint", now - start, depth
+        )
+
+
+class _InstrumentedBase(typing.Generic[T]):
+    def __init__(self, adapter: typing.Any, instrumentation: Instrumentation) -> None:
+        self.adapter = adapter
+        self.instrumentation = instrumentation
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # in_atomic, is_transient and any other adapter specific method
+        if name == "adapter":
+            raise AttributeError(name)
+        return getattr(self.adapter, name)
+
+    def __dir__(self) -> list[str]:
+        own = (
+            name
+            for name in super().__dir__()
+            if name not in _OPTIONAL_METHODS or hasattr(self.adapter, name)
+        )
+        inner = (name for name in dir(self.adapter) if not name.startswith("_"))
+        return sorted({*own, *inner})
+
+
+class InstrumentedAdapter(_InstrumentedBase[T], typing.Generic[T]):
+    """Wraps an Adapter, recording how long clients are acquired, held and in a transaction.
+
+    Works with any context, atomic scope or pool adapter since it only
+    wraps the adapter calls; optional hooks such as savepoints are only
+    exposed when the wrapped adapter implements them.
+    """
+
+    def __init__(self, adapter: typing.Any, instrumentation: Instrumentation) -> None:
+        """
+        Initialize a new InstrumentedAdapter.
+
+        Args:
+            adapter (Adapter[T]): The adapter to wrap.
+            instrumentation (Instrumentation): Where to record the timings.
+        """
+        super().__init__(adapter, instrumentation)
+
+    def new(self) -> T:
+        start = self.instrumentation.clock()
+        client = self.adapter.new()
+        self.instrumentation.acquired(client, start)
+        return client
+
+    def release(self, client: T) -> None:
+        self.instrumentation.released(client)
+        self.adapter.release(client)
+
+    def is_closed(self, client: T) -> bool:
+        return self.adapter.is_closed(client)
+
+    def begin(self, client: T) -> None:
+        self.adapter.begin(client)
+        self.instrumentation.began(client)
+
+    def commit(self, client: T) -> None:
+        committed = False
+        try:
+            self.adapter.commit(client)
+            committed = True
+        finally:
+            self.instrumentation.ended(client, committed)
+
+    def rollback(self, client: T) -> None:
+        try:
+            self.adapter.rollback(client)
+        finally:
+            self.instrumentation.ended(client, False)
+
+    def savepoint(self, client: T) -> typing.Any:
+        savepoint = self.adapter.savepoint(client)
+        self.instrumentation.savepoint(client)
+        return savepoint
+
+    def release_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        self.adapter.release_savepoint(client, savepoint)
+        self.instrumentation.savepoint_ended(client, True)
+
+    def rollback_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        self.adapter.rollback_savepoint(client, savepoint)
+        self.instrumentation.savepoint_ended(client, False)
+
+
+class AsyncInstrumentedAdapter(_InstrumentedBase[T], typing.Generic[T]):
+    """Wraps an AsyncAdapter, recording how long clients are acquired, held and
+    in a transaction.
+
+    Works like `InstrumentedAdapter` for async adapters.
+    """
+
+    def __init__(self, adapter: typing.Any, instrumentation: Instrumentation) -> None:
+        """
+        Initialize a new AsyncInstrumentedAdapter.
+
+        Args:
+            adapter (AsyncAdapter[T]): The adapter to wrap.
+            instrumentation (Instrumentation): Where to record the timings.
+        """
+        super().__init__(adapter, instrumentation)
+
+    async def new(self) -> T:
+        start = self.instrumentation.clock()
+        client = await self.adapter.new()
+        self.instrumentation.acquired(client, start)
+        return client
+
+    async def release(self, client: T) -> None:
+        self.instrumentation.released(client)
+        await self.adapter.release(client)
+
+    async def is_closed(self, client: T) -> bool:
+        return await self.adapter.is_closed(client)
+
+    async def begin(self, client: T) -> None:
+        await self.adapter.begin(client)
+        self.instrumentation.began(client)
+
+    async def commit(self, client: T) -> None:
+        committed = False
+        try:
+            await self.adapter.commit(client)
+            committed = True
+        finally:
+            self.instrumentation.ended(client, committed)
+
+    async def rollback(self, client: T) -> None:
+        try:
+            await self.adapter.rollback(client)
+        finally:
+            self.instrumentation.ended(client, False)
+
+    async def savepoint(self, client: T) -> typing.Any:
+        savepoint = await self.adapter.savepoint(client)
+        self.instrumentation.savepoint(client)
+        return savepoint
+
+    async def release_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        await self.adapter.release_savepoint(client, savepoint)
+        self.instrumentation.savepoint_ended(client, True)
+
+    async def rollback_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        await self.adapter.rollback_savepoint(client, savepoint)
+        self.instrumentation.savepoint_ended(client, False)
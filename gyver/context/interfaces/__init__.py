@@ -1,4 +1,6 @@
 from .adapter import Adapter
 from .adapter import AsyncAdapter
+from .adapter import SavepointAdapter
+from .adapter import SavepointAsyncAdapter
 
-__all__ = ["Adapter", "AsyncAdapter"]
+__all__ = ["Adapter", "AsyncAdapter", "SavepointAdapter", "SavepointAsyncAdapter"]
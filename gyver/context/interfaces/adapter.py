@@ -71,3 +71,35 @@ class AtomicAsyncAdapter(AsyncAdapter[T], typing.Protocol[T]):
     async def in_atomic(self, client: T) -> bool:
         """Returns whether the client is currently in an atomic operation."""
         ...
+
+
+class SavepointAdapter(AtomicAdapter[T], typing.Protocol[T]):
+    """Represents an AtomicAdapter that can nest atomic operations with savepoints."""
+
+    def savepoint(self, client: T) -> typing.Any:
+        """Creates a savepoint and returns its identifier."""
+        ...
+
+    def release_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        """Keeps the changes made since the savepoint."""
+        ...
+
+    def rollback_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        """Discards the changes made since the savepoint."""
+        ...
+
+
+class SavepointAsyncAdapter(AtomicAsyncAdapter[T], typing.Protocol[T]):
+    """Represents an AtomicAsyncAdapter that can nest atomic operations with savepoints."""
+
+    async def savepoint(self, client: T) -> typing.Any:
+        """Creates a savepoint and returns its identifier."""
+        ...
+
+    async def release_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        """Keeps the changes made since the savepoint."""
+        ...
+
+    async def rollback_savepoint(self, client: T, savepoint: typing.Any) -> None:
+        """Discards the changes made since the savepoint."""
+        ...
@@ -0,0 +1,94 @@
+import typing
+from collections.abc import Callable, Coroutine
+
+from gyver.pools import AsyncPool, ThreadPool
+
+from .typedef import T
+
+
+def _never_closed(client: typing.Any) -> bool:
+    return False
+
+
+async def _never_closed_async(client: typing.Any) -> bool:
+    return False
+
+
+class PoolAdapter(typing.Generic[T]):
+    """An Adapter that borrows clients from a ThreadPool instead of creating them.
+
+    `new` acquires a client from the pool and `release` returns it, so
+    contexts reuse connections across scopes. Clients for which `is_broken`
+    returns True are discarded from the pool and replaced by new ones.
+    """
+
+    def __init__(
+        self,
+        pool: ThreadPool[T],
+        is_broken: Callable[[T], bool] = _never_closed,
+    ) -> None:
+        """
+        Initialize a new PoolAdapter.
+
+        Args:
+            pool (ThreadPool[T]): The pool clients are borrowed from.
+            is_broken (Callable[[T], bool]): Returns whether a client is closed or broken.
+                Defaults to treating every client as alive.
+        """
+        self.pool = pool
+        self.is_broken = is_broken
+
+    def is_closed(self, client: T) -> bool:
+        """Returns whether the client is broken, discarding it from the pool if so."""
+        if not self.is_broken(client):
+            return False
+        self.pool.discard(client)
+        return True
+
+    def release(self, client: T) -> None:
+        """Returns the client to the pool."""
+        self.pool.release(client)
+
+    def new(self) -> T:
+        """Borrows a client from the pool."""
+        return self.pool.acquire()
+
+
+class AsyncPoolAdapter(typing.Generic[T]):
+    """An AsyncAdapter that borrows clients from an AsyncPool instead of creating them.
+
+    Works like `PoolAdapter` with an async pool and `is_broken` check.
+    """
+
+    def __init__(
+        self,
+        pool: AsyncPool[T],
+        is_broken: Callable[[T], Coroutine[typing.Any, typing.Any, bool]] = (
+            _never_closed_async
+        ),
+    ) -> None:
+        """
+        Initialize a new AsyncPoolAdapter.
+
+        Args:
+            pool (AsyncPool[T]): The pool clients are borrowed from.
+            is_broken (Callable[[T], Coroutine[Any, Any, bool]]): Returns whether a client
+                is closed or broken. Defaults to treating every client as alive.
+        """
+        self.pool = pool
+        self.is_broken = is_broken
+
+    async def is_closed(self, client: T) -> bool:
+        """Returns whether the client is broken, discarding it from the pool if so."""
+        if not await self.is_broken(client):
+            return False
+        await self.pool.discard(client)
+        return True
+
+    async def release(self, client: T) -> None:
+        """Returns the client to the pool."""
+        await self.pool.release(client)
+
+    async def new(self) -> T:
+        """Borrows a client from the pool."""
+        return await self.pool.acquire()
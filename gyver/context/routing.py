@@ -0,0 +1,243 @@
+import contextlib
+import itertools
+import threading
+import typing
+import weakref
+from collections.abc import Sequence
+from contextvars import ContextVar
+from contextvars import Token
+
+from .atomic_ import atomic
+from .context import AsyncContext
+from .context import Context
+from .typedef import T
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+Strategy = typing.Literal["round_robin", "least_loaded"]
+
+C = typing.TypeVar("C")
+
+
+class _Session:
+    __slots__ = ("wrote", "writing")
+
+    def __init__(self) -> None:
+        self.wrote = False
+        self.writing = 0
+
+
+# the session of each router in the current context, copied on write
+_sessions: ContextVar["weakref.WeakKeyDictionary[_Router, _Session] | None"] = (
+    ContextVar("gyver_routing_sessions", default=None)
+)
+
+
+class _Router(typing.Generic[C]):
+    def __init__(
+        self, primary: C, replicas: Sequence[C], strategy: Strategy = ROUND_ROBIN
+    ) -> None:
+        if strategy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(f"Unknown routing strategy {strategy!r}")
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.strategy = strategy
+        self._counter = itertools.count()
+        self._load = [0] * len(self.replicas)
+        self._load_lock = threading.Lock()
+
+    def _get_session(self) -> _Session | None:
+        sessions = _sessions.get()
+        return None if sessions is None else sessions.get(self)
+
+    def _set_session(self, session: _Session) -> Token:
+        sessions = weakref.WeakKeyDictionary(_sessions.get() or {})
+        sessions[self] = session
+        return _sessions.set(sessions)
+
+    @contextlib.contextmanager
+    def session(self):
+        """
+        A context manager delimiting a unit of work, e.g., a request.
+
+        Once the session writes to the primary, every read inside it is also
+        sent to the primary, so it sees its own writes despite replication lag.
+        Nested sessions join the enclosing one and share its stickiness.
+        """
+        if self._get_session() is not None:
+            yield
+            return
+        token = self._set_session(_Session())
+        try:
+            yield
+        finally:
+            _sessions.reset(token)
+
+    def is_sticky(self) -> bool:
+        """
+        Returns whether reads of the current session must go to the primary.
+        """
+        session = self._get_session()
+        return session is not None and (session.wrote or session.writing > 0)
+
+    def _pick(self) -> int | None:
+        if not self.replicas or self.is_sticky():
+            return None
+        if self.strategy == LEAST_LOADED:
+            with self._load_lock:
+                index = min(range(len(self._load)), key=self._load.__getitem__)
+                self._load[index] += 1
+            return index
+        index = next(self._counter) % len(self.replicas)
+        with self._load_lock:
+            self._load[index] += 1
+        return index
+
+    def _done(self, index: int) -> None:
+        with self._load_lock:
+            self._load[index] -= 1
+
+    @contextlib.contextmanager
+    def _writing(self):
+        session = self._get_session()
+        token = None
+        if session is None:
+            # reads inside a write see it even without a session
+            session = _Session()
+            token = self._set_session(session)
+        session.writing += 1
+        try:
+            yield
+        finally:
+            session.writing -= 1
+            session.wrote = True
+            if token is not None:
+                _sessions.reset(token)
+
+
+class RoutingContext(_Router[Context[T]], typing.Generic[T]):
+    """Routes read-only scopes to replicas and writes to the primary.
+
+    Reads are spread across the replicas either round-robin or to the one
+    with the fewest scopes open through this router. Reads inside a write
+    go to the primary and, inside a `session`, so does every read after the
+    first write.
+    """
+
+    def __init__(
+        self,
+        primary: Context[T],
+        replicas: Sequence[Context[T]],
+        strategy: Strategy = ROUND_ROBIN,
+    ) -> None:
+        """
+        Initialize a new RoutingContext.
+
+        Args:
+            primary (Context[T]): The context for the writable backend.
+            replicas (Sequence[Context[T]]): The contexts for the read-only backends.
+                Reads go to the primary if empty.
+            strategy (str, optional): "round_robin" or "least_loaded". Defaults to "round_robin".
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        super().__init__(primary, replicas, strategy)
+
+    @contextlib.contextmanager
+    def begin(self):
+        """
+        A context manager that yields a client for reads, from a replica if possible.
+        """
+        index = self._pick()
+        if index is None:
+            with self.primary.begin() as client:
+                yield client
+            return
+        try:
+            with self.replicas[index].begin() as client:
+                yield client
+        finally:
+            self._done(index)
+
+    @contextlib.contextmanager
+    def write(self):
+        """
+        A context manager that yields a client of the primary, making the session sticky.
+        """
+        with self._writing(), self.primary.begin() as client:
+            yield client
+
+    @contextlib.contextmanager
+    def atomic(self):
+        """
+        A context manager that yields a client of the primary inside a transaction,
+        making the session sticky.
+        """
+        with self._writing(), atomic(self.primary) as client:
+            yield client
+
+
+class AsyncRoutingContext(_Router[AsyncContext[T]], typing.Generic[T]):
+    """Routes read-only async scopes to replicas and writes to the primary.
+
+    Works like `RoutingContext` with async contexts. Sessions are bound to
+    the task that opened them, and inherited by the tasks it creates.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncContext[T],
+        replicas: Sequence[AsyncContext[T]],
+        strategy: Strategy = ROUND_ROBIN,
+    ) -> None:
+        """
+        Initialize a new AsyncRoutingContext.
+
+        Args:
+            primary (AsyncContext[T]): The context for the writable backend.
+            replicas (Sequence[AsyncContext[T]]): The contexts for the read-only backends.
+                Reads go to the primary if empty.
+            strategy (str, optional): "round_robin" or "least_loaded". Defaults to "round_robin".
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        super().__init__(primary, replicas, strategy)
+
+    @contextlib.asynccontextmanager
+    async def begin(self):
+        """
+        An async context manager that yields a client for reads, from a replica if possible.
+        """
+        index = self._pick()
+        if index is None:
+            async with self.primary.begin() as client:
+                yield client
+            return
+        try:
+            async with self.replicas[index].begin() as client:
+                yield client
+        finally:
+            self._done(index)
+
+    @contextlib.asynccontextmanager
+    async def write(self):
+        """
+        An async context manager that yields a client of the primary, making the
+        session sticky.
+        """
+        with self._writing():
+            async with self.primary.begin() as client:
+                yield client
+
+    @contextlib.asynccontextmanager
+    async def atomic(self):
+        """
+        An async context manager that yields a client of the primary inside a
+        transaction, making the session sticky.
+        """
+        with self._writing():
+            async with atomic(self.primary) as client:
+                yield client
@@ -0,0 +1,213 @@
+import asyncio
+import threading
+import time
+import typing
+import weakref
+from collections.abc import Callable
+
+from . import interfaces
+from .context import DEFAULT_CHECK_INTERVAL, AsyncContext, Context
+from .typedef import T
+
+# placeholder for the client of a lazy scope that has not used it yet
+_DEFERRED: typing.Any = object()
+
+
+class _ThreadState(threading.local):
+    client: typing.Any
+
+    def __init__(self) -> None:
+        self.stack = 0
+
+
+class _TaskState:
+    __slots__ = ("client", "stack", "checked_at")
+
+    def __init__(self, client: typing.Any, stack: int, checked_at: float) -> None:
+        self.client = client
+        self.stack = stack
+        self.checked_at = checked_at
+
+
+class ScopedContext(Context[T], typing.Generic[T]):
+    """A Context that gives each thread its own client and stack.
+
+    Meant for drivers whose clients are not thread safe and for threaded
+    servers, where sharing one client would serialize every request on the
+    lock. Nested scopes within a thread only bump the stack, without locking.
+    """
+
+    def __init__(self, adapter: interfaces.Adapter[T]) -> None:
+        """
+        Initialize a new ScopedContext.
+
+        Args:
+            adapter (interfaces.Adapter[T]): An adapter that will be used to acquire and release resources.
+        """
+        super().__init__(adapter)
+        self._local = _ThreadState()
+
+    @property
+    def client(self) -> T:
+        """
+        Returns the resource of the current thread, acquiring a new one if it has none.
+        """
+        state = self._local
+        try:
+            return state.client
+        except AttributeError:
+            state.client = self.adapter.new()
+            return state.client
+
+    @property
+    def stack(self) -> int:
+        """
+        Returns how many frames of the current thread are using this context.
+        """
+        return self._local.stack
+
+    def is_active(self) -> bool:
+        """
+        Returns whether the context is currently in use by the current thread.
+        """
+        return self._local.stack > 0
+
+    def acquire(self):
+        """
+        Acquires a resource for the current thread and increases its stack count.
+        """
+        state = self._local
+        if state.stack:
+            state.stack += 1
+            return self.client
+        if self.adapter.is_closed(self.client):
+            del state.client
+        client = self.client
+        state.stack = 1
+        return client
+
+    def _defer(self) -> None:
+        self._local.stack += 1
+
+    def release(self):
+        """
+        Releases the resource of the current thread if its stack count is 1,
+        and decreases the stack count.
+        """
+        state = self._local
+        if state.stack > 1:
+            state.stack -= 1
+            return
+        state.stack = 0
+        if hasattr(state, "client"):
+            client = state.client
+            del state.client
+            self.adapter.release(client)
+
+
+class AsyncScopedContext(AsyncContext[T], typing.Generic[T]):
+    """An AsyncContext that gives each task its own client and stack.
+
+    The client and stack are kept per task instead of being shared by every
+    task, so concurrent tasks never wait on each other and each one holds a
+    separate client, usually taken from a pool. Tasks created while a scope
+    is active start with an empty one instead of sharing the client of their
+    parent.
+    """
+
+    def __init__(
+        self,
+        adapter: interfaces.AsyncAdapter[T],
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a new AsyncScopedContext.
+
+        Args:
+            adapter (interfaces.AsyncAdapter[T]): An async adapter that will be used to acquire and release resources.
+            check_interval (float, optional): Minimum seconds between two `adapter.is_closed`
+                checks of the client of a task on acquire; a closed client is replaced by
+                a new one. Use 0 to check on every acquire. Defaults to 1.0.
+            clock (Callable[[], float], optional): Clock used to space the checks.
+        """
+        super().__init__(adapter, check_interval, clock)
+        # dropped along with their task, even if it never released its scope
+        self._tasks: weakref.WeakKeyDictionary[asyncio.Task, _TaskState] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _current(self) -> _TaskState | None:
+        return self._tasks.get(asyncio.current_task())  # type: ignore
+
+    @property
+    def stack(self) -> int:
+        """
+        Returns how many frames of the current task are using this context.
+        """
+        state = self._current()
+        return 0 if state is None else state.stack
+
+    def is_active(self) -> bool:
+        """
+        Returns whether the context is currently in use by the current task.
+        """
+        return self.stack > 0
+
+    async def client(self) -> T:
+        """
+        Returns the resource of the current task, acquiring a new one if it has none.
+        """
+        state = self._current()
+        if state is not None and state.client is not _DEFERRED:
+            return state.client
+        client = await self.adapter.new()
+        if state is None:
+            self._tasks[asyncio.current_task()] = _TaskState(client, 0, self._clock())  # type: ignore
+        else:
+            state.client = client
+            state.checked_at = self._clock()
+        return client
+
+    async def _live_client(self) -> T:
+        state = self._current()
+        if (
+            state is not None
+            and state.client is not _DEFERRED
+            and self._clock() - state.checked_at >= self.check_interval
+        ):
+            state.checked_at = self._clock()
+            if await self.adapter.is_closed(state.client):
+                state.client = _DEFERRED
+        return await self.client()
+
+    async def acquire(self):
+        """
+        Acquires a resource for the current task and increases its stack count,
+        replacing the current one if it was found closed.
+        """
+        client = await self._live_client()
+        self._current().stack += 1  # type: ignore
+        return client
+
+    async def _defer(self) -> None:
+        state = self._current()
+        if state is None:
+            self._tasks[asyncio.current_task()] = _TaskState(_DEFERRED, 1, 0.0)  # type: ignore
+            return
+        state.stack += 1
+
+    async def release(self):
+        """
+        Releases the resource of the current task if its stack count is 1,
+        and decreases the stack count.
+        """
+        state = self._current()
+        if state is None:
+            return
+        if state.stack > 1:
+            state.stack -= 1
+            return
+        del self._tasks[asyncio.current_task()]  # type: ignore
+        if state.client is not _DEFERRED:
+            await self.adapter.release(state.client)
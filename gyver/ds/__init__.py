@@ -1,3 +1,70 @@
+from .backoff import (
+    BackoffPolicy,
+    ConstantBackoff,
+    DecorrelatedJitterBackoff,
+    ExponentialBackoff,
+)
+from .bulkhead import AsyncBulkhead, Bulkhead, with_bulkhead
+from .cache import LRUCache, TTLCache, hashable_key, make_cache_key
 from .circuit import CircuitBreaker, with_circuit_breaker
+from .deadline import (
+    Deadline,
+    check_deadline,
+    current_deadline,
+    deadline,
+    deadline_expired,
+    execute_with_deadline,
+    remaining_time,
+    wait_with_deadline,
+)
+from .hedge import Hedger, with_hedging
+from .limiter import (
+    AdaptiveLimiter,
+    AIMDLimit,
+    GradientLimit,
+    LimitAlgorithm,
+    with_limiter,
+)
+from .ratelimit import GCRA, KeyedRateLimiter, TokenBucket
+from .retry import Retry, RetryBudget, with_retry
+from .singleflight import AsyncSingleFlight, SingleFlight, with_single_flight
 
-__all__ = ["CircuitBreaker", "with_circuit_breaker"]
+__all__ = [
+    "CircuitBreaker",
+    "with_circuit_breaker",
+    "BackoffPolicy",
+    "ConstantBackoff",
+    "ExponentialBackoff",
+    "DecorrelatedJitterBackoff",
+    "AsyncBulkhead",
+    "Bulkhead",
+    "with_bulkhead",
+    "AdaptiveLimiter",
+    "LimitAlgorithm",
+    "AIMDLimit",
+    "GradientLimit",
+    "with_limiter",
+    "TokenBucket",
+    "GCRA",
+    "KeyedRateLimiter",
+    "LRUCache",
+    "Retry",
+    "RetryBudget",
+    "with_retry",
+    "Hedger",
+    "with_hedging",
+    "TTLCache",
+    "make_cache_key",
+    "hashable_key",
+    "Deadline",
+    "deadline",
+    "current_deadline",
+    "deadline_expired",
+    "check_deadline",
+    "remaining_time",
+    "execute_with_deadline",
+    "wait_with_deadline",
+    "AsyncSingleFlight",
+    "SingleFlight",
+    "with_single_flight",
+]
@@ -0,0 +1,80 @@
+import random
+from typing import Protocol
+
+from gyver.attrs import define
+
+DEFAULT_BASE = 1  # seconds
+DEFAULT_CAP = 60  # seconds
+
+
+class BackoffPolicy(Protocol):
+    """Computes how long to wait before the next attempt."""
+
+    def compute(self, attempt: int, previous: float) -> float:
+        """Returns the delay, in seconds, for the given attempt.
+
+        Args:
+            attempt (int): Zero-based number of consecutive failures so far.
+            previous (float): The delay returned for the previous attempt,
+                or 0 if there was none.
+        """
+        ...
+
+
+@define
+class ConstantBackoff:
+    """Always waits the same amount of time.
+
+    Attributes:
+        delay (float): The delay in seconds.
+    """
+
+    delay: float = DEFAULT_BASE
+
+    def compute(self, attempt: int, previous: float) -> float:
+        return self.delay
+
+
+@define
+class ExponentialBackoff:
+    """Doubles (or multiplies by `factor`) the delay on every attempt, up to `cap`.
+
+    Attributes:
+        base (float): The delay for the first attempt.
+        factor (float): The multiplier applied on every attempt.
+        cap (float): The maximum delay.
+        jitter (bool): If True, returns a random delay between 0 and the
+            computed one ("full jitter"), spreading retries from many callers.
+    """
+
+    base: float = DEFAULT_BASE
+    factor: float = 2
+    cap: float = DEFAULT_CAP
+    jitter: bool = False
+
+    def compute(self, attempt: int, previous: float) -> float:
+        try:
+            delay = min(self.cap, self.base * self.factor**attempt)
+        except OverflowError:
+            delay = self.cap
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+@define
+class DecorrelatedJitterBackoff:
+    """Picks a random delay between `base` and three times the previous delay.
+
+    Grows roughly exponentially, but callers that failed at the same time
+    drift apart instead of waking up together.
+
+    Attributes:
+        base (float): The minimum delay.
+        cap (float): The maximum delay.
+    """
+
+    base: float = DEFAULT_BASE
+    cap: float = DEFAULT_CAP
+
+    def compute(self, attempt: int, previous: float) -> float:
+        upper = max(self.base, previous * 3)
+        return min(self.cap, random.uniform(self.base, upper))
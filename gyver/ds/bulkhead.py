@@ -0,0 +1,263 @@
+import asyncio
+import contextlib
+import threading
+from collections import deque
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar, overload
+
+from gyver.attrs import mutable, private
+from gyver.exc import BulkheadFull, DeadlineExceeded
+from gyver.utils import panic
+
+from .deadline import remaining_time
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+DEFAULT_MAX_CONCURRENT = 10
+DEFAULT_MAX_QUEUE = 100
+
+
+def _wait_timed_out(queue_timeout: float | None, timeout: float | None) -> Exception:
+    if queue_timeout is None or (timeout is not None and timeout < queue_timeout):
+        # the wait was cut short by the deadline: the caller ran out of time
+        return panic(DeadlineExceeded, "Deadline expired waiting for a bulkhead slot")
+    return panic(BulkheadFull, "Timed out waiting for a bulkhead slot")
+
+
+@mutable
+class AsyncBulkhead:
+    """Limits how many async calls to a dependency can run at the same time.
+
+    Calls above `max_concurrent` wait in a FIFO queue of at most `max_queue`
+    entries. Calls that find the queue full, or that wait longer than
+    `queue_timeout`, fail with `BulkheadFull` without running.
+
+    Attributes:
+        max_concurrent (int): Maximum number of calls running at the same time.
+        max_queue (int): Maximum number of calls waiting for a slot.
+        queue_timeout (float | None): Maximum time, in seconds, a call waits for a slot.
+        _active (int): Number of calls currently holding a slot.
+        _waiters (deque[asyncio.Future]): Futures of calls waiting for a slot.
+    """
+
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT
+    max_queue: int = DEFAULT_MAX_QUEUE
+    queue_timeout: float | None = None
+    _active: int = private(initial=0)
+    _waiters: deque[asyncio.Future] = private(initial_factory=deque)
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Takes a slot, waiting in the queue if none is available.
+
+        Waiting is also bounded by the deadline of the current context.
+
+        Raises:
+            BulkheadFull: If the queue is full or the wait timed out.
+            DeadlineExceeded: If the deadline expired before or while waiting.
+        """
+        timeout = remaining_time(self.queue_timeout)
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise panic(BulkheadFull, "Bulkhead queue is full")
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                # the slot was handed over right before the wait was aborted
+                self.release()
+            else:
+                future.cancel()
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(future)
+            if isinstance(e, asyncio.TimeoutError):
+                raise _wait_timed_out(self.queue_timeout, timeout) from None
+            raise
+
+    def release(self) -> None:
+        """Frees a slot, handing it directly to the next waiter if there is one."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    async def execute(
+        self,
+        func: Callable[P, Coroutine[Any, Any, T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Executes the provided function once a slot is available.
+
+        Args:
+            func (Callable[P, Coroutine[Any, Any, T]]): The async function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            T: The result of the function execution.
+
+        Raises:
+            BulkheadFull: If no slot could be taken.
+        """
+        async with self:
+            return await func(*args, **kwargs)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *_):
+        self.release()
+
+
+@mutable
+class Bulkhead:
+    """Limits how many calls to a dependency can run at the same time across threads.
+
+    Works like `AsyncBulkhead`, blocking the calling thread while it waits
+    for a slot.
+
+    Attributes:
+        max_concurrent (int): Maximum number of calls running at the same time.
+        max_queue (int): Maximum number of calls waiting for a slot.
+        queue_timeout (float | None): Maximum time, in seconds, a call waits for a slot.
+        _active (int): Number of calls currently holding a slot.
+        _waiting (int): Number of calls waiting for a slot.
+        _condition (threading.Condition): Condition used to wake up waiting threads.
+    """
+
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT
+    max_queue: int = DEFAULT_MAX_QUEUE
+    queue_timeout: float | None = None
+    _active: int = private(initial=0)
+    _waiting: int = private(initial=0)
+    _condition: threading.Condition = private(initial_factory=threading.Condition)
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return self._waiting
+
+    def acquire(self) -> None:
+        """Takes a slot, blocking in the queue if none is available.
+
+        Waiting is also bounded by the deadline of the current context.
+
+        Raises:
+            BulkheadFull: If the queue is full or the wait timed out.
+            DeadlineExceeded: If the deadline expired before or while waiting.
+        """
+        timeout = remaining_time(self.queue_timeout)
+        with self._condition:
+            if self._active < self.max_concurrent and not self._waiting:
+                self._active += 1
+                return
+            if self._waiting >= self.max_queue:
+                raise panic(BulkheadFull, "Bulkhead queue is full")
+            self._waiting += 1
+            try:
+                acquired = self._condition.wait_for(
+                    lambda: self._active < self.max_concurrent,
+                    timeout,
+                )
+            finally:
+                self._waiting -= 1
+            if not acquired:
+                raise _wait_timed_out(self.queue_timeout, timeout)
+            self._active += 1
+
+    def release(self) -> None:
+        """Frees a slot and wakes up one waiting thread."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    def execute(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Executes the provided function once a slot is available.
+
+        Args:
+            func (Callable[P, T]): The function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            T: The result of the function execution.
+
+        Raises:
+            BulkheadFull: If no slot could be taken.
+        """
+        with self:
+            return func(*args, **kwargs)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *_):
+        self.release()
+
+
+@overload
+def with_bulkhead(
+    bulkhead: AsyncBulkhead,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]
+]: ...
+
+
+@overload
+def with_bulkhead(
+    bulkhead: Bulkhead,
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+
+
+def with_bulkhead(bulkhead: AsyncBulkhead | Bulkhead) -> Callable[..., Any]:
+    """Decorator that applies a bulkhead to a function.
+
+    Async bulkheads expect async functions and sync bulkheads expect sync
+    functions. Stacks with `with_circuit_breaker` to keep slow calls from
+    piling up while the circuit is still closed.
+
+    Args:
+        bulkhead (AsyncBulkhead | Bulkhead): The bulkhead instance to use.
+
+    Returns:
+        Callable: A decorator that wraps the function with the bulkhead.
+    """
+
+    def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
+        if isinstance(bulkhead, AsyncBulkhead):
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                return await bulkhead.execute(func, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            return bulkhead.execute(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,165 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar, overload
+
+from gyver.attrs import call_init, mutable, private
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+D = TypeVar("D")
+
+DEFAULT_MAXSIZE = 1024
+# returned in place of a value that does not exist
+MISSING: Any = object()
+
+
+def make_cache_key(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Hashable:
+    """Builds a cache key from the function and the arguments of a call.
+
+    Args:
+        func (Callable[..., Any]): The function being called.
+        args (tuple[Any, ...]): Positional arguments of the call.
+        kwargs (dict[str, Any]): Keyword arguments of the call.
+
+    Returns:
+        Hashable: The key, which raises TypeError on hashing if an argument is unhashable.
+    """
+    return func, args, frozenset(kwargs.items())
+
+
+def hashable_key(
+    key: Callable[..., Hashable],
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Builds the key of a call with `key`, e.g., `make_cache_key`.
+
+    Args:
+        key (Callable): Builds the key from the function and the arguments of a call.
+        func (Callable[..., Any]): The function being called.
+        args (tuple[Any, ...]): Positional arguments of the call.
+        kwargs (dict[str, Any]): Keyword arguments of the call.
+
+    Returns:
+        Any: The key, or MISSING if it cannot be hashed.
+    """
+    try:
+        value = key(func, args, kwargs)
+        hash(value)
+    except TypeError:
+        return MISSING
+    return value
+
+
+@mutable
+class LRUCache(Generic[K, V]):
+    """A mapping bounded to `maxsize` entries that evicts the least recently used one.
+
+    Not thread safe, callers sharing it across threads must hold their own lock.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept.
+        _data (OrderedDict[K, V]): The entries, from least to most recently used.
+    """
+
+    maxsize: int = DEFAULT_MAXSIZE
+    _data: OrderedDict = private(initial_factory=OrderedDict)
+
+    @overload
+    def get(self, key: K) -> V | None: ...
+
+    @overload
+    def get(self, key: K, default: D) -> V | D: ...
+
+    def get(self, key: K, default: D | None = None) -> V | D | None:
+        """Returns the value for `key`, marking it as recently used."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def set(self, key: K, value: V) -> None:
+        """Stores `value`, evicting the least recently used entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: D | None = None) -> V | D | None:
+        """Removes `key` and returns its value, or `default` if missing."""
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@mutable
+class TTLCache(Generic[K, V]):
+    """An `LRUCache` whose entries also expire `ttl` seconds after being set.
+
+    Not thread safe, callers sharing it across threads must hold their own lock.
+
+    Attributes:
+        ttl (float): Seconds an entry is kept after being set.
+        clock (Callable[[], float]): Monotonic clock in seconds.
+        _entries (LRUCache[K, tuple[float, V]]): The entries and when they expire.
+    """
+
+    ttl: float
+    clock: Callable[[], float]
+    _entries: LRUCache
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = DEFAULT_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        call_init(self, ttl=ttl, clock=clock, entries=LRUCache(maxsize))
+
+    @overload
+    def get(self, key: K) -> V | None: ...
+
+    @overload
+    def get(self, key: K, default: D) -> V | D: ...
+
+    def get(self, key: K, default: D | None = None) -> V | D | None:
+        """Returns the value for `key` if it did not expire yet."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            self._entries.pop(key)
+            return default
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Stores `value` for the next `ttl` seconds."""
+        self._entries.set(key, (self.clock() + self.ttl, value))
+
+    def pop(self, key: K, default: D | None = None) -> V | D | None:
+        """Removes `key` and returns its value, or `default` if missing or expired."""
+        value = self.get(key, default)
+        self._entries.pop(key)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, MISSING) is not MISSING  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._entries)
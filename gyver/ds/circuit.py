@@ -1,10 +1,23 @@
 import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 from functools import partial, wraps
-from typing import Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 from gyver.attrs import mutable, private
+from gyver.exc import DeadlineExceeded
+
+from .backoff import BackoffPolicy, ConstantBackoff
+from .cache import MISSING, TTLCache, hashable_key, make_cache_key
+from .deadline import (
+    check_deadline,
+    deadline_expired,
+    execute_with_deadline,
+    wait_with_deadline,
+)
+
+if TYPE_CHECKING:
+    from .shared import SharedCircuitState
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -20,6 +33,7 @@ def _default_on_err(exc: Exception):
 
 
 DEFAULT_DELAY = 5  # seconds
+DEFAULT_OPEN_POLICY = ConstantBackoff(DEFAULT_DELAY)
 
 
 @mutable
@@ -29,18 +43,45 @@ class CircuitBreaker:
     Attributes:
         freeze_function (Callable[[], Coroutine]): The function to execute during the frozen state.
         on_error (Callable[[Exception], None]): The callback to execute when an error occurs.
+        open_policy (BackoffPolicy | None): If set, replaces `freeze_function` and computes
+            how long the circuit stays open based on how many times it tripped in a row.
+        reset_on_success (bool): Whether a successful call resets the trip count of `open_policy`.
+        fallback (Callable[..., Coroutine] | None): Called with the same arguments instead of
+            waiting while the circuit is open.
+        stale_cache (TTLCache | None): Keeps the last good result of each call, served
+            while the circuit is open before falling back or waiting.
+        cache_key (Callable): Builds the `stale_cache` key from the function and its arguments.
+        timeout (float | None): Maximum time, in seconds, for each call. Calls that exceed
+            it count as failures; calls cut short by the deadline of the current context
+            raise DeadlineExceeded without counting.
+        shared_state (SharedCircuitState | None): Shares trips and half-open probes with
+            other processes of the host. The open period must be known up front, so
+            `open_policy` is used, or a constant DEFAULT_DELAY, instead of `freeze_function`.
         _lock (asyncio.Lock): Lock to ensure thread safety when modifying state.
         _frozen (bool): Indicates whether the circuit breaker is currently frozen.
         _freeze_future (asyncio.Future | None): Future that represents when the circuit breaker will unfreeze.
+        _trips (int): How many times the circuit breaker froze since the last reset.
+        _last_delay (float): The last delay computed by `open_policy`.
     """
 
     freeze_function: Callable[[], Coroutine] = partial(
         asyncio.sleep, DEFAULT_DELAY
     )
     on_error: Callable[[Exception], None] = _default_on_err
+    open_policy: BackoffPolicy | None = None
+    reset_on_success: bool = True
+    fallback: Callable[..., Coroutine] | None = None
+    stale_cache: TTLCache | None = None
+    cache_key: Callable[
+        [Callable[..., Any], tuple[Any, ...], dict[str, Any]], Hashable
+    ] = make_cache_key
+    shared_state: "SharedCircuitState | None" = None
+    timeout: float | None = None
     _lock: asyncio.Lock = private(initial_factory=asyncio.Lock)
     _frozen: bool = private(initial=False)
     _freeze_future: asyncio.Future | None = private(initial=None)
+    _trips: int = private(initial=0)
+    _last_delay: float = private(initial=0)
 
     async def execute(
         self,
@@ -50,8 +91,11 @@ class CircuitBreaker:
     ) -> T:
         """Executes the provided function with circuit breaker logic.
 
-        If the circuit breaker is frozen, waits for it to unfreeze before retrying execution.
-        If an exception occurs, triggers the freezing mechanism.
+        If the circuit breaker is frozen, serves the last good result from `stale_cache`
+        or the result of `fallback` if available, otherwise waits for it to unfreeze
+        before retrying execution. If an exception occurs, triggers the freezing mechanism.
+        Calls run within `timeout` and the deadline of the current context, and are
+        rejected without tripping the circuit if that deadline already expired.
 
         Args:
             func (Callable[P, Coroutine[Any, Any, T]]): The async function to execute.
@@ -62,31 +106,125 @@ class CircuitBreaker:
             T: The result of the function execution.
 
         Raises:
+            DeadlineExceeded: If the deadline expires before the call can run.
             Any exception that occurs during execution after the circuit breaker is unfrozen.
         """
+        check_deadline()
+        if (
+            not self._frozen
+            and self.shared_state is not None
+            and self.shared_state.claim()
+        ):
+            # another process opened the circuit
+            async with self._lock:
+                if not self._frozen:
+                    await self._freeze(None)
+
         if not self._frozen:
             try:
-                return await func(*args, **kwargs)
+                result = await execute_with_deadline(
+                    self.timeout, func, *args, **kwargs
+                )
             except Exception as e:
+                if isinstance(e, DeadlineExceeded) and deadline_expired():
+                    # the caller ran out of time, the dependency did not fail
+                    raise
                 self.on_error(e)
                 async with self._lock:
                     if not self._frozen:
                         await self._freeze(e)
+            else:
+                self._on_success(func, args, kwargs, result)
+                return result
+
+        served = await self._serve_open(func, args, kwargs)
+        if served is not MISSING:
+            return served
 
         if self._freeze_future is not None:
-            await self._freeze_future
+            await wait_with_deadline(self._freeze_future, None, shield=True)
 
-        return await func(*args, **kwargs)
+        result = await execute_with_deadline(self.timeout, func, *args, **kwargs)
+        self._on_success(func, args, kwargs, result)
+        return result
 
     @property
     def is_frozen(self):
         return self._frozen
 
-    async def _freeze(self, error: Exception) -> None:
+    @property
+    def trips(self) -> int:
+        """Returns how many times the circuit breaker froze since the last reset."""
+        return self._trips
+
+    def _on_success(
+        self,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        result: Any,
+    ) -> None:
+        if self.reset_on_success and self._trips:
+            self._trips = 0
+            self._last_delay = 0
+        if self.shared_state is not None:
+            self.shared_state.reset()
+        if (
+            self.stale_cache is not None
+            and (key := hashable_key(self.cache_key, func, args, kwargs)) is not MISSING
+        ):
+            self.stale_cache.set(key, result)
+
+    async def _serve_open(
+        self,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Returns a stale or fallback result while open, or MISSING if there is none."""
+        if (
+            self.stale_cache is not None
+            and (key := hashable_key(self.cache_key, func, args, kwargs)) is not MISSING
+        ):
+            cached = self.stale_cache.get(key, MISSING)
+            if cached is not MISSING:
+                return cached
+        if self.fallback is not None:
+            return await self.fallback(*args, **kwargs)
+        return MISSING
+
+    def _next_delay(self) -> float:
+        """Computes the next open period from `open_policy` and counts the trip."""
+        policy = self.open_policy or DEFAULT_OPEN_POLICY
+        delay = policy.compute(self._trips, self._last_delay)
+        self._trips += 1
+        self._last_delay = delay
+        return delay
+
+    async def _wait_open(self, publish: bool) -> None:
+        """Waits for the open period, using `open_policy` if available.
+
+        Args:
+            publish (bool): Whether this breaker tripped and must open `shared_state`.
+        """
+        if self.shared_state is not None:
+            if publish:
+                self.shared_state.trip(self._next_delay())
+            while wait := self.shared_state.claim():
+                await asyncio.sleep(wait)
+            return
+        if self.open_policy is None:
+            self._trips += 1
+            await self.freeze_function()
+            return
+        await asyncio.sleep(self._next_delay())
+
+    async def _freeze(self, error: Exception | None) -> None:
         """Freezes the circuit breaker for a predefined duration.
 
         Args:
-            error (Exception): The exception that caused the freeze.
+            error (Exception | None): The exception that caused the freeze, or None
+                if the circuit was opened by another process.
         """
         self._frozen = True
         loop = asyncio.get_running_loop()
@@ -95,7 +233,7 @@ class CircuitBreaker:
 
         async def unfreeze():
             try:
-                await self.freeze_function()
+                await self._wait_open(publish=error is not None)
                 self._frozen = False
                 frozen_future.set_result(None)
             except Exception as e:
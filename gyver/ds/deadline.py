@@ -0,0 +1,160 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Generator
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar
+
+from gyver.attrs import define
+from gyver.exc import DeadlineExceeded
+from gyver.utils import panic
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+@define
+class Deadline:
+    """A point in time, on the monotonic clock, after which work is abandoned.
+
+    Attributes:
+        expires_at (float): The `time.monotonic` value when the deadline expires.
+    """
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, timeout: float) -> "Deadline":
+        """Creates a deadline `timeout` seconds from now."""
+        return cls(time.monotonic() + timeout)
+
+    def remaining(self) -> float:
+        """Returns the seconds left, or 0 if expired."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at <= time.monotonic()
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar(
+    "gyver_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    """Returns the deadline of the current context, if any."""
+    return _current_deadline.get()
+
+
+def deadline_expired() -> bool:
+    """Returns whether the deadline of the current context expired."""
+    current = _current_deadline.get()
+    return current is not None and current.expired
+
+
+def check_deadline() -> None:
+    """Raises DeadlineExceeded if the deadline of the current context expired."""
+    if deadline_expired():
+        raise panic(DeadlineExceeded, "Deadline expired before the work started")
+
+
+def remaining_time(timeout: float | None = None) -> float | None:
+    """Returns the seconds left before the current deadline or `timeout`,
+    whichever comes first, or None if there is neither.
+
+    Raises:
+        DeadlineExceeded: If the current deadline already expired.
+    """
+    current = _current_deadline.get()
+    if current is None:
+        return timeout
+    remaining = current.remaining()
+    if not remaining:
+        raise panic(DeadlineExceeded, "Deadline expired before the work started")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+@contextlib.contextmanager
+def deadline(timeout: float | None) -> Generator[Deadline | None, None, None]:
+    """Sets the deadline of the current context to `timeout` seconds from now.
+
+    A surrounding deadline that expires sooner is kept, so nested scopes can
+    only shrink the time left. Tasks created inside the scope inherit it.
+
+    Args:
+        timeout (float | None): Seconds from now, or None to keep the current deadline.
+
+    Yields:
+        Deadline | None: The deadline in effect inside the scope.
+    """
+    current = _current_deadline.get()
+    if timeout is not None:
+        new = Deadline.after(timeout)
+        if current is None or new.expires_at < current.expires_at:
+            current = new
+    token = _current_deadline.set(current)
+    try:
+        yield current
+    finally:
+        _current_deadline.reset(token)
+
+
+async def wait_with_deadline(
+    awaitable: Awaitable[T], timeout: float | None, shield: bool = False
+) -> T:
+    """Waits for `awaitable` up to `timeout` and the current deadline.
+
+    Args:
+        awaitable (Awaitable[T]): What to wait for.
+        timeout (float | None): Maximum time to wait, in seconds.
+        shield (bool): Whether to keep the awaitable running if the time runs out,
+            otherwise it is cancelled.
+
+    Raises:
+        DeadlineExceeded: If the time ran out.
+    """
+    remaining = remaining_time(timeout)
+    if remaining is None:
+        return await awaitable
+    if shield:
+        awaitable = asyncio.shield(awaitable)
+    try:
+        return await asyncio.wait_for(awaitable, remaining)
+    except asyncio.TimeoutError:
+        raise panic(DeadlineExceeded, "Deadline expired while waiting") from None
+
+
+async def execute_with_deadline(
+    timeout: float | None,
+    func: Callable[P, Coroutine[Any, Any, T]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    """Executes the provided function within `timeout` and the current deadline.
+
+    The function runs inside the tighter of both deadlines, so nested calls
+    see the time left. Nothing runs if the current deadline already expired.
+
+    Args:
+        timeout (float | None): Maximum time, in seconds, for this call.
+        func (Callable[P, Coroutine[Any, Any, T]]): The async function to execute.
+        *args (P.args): Positional arguments to pass to the function.
+        **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+    Returns:
+        T: The result of the function execution.
+
+    Raises:
+        DeadlineExceeded: If the deadline expired before or during the call.
+    """
+    check_deadline()
+    with deadline(timeout) as current:
+        if current is None:
+            return await func(*args, **kwargs)
+        try:
+            return await asyncio.wait_for(func(*args, **kwargs), current.remaining())
+        except asyncio.TimeoutError:
+            if not current.expired:
+                raise
+            raise panic(DeadlineExceeded, "Deadline expired during the call") from None
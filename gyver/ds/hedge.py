@@ -0,0 +1,165 @@
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from gyver.attrs import call_init, mutable
+
+from .retry import RetryBudget
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+@mutable
+class Hedger:
+    """Sends a second attempt of slow async calls and keeps the first result.
+
+    Meant for idempotent reads against replicated backends: if the first
+    attempt has not finished after the hedge delay, a second one is started
+    and whichever succeeds first wins while the other is cancelled. The
+    delay is either fixed or the `quantile` of the recently observed
+    latencies, and hedges are capped to `max_ratio` of the calls so a slow
+    backend does not receive twice the load.
+
+    Attributes:
+        delay (float | None): Fixed hedge delay in seconds, or None to use the
+            measured latency quantile.
+        quantile (float): Latency quantile used as the hedge delay, e.g. 0.95.
+        default_delay (float): Delay used until `min_samples` latencies were observed.
+        min_samples (int): Samples required before using the measured quantile.
+        clock (Callable[[], float]): Monotonic clock used to measure latency.
+        _budget (RetryBudget): Caps hedges to a ratio of the calls.
+        _samples (deque[float]): The most recent latencies.
+        _measured (float | None): Cached quantile of `_samples`.
+        _pending_samples (int): Samples added since `_measured` was computed.
+        _hedged (int): How many hedges were sent.
+    """
+
+    delay: float | None
+    quantile: float
+    default_delay: float
+    min_samples: int
+    clock: Callable[[], float]
+    _budget: RetryBudget
+    _samples: deque[float]
+    _measured: float | None
+    _pending_samples: int
+    _hedged: int
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        quantile: float = 0.95,
+        max_ratio: float = 0.1,
+        window: int = 1000,
+        min_samples: int = 20,
+        default_delay: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        call_init(
+            self,
+            delay=delay,
+            quantile=quantile,
+            default_delay=default_delay,
+            min_samples=min_samples,
+            clock=clock,
+            budget=RetryBudget(ratio=max_ratio, min_per_second=0, clock=clock),
+            samples=deque(maxlen=window),
+            measured=None,
+            pending_samples=0,
+            hedged=0,
+        )
+
+    @property
+    def hedged(self) -> int:
+        """Returns how many hedges were sent."""
+        return self._hedged
+
+    @property
+    def hedge_delay(self) -> float:
+        """Returns how long to wait for the first attempt before hedging."""
+        if self.delay is not None:
+            return self.delay
+        if len(self._samples) < self.min_samples:
+            return self.default_delay
+        if self._measured is None or self._pending_samples >= self.min_samples:
+            ordered = sorted(self._samples)
+            index = min(len(ordered) - 1, math.ceil(self.quantile * len(ordered)) - 1)
+            self._measured = ordered[max(0, index)]
+            self._pending_samples = 0
+        return self._measured
+
+    def _record(self, latency: float) -> None:
+        self._samples.append(latency)
+        self._pending_samples += 1
+
+    async def execute(
+        self,
+        func: Callable[P, Coroutine[Any, Any, T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Executes the provided function, hedging it if it is slow.
+
+        Args:
+            func (Callable[P, Coroutine[Any, Any, T]]): The idempotent async function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            T: The result of the first attempt to succeed.
+
+        Raises:
+            The exception of the last attempt to fail, if all of them failed.
+        """
+        self._budget.deposit()
+        started = {asyncio.ensure_future(func(*args, **kwargs)): self.clock()}
+        pending = set(started)
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if not done and self._budget.try_withdraw():
+                self._hedged += 1
+                hedge = asyncio.ensure_future(func(*args, **kwargs))
+                started[hedge] = self.clock()
+                pending.add(hedge)
+            error: BaseException | None = None
+            while True:
+                for task in done:
+                    if (error := task.exception()) is None:
+                        self._record(self.clock() - started[task])
+                        return task.result()
+                if not pending:
+                    assert error is not None
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def with_hedging(hedger: Hedger):
+    """Decorator that applies a Hedger to an async function.
+
+    Args:
+        hedger (Hedger): The hedger instance to use.
+
+    Returns:
+        Callable[P, Coroutine[Any, Any, T]]: A wrapped function that hedges slow calls.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            return await hedger.execute(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
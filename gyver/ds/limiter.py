@@ -0,0 +1,224 @@
+import math
+import time
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, ParamSpec, Protocol, TypeVar
+
+from gyver.attrs import call_init, mutable, private
+from gyver.exc import LimitExceeded
+from gyver.utils import panic
+
+from .deadline import check_deadline
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+DEFAULT_INITIAL_LIMIT = 20
+DEFAULT_MAX_LIMIT = 200
+
+
+def _always(exc: Exception) -> bool:
+    return True
+
+
+class LimitAlgorithm(Protocol):
+    """Computes the next concurrency limit from a latency sample."""
+
+    initial_limit: int
+
+    def update(self, limit: float, rtt: float, inflight: int, dropped: bool) -> float:
+        """Returns the new limit.
+
+        Args:
+            limit (float): The current limit.
+            rtt (float): How long the sampled call took, in seconds.
+            inflight (int): How many calls were running when the sample started.
+            dropped (bool): Whether the sampled call failed or was considered overloaded.
+        """
+        ...
+
+
+@mutable
+class AIMDLimit:
+    """Additive increase, multiplicative decrease.
+
+    Grows the limit by one when calls succeed under load and shrinks it by
+    `backoff_ratio` when a call fails or is slower than `latency_threshold`.
+
+    Attributes:
+        initial_limit (int): The limit before any sample is taken.
+        min_limit (int): The lowest limit allowed.
+        max_limit (int): The highest limit allowed.
+        backoff_ratio (float): Multiplier applied to the limit on drops.
+        latency_threshold (float): Calls slower than this, in seconds, count as drops.
+    """
+
+    initial_limit: int = DEFAULT_INITIAL_LIMIT
+    min_limit: int = 1
+    max_limit: int = DEFAULT_MAX_LIMIT
+    backoff_ratio: float = 0.9
+    latency_threshold: float = 1
+
+    def update(self, limit: float, rtt: float, inflight: int, dropped: bool) -> float:
+        if dropped or rtt > self.latency_threshold:
+            return max(self.min_limit, limit * self.backoff_ratio)
+        if inflight * 2 >= limit:
+            return min(self.max_limit, limit + 1)
+        return limit
+
+
+@mutable
+class GradientLimit:
+    """Gradient based limit, comparing recent latency with a long-term average.
+
+    While the latency of a call stays close to the long-term average the
+    limit grows by roughly its square root; as calls slow down, the
+    gradient between both latencies shrinks the limit before errors happen.
+
+    Attributes:
+        initial_limit (int): The limit before any sample is taken.
+        min_limit (int): The lowest limit allowed.
+        max_limit (int): The highest limit allowed.
+        smoothing (float): How much of each new limit is applied, from 0 to 1.
+        tolerance (float): How much slower than the average a call can be before
+            the limit starts to shrink.
+        long_window (int): Number of samples averaged by the long-term latency.
+        _long_rtt (float): Exponential moving average of the latency.
+    """
+
+    initial_limit: int = DEFAULT_INITIAL_LIMIT
+    min_limit: int = 1
+    max_limit: int = DEFAULT_MAX_LIMIT
+    smoothing: float = 0.2
+    tolerance: float = 1.5
+    long_window: int = 600
+    _long_rtt: float = private(initial=0)
+
+    def update(self, limit: float, rtt: float, inflight: int, dropped: bool) -> float:
+        if not self._long_rtt:
+            self._long_rtt = rtt
+        else:
+            factor = 2 / (self.long_window + 1)
+            self._long_rtt = self._long_rtt * (1 - factor) + rtt * factor
+        if rtt and self._long_rtt / rtt > 2:
+            # recover faster when latency drops well below the average
+            self._long_rtt *= 0.95
+
+        if not dropped and inflight < limit / 2:
+            # not enough load to learn anything about the limit
+            return limit
+
+        gradient = 0.5
+        if not dropped and rtt:
+            gradient = max(0.5, min(1, self.tolerance * self._long_rtt / rtt))
+        new_limit = limit * gradient + math.sqrt(limit)
+        new_limit = limit * (1 - self.smoothing) + new_limit * self.smoothing
+        if dropped:
+            # the square root outgrows the halving at small limits
+            new_limit = min(new_limit, limit - 1)
+        return max(self.min_limit, min(self.max_limit, new_limit))
+
+
+@mutable
+class AdaptiveLimiter:
+    """Limits concurrent async calls with a limit learned from their latency.
+
+    Calls beyond the current limit fail immediately with `LimitExceeded`
+    instead of queueing, so callers can shed load or fall back.
+
+    Attributes:
+        algorithm (LimitAlgorithm): The algorithm used to compute the limit.
+        is_drop (Callable[[Exception], bool]): Whether an exception counts as a drop.
+        clock (Callable[[], float]): Monotonic clock used to measure latency.
+        _limit (float): The current limit.
+        _inflight (int): Number of calls currently running.
+    """
+
+    algorithm: LimitAlgorithm
+    is_drop: Callable[[Exception], bool]
+    clock: Callable[[], float]
+    _limit: float
+    _inflight: int
+
+    def __init__(
+        self,
+        algorithm: LimitAlgorithm | None = None,
+        is_drop: Callable[[Exception], bool] = _always,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        algorithm = algorithm or AIMDLimit()
+        call_init(
+            self,
+            algorithm=algorithm,
+            is_drop=is_drop,
+            clock=clock,
+            limit=algorithm.initial_limit,
+            inflight=0,
+        )
+
+    @property
+    def limit(self) -> int:
+        return max(1, int(self._limit))
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    async def execute(
+        self,
+        func: Callable[P, Coroutine[Any, Any, T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Executes the provided function if the limit allows it.
+
+        Args:
+            func (Callable[P, Coroutine[Any, Any, T]]): The async function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            T: The result of the function execution.
+
+        Raises:
+            LimitExceeded: If the limit was already reached.
+            DeadlineExceeded: If the deadline of the current context already expired.
+        """
+        check_deadline()
+        if self._inflight >= self.limit:
+            raise panic(LimitExceeded, "Concurrency limit reached", self.limit)
+        inflight = self._inflight = self._inflight + 1
+        dropped = False
+        start = self.clock()
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            dropped = self.is_drop(e)
+            raise
+        finally:
+            self._inflight -= 1
+            self._limit = self.algorithm.update(
+                self._limit, self.clock() - start, inflight, dropped
+            )
+
+
+def with_limiter(limiter: AdaptiveLimiter):
+    """Decorator that applies an AdaptiveLimiter to an async function.
+
+    Args:
+        limiter (AdaptiveLimiter): The limiter instance to use.
+
+    Returns:
+        Callable[P, Coroutine[Any, Any, T]]: A wrapped function that applies the limiter.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            return await limiter.execute(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
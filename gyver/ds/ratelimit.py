@@ -0,0 +1,257 @@
+import abc
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+from gyver.attrs import call_init, mutable
+from gyver.exc import DeadlineExceeded, InvalidParamValue, RateLimited
+from gyver.utils import panic
+
+from .cache import DEFAULT_MAXSIZE, LRUCache
+from .deadline import remaining_time
+
+L = TypeVar("L", "TokenBucket", "GCRA")
+
+
+class _RateLimiter(abc.ABC):
+    """Shared acquire logic for rate limiters that can tell how long to wait."""
+
+    __slots__ = ()
+
+    clock: Callable[[], float]
+
+    @abc.abstractmethod
+    def _reserve(self, tokens: int) -> float:
+        """Takes `tokens` if available and returns 0, otherwise returns
+        how many seconds to wait before trying again."""
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Takes `tokens` without waiting.
+
+        Returns:
+            bool: Whether the tokens were taken.
+        """
+        return not self._reserve(tokens)
+
+    def acquire(self, tokens: int = 1, timeout: float | None = None) -> None:
+        """Takes `tokens`, blocking the current thread until they are available.
+
+        Args:
+            tokens (int): How many tokens to take.
+            timeout (float | None): Maximum time to wait, in seconds, also bounded
+                by the deadline of the current context.
+
+        Raises:
+            RateLimited: If the tokens would not be available within `timeout`.
+            DeadlineExceeded: If the tokens would not be available before the deadline
+                of the current context, or it already expired.
+        """
+        limit = remaining_time(timeout)
+        deadline = None if limit is None else self.clock() + limit
+        while wait := self._reserve(tokens):
+            time.sleep(self._check_wait(wait, deadline, limit != timeout))
+
+    async def async_acquire(
+        self, tokens: int = 1, timeout: float | None = None
+    ) -> None:
+        """Takes `tokens`, waiting asynchronously until they are available.
+
+        Args:
+            tokens (int): How many tokens to take.
+            timeout (float | None): Maximum time to wait, in seconds, also bounded
+                by the deadline of the current context.
+
+        Raises:
+            RateLimited: If the tokens would not be available within `timeout`.
+            DeadlineExceeded: If the tokens would not be available before the deadline
+                of the current context, or it already expired.
+        """
+        limit = remaining_time(timeout)
+        deadline = None if limit is None else self.clock() + limit
+        while wait := self._reserve(tokens):
+            await asyncio.sleep(self._check_wait(wait, deadline, limit != timeout))
+
+    def _check_wait(
+        self, wait: float, deadline: float | None, by_deadline: bool
+    ) -> float:
+        if deadline is not None and self.clock() + wait > deadline:
+            if by_deadline:
+                # the caller runs out of time before the limiter lets it through
+                raise panic(
+                    DeadlineExceeded, "Deadline expires before the rate limit allows"
+                )
+            raise panic(RateLimited, "Rate limit exceeded", wait)
+        return wait
+
+
+@mutable
+class TokenBucket(_RateLimiter):
+    """Token bucket rate limiter.
+
+    Refills `rate` tokens per second up to `burst` tokens, so short bursts are
+    allowed as long as the average stays under `rate`. Thread safe.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        burst (int): Maximum number of tokens stored.
+        clock (Callable[[], float]): Monotonic clock in seconds.
+        _tokens (float): Tokens currently available.
+        _updated (float): When `_tokens` was last refilled.
+        _lock (threading.Lock): Lock guarding the state.
+    """
+
+    rate: float
+    burst: int
+    clock: Callable[[], float]
+    _tokens: float
+    _updated: float
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise panic(InvalidParamValue, "Rate and burst must be positive")
+        call_init(
+            self,
+            rate=rate,
+            burst=burst,
+            clock=clock,
+            tokens=burst,
+            updated=clock(),
+            lock=threading.Lock(),
+        )
+
+    @property
+    def tokens(self) -> float:
+        """Returns the tokens available right now."""
+        with self._lock:
+            self._refill(self.clock())
+            return self._tokens
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _reserve(self, tokens: int) -> float:
+        if tokens > self.burst:
+            raise panic(InvalidParamValue, "Cannot take more tokens than burst", tokens)
+        with self._lock:
+            self._refill(self.clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+
+@mutable
+class GCRA(_RateLimiter):
+    """Generic cell rate algorithm limiter.
+
+    Behaves like a sliding window of `burst` requests every `burst / rate`
+    seconds while storing a single timestamp, the theoretical arrival time
+    of the next request. Thread safe.
+
+    Attributes:
+        rate (float): Requests allowed per second.
+        burst (int): Requests that can be made at once.
+        clock (Callable[[], float]): Monotonic clock in seconds.
+        _interval (float): Seconds between requests at the steady rate.
+        _tat (float): Theoretical arrival time of the next request.
+        _lock (threading.Lock): Lock guarding the state.
+    """
+
+    rate: float
+    burst: int
+    clock: Callable[[], float]
+    _interval: float
+    _tat: float
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise panic(InvalidParamValue, "Rate and burst must be positive")
+        call_init(
+            self,
+            rate=rate,
+            burst=burst,
+            clock=clock,
+            interval=1 / rate,
+            tat=0,
+            lock=threading.Lock(),
+        )
+
+    def _reserve(self, tokens: int) -> float:
+        if tokens > self.burst:
+            raise panic(InvalidParamValue, "Cannot take more tokens than burst", tokens)
+        with self._lock:
+            now = self.clock()
+            new_tat = max(self._tat, now) + self._interval * tokens
+            allowed_at = new_tat - self._interval * self.burst
+            if allowed_at <= now:
+                self._tat = new_tat
+                return 0
+            return allowed_at - now
+
+
+@mutable
+class KeyedRateLimiter(Generic[L]):
+    """Keeps one rate limiter per key, such as a client id or an IP address.
+
+    Only the `max_keys` most recently used keys are kept; an evicted key
+    starts over with a fresh limiter the next time it is seen.
+
+    Attributes:
+        factory (Callable[[], L]): Creates the limiter for a new key.
+        _limiters (LRUCache[Hashable, L]): The limiters by key.
+        _lock (threading.Lock): Lock guarding `_limiters`.
+    """
+
+    factory: Callable[[], L]
+    _limiters: LRUCache[Hashable, L]
+    _lock: threading.Lock
+
+    def __init__(self, factory: Callable[[], L], max_keys: int = DEFAULT_MAXSIZE):
+        call_init(
+            self,
+            factory=factory,
+            limiters=LRUCache(max_keys),
+            lock=threading.Lock(),
+        )
+
+    def get(self, key: Hashable) -> L:
+        """Returns the limiter for `key`, creating it if needed."""
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self.factory()
+                self._limiters.set(key, limiter)
+            return limiter
+
+    def try_acquire(self, key: Hashable, tokens: int = 1) -> bool:
+        return self.get(key).try_acquire(tokens)
+
+    def acquire(
+        self, key: Hashable, tokens: int = 1, timeout: float | None = None
+    ) -> None:
+        self.get(key).acquire(tokens, timeout)
+
+    async def async_acquire(
+        self, key: Hashable, tokens: int = 1, timeout: float | None = None
+    ) -> None:
+        await self.get(key).async_acquire(tokens, timeout)
+
+    def __len__(self) -> int:
+        return len(self._limiters)
@@ -0,0 +1,253 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from gyver.attrs import call_init, mutable
+from gyver.exc import DeadlineExceeded
+
+from .backoff import BackoffPolicy, ExponentialBackoff
+from .circuit import CircuitBreaker
+from .deadline import (
+    check_deadline,
+    deadline,
+    execute_with_deadline,
+    remaining_time,
+)
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+DEFAULT_BACKOFF = ExponentialBackoff(base=0.1, cap=5, jitter=True)
+
+
+def _retry_any(exc: Exception) -> bool:
+    return True
+
+
+@mutable
+class _WindowCounter:
+    """Counts events over the last `window` seconds using one bucket per second."""
+
+    window: int
+    clock: Callable[[], float]
+    _buckets: deque[list[int]]
+    _total: int
+
+    def __init__(self, window: int, clock: Callable[[], float]) -> None:
+        call_init(self, window=window, clock=clock, buckets=deque(), total=0)
+
+    def _expire(self, now: int) -> None:
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            self._total -= self._buckets.popleft()[1]
+
+    def add(self, count: int = 1) -> None:
+        now = math.floor(self.clock())
+        self._expire(now)
+        if self._buckets and self._buckets[-1][0] == now:
+            self._buckets[-1][1] += count
+        else:
+            self._buckets.append([now, count])
+        self._total += count
+
+    def total(self) -> int:
+        self._expire(math.floor(self.clock()))
+        return self._total
+
+
+@mutable
+class RetryBudget:
+    """Caps retries to a fraction of the calls made in the last `ttl` seconds.
+
+    Every call deposits into the budget and every retry withdraws from it,
+    so when a dependency fails for everyone retries stop at `ratio` of the
+    traffic instead of multiplying it. `min_per_second` keeps a small
+    allowance for services with little traffic. Thread safe.
+
+    Attributes:
+        ratio (float): Retries allowed per call, e.g. 0.2 for 20%.
+        min_per_second (float): Retries always allowed per second.
+        ttl (int): Window, in seconds, calls and retries are remembered for.
+        _deposits (_WindowCounter): Calls made within the window.
+        _withdrawals (_WindowCounter): Retries made within the window.
+        _lock (threading.Lock): Lock guarding the counters.
+    """
+
+    ratio: float
+    min_per_second: float
+    ttl: int
+    _deposits: _WindowCounter
+    _withdrawals: _WindowCounter
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 10,
+        ttl: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        call_init(
+            self,
+            ratio=ratio,
+            min_per_second=min_per_second,
+            ttl=ttl,
+            deposits=_WindowCounter(ttl, clock),
+            withdrawals=_WindowCounter(ttl, clock),
+            lock=threading.Lock(),
+        )
+
+    @property
+    def balance(self) -> float:
+        """Returns how many retries can still be made."""
+        with self._lock:
+            return self._balance()
+
+    def _balance(self) -> float:
+        return (
+            self.min_per_second * self.ttl
+            + self.ratio * self._deposits.total()
+            - self._withdrawals.total()
+        )
+
+    def deposit(self) -> None:
+        """Registers a call."""
+        with self._lock:
+            self._deposits.add()
+
+    def try_withdraw(self) -> bool:
+        """Registers a retry if the budget allows it.
+
+        Returns:
+            bool: Whether the retry can be made.
+        """
+        with self._lock:
+            if self._balance() < 1:
+                return False
+            self._withdrawals.add()
+            return True
+
+
+@mutable
+class Retry:
+    """Retries failed async calls with backoff.
+
+    Stops retrying when attempts run out, when `deadline` or the deadline of
+    the current context would be exceeded by the next delay, when the
+    exception is not retryable, when `budget` is exhausted or when
+    `circuit_breaker` is frozen. The last exception raised by the function
+    is re-raised in all of those cases.
+
+    Attributes:
+        max_attempts (int): Maximum number of calls, including the first one.
+        backoff (BackoffPolicy): Computes the delay before each retry.
+        deadline (float | None): Maximum time, in seconds, spent across all attempts.
+            Attempts run under it as the deadline of the current context, so nested
+            calls see the time left and an attempt that overruns it is abandoned.
+        retry_on (Callable[[Exception], bool]): Whether an exception can be retried.
+        budget (RetryBudget | None): Shared budget limiting retries across calls.
+        circuit_breaker (CircuitBreaker | None): Breaker guarding the same dependency;
+            no retries are made while it is frozen.
+        clock (Callable[[], float]): Monotonic clock used for the deadline.
+    """
+
+    max_attempts: int = 3
+    backoff: BackoffPolicy = DEFAULT_BACKOFF
+    deadline: float | None = None
+    retry_on: Callable[[Exception], bool] = _retry_any
+    budget: RetryBudget | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    clock: Callable[[], float] = time.monotonic
+
+    async def execute(
+        self,
+        func: Callable[P, Coroutine[Any, Any, T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Executes the provided function, retrying it on failure.
+
+        Args:
+            func (Callable[P, Coroutine[Any, Any, T]]): The async function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            T: The result of the first successful execution.
+
+        Raises:
+            DeadlineExceeded: If `deadline` or the deadline of the current context
+                expired before or during an attempt.
+            The last exception raised by the function if it cannot be retried.
+        """
+        check_deadline()
+        if self.budget is not None:
+            self.budget.deposit()
+        start = self.clock()
+        delay = 0.0
+        attempt = 0
+        with deadline(self.deadline):
+            while True:
+                try:
+                    return await execute_with_deadline(None, func, *args, **kwargs)
+                except Exception as e:
+                    next_delay = self._next_delay(e, attempt, delay, start)
+                    if next_delay is None:
+                        raise
+                    delay = next_delay
+                    await asyncio.sleep(delay)
+                    if self._circuit_open():
+                        raise
+                attempt += 1
+
+    def _circuit_open(self) -> bool:
+        return self.circuit_breaker is not None and self.circuit_breaker.is_frozen
+
+    def _next_delay(
+        self, exc: Exception, attempt: int, previous: float, start: float
+    ) -> float | None:
+        """Returns the delay before the next attempt or None if it should not happen."""
+        if attempt + 1 >= self.max_attempts or not self.retry_on(exc):
+            return None
+        if self._circuit_open():
+            return None
+        delay = self.backoff.compute(attempt, previous)
+        if self.deadline is not None and (
+            self.clock() + delay - start >= self.deadline
+        ):
+            return None
+        try:
+            remaining = remaining_time()
+        except DeadlineExceeded:
+            return None
+        if remaining is not None and delay >= remaining:
+            return None
+        if self.budget is not None and not self.budget.try_withdraw():
+            return None
+        return delay
+
+
+def with_retry(retry: Retry):
+    """Decorator that applies a Retry to an async function.
+
+    Args:
+        retry (Retry): The retry instance to use.
+
+    Returns:
+        Callable[P, Coroutine[Any, Any, T]]: A wrapped function that retries on failure.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            return await retry.execute(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
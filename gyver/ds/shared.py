@@ -0,0 +1,137 @@
+import contextlib
+import fcntl
+import mmap
+import os
+import secrets
+import struct
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from gyver.attrs import call_init, mutable
+
+# open_until, probe_until, trips, prober
+_LAYOUT = struct.Struct("<ddQQ")
+
+DEFAULT_PROBE_TIMEOUT = 5  # seconds
+
+
+@mutable
+class SharedCircuitState:
+    """Circuit breaker state shared by every process of a host through a memory-mapped file.
+
+    Stores when the circuit reopens, until when a half-open probe is running,
+    which handle holds it and how many times it tripped. Reads on the closed path do not lock;
+    every transition holds an exclusive `flock` on the file so it is atomic
+    across processes. Only available on POSIX systems.
+
+    Timestamps use `clock`, which must be shared by all processes; the
+    default `time.monotonic` is system-wide on Linux and macOS.
+
+    Attributes:
+        path (Path): The file backing the state; created if missing.
+        probe_timeout (float): How long other processes wait for a half-open
+            probe before one of them is allowed to probe again.
+        clock (Callable[[], float]): Clock used for the timestamps.
+        _fd (int): File descriptor of `path`.
+        _map (mmap.mmap): The memory-mapped state.
+        _token (int): Identifies this handle as the holder of the half-open probe.
+    """
+
+    path: Path
+    probe_timeout: float
+    clock: Callable[[], float]
+    _fd: int
+    _map: mmap.mmap
+    _token: int
+
+    def __init__(
+        self,
+        path: str | Path,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with _locked(fd):
+            if os.fstat(fd).st_size < _LAYOUT.size:
+                os.ftruncate(fd, _LAYOUT.size)
+        call_init(
+            self,
+            path=Path(path),
+            probe_timeout=probe_timeout,
+            clock=clock,
+            fd=fd,
+            map=mmap.mmap(fd, _LAYOUT.size),
+            token=secrets.randbits(63) + 1,
+        )
+
+    def _read(self) -> tuple[float, float, int, int]:
+        return _LAYOUT.unpack_from(self._map)
+
+    def _write(
+        self, open_until: float, probe_until: float, trips: int, prober: int = 0
+    ) -> None:
+        _LAYOUT.pack_into(self._map, 0, open_until, probe_until, trips, prober)
+
+    @property
+    def trips(self) -> int:
+        """Returns how many times the circuit tripped since it last closed."""
+        return self._read()[2]
+
+    def is_closed(self) -> bool:
+        """Returns whether no process reported a failure since the last success."""
+        return not self.trips
+
+    def trip(self, duration: float) -> None:
+        """Opens the circuit for every process for at least `duration` seconds."""
+        with _locked(self._fd):
+            open_until, _, trips, _ = self._read()
+            open_until = max(open_until, self.clock() + duration)
+            self._write(open_until, 0, trips + 1)
+
+    def claim(self) -> float:
+        """Checks whether the caller may call the dependency.
+
+        Returns 0 when the circuit is closed or when this handle holds the
+        half-open probe, otherwise how many seconds to wait before asking again.
+        """
+        if self.is_closed():
+            return 0
+        with _locked(self._fd):
+            open_until, probe_until, trips, prober = self._read()
+            now = self.clock()
+            if not trips:
+                return 0
+            if now < open_until:
+                return open_until - now
+            if now < probe_until:
+                return 0 if prober == self._token else probe_until - now
+            self._write(open_until, now + self.probe_timeout, trips, self._token)
+            return 0
+
+    def reset(self) -> None:
+        """Closes the circuit for every process.
+
+        Ignored while the circuit is still open, so calls that started before
+        another process tripped cannot close it early.
+        """
+        if self.is_closed():
+            return
+        with _locked(self._fd):
+            open_until, *_ = self._read()
+            if self.clock() >= open_until:
+                self._write(0, 0, 0)
+
+    def close(self) -> None:
+        """Unmaps and closes the backing file. The state itself is kept."""
+        self._map.close()
+        os.close(self._fd)
+
+
+@contextlib.contextmanager
+def _locked(fd: int):
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
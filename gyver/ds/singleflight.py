@@ -0,0 +1,264 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections.abc import Callable, Coroutine, Hashable
+from functools import partial, wraps
+from typing import Any, ParamSpec, TypeVar, overload
+
+from gyver.attrs import call_init, mutable
+from gyver.exc import DeadlineExceeded
+from gyver.utils import panic
+
+from .cache import DEFAULT_MAXSIZE, MISSING, TTLCache, hashable_key, make_cache_key
+from .deadline import remaining_time
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+@mutable
+class AsyncSingleFlight:
+    """Coalesces concurrent async calls sharing the same key into a single call.
+
+    The first caller for a key starts the call in a task and every caller
+    arriving while it runs awaits that same task, so a burst of misses on a
+    hot key reaches the dependency once. The task is shielded from the
+    cancellation of its callers and keeps running for the others.
+
+    Attributes:
+        max_keys (int): Maximum number of keys tracked at the same time; calls
+            beyond it run without being coalesced.
+        _calls (dict[Hashable, asyncio.Task]): The calls in flight, by key.
+        _results (TTLCache | None): Recent results, kept for `ttl` seconds if set.
+    """
+
+    max_keys: int
+    _calls: dict[Hashable, asyncio.Task]
+    _results: TTLCache | None
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_keys: int = DEFAULT_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        call_init(
+            self,
+            max_keys=max_keys,
+            calls={},
+            results=None if ttl is None else TTLCache(ttl, max_keys, clock),
+        )
+
+    @property
+    def inflight(self) -> int:
+        """Returns how many keys have a call in flight."""
+        return len(self._calls)
+
+    def forget(self, key: Hashable) -> None:
+        """Drops the cached result of `key`, so the next call runs again."""
+        if self._results is not None:
+            self._results.pop(key)
+
+    async def execute(
+        self,
+        key: Hashable,
+        func: Callable[P, Coroutine[Any, Any, T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Executes the provided function, or joins the call in flight for `key`.
+
+        Args:
+            key (Hashable): Identifies calls that can share a result.
+            func (Callable[P, Coroutine[Any, Any, T]]): The async function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            T: The result of the shared call.
+
+        Raises:
+            The exception raised by the shared call, to every caller.
+        """
+        if self._results is not None:
+            result = self._results.get(key, MISSING)
+            if result is not MISSING:
+                return result
+        task = self._calls.get(key)
+        if task is None:
+            if len(self._calls) >= self.max_keys:
+                return await func(*args, **kwargs)
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(partial(self._done, key))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        del self._calls[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._results is not None:
+            self._results.set(key, task.result())
+
+
+@mutable
+class SingleFlight:
+    """Coalesces concurrent calls sharing the same key across threads.
+
+    Works like `AsyncSingleFlight`, except the first caller runs the call in
+    its own thread while the others block until it finishes, bounded by the
+    deadline of their context.
+
+    Attributes:
+        max_keys (int): Maximum number of keys tracked at the same time; calls
+            beyond it run without being coalesced.
+        _calls (dict[Hashable, concurrent.futures.Future]): The calls in flight, by key.
+        _results (TTLCache | None): Recent results, kept for `ttl` seconds if set.
+        _lock (threading.Lock): Guards `_calls` and `_results`.
+    """
+
+    max_keys: int
+    _calls: dict[Hashable, concurrent.futures.Future]
+    _results: TTLCache | None
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_keys: int = DEFAULT_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        call_init(
+            self,
+            max_keys=max_keys,
+            calls={},
+            results=None if ttl is None else TTLCache(ttl, max_keys, clock),
+            lock=threading.Lock(),
+        )
+
+    @property
+    def inflight(self) -> int:
+        """Returns how many keys have a call in flight."""
+        return len(self._calls)
+
+    def forget(self, key: Hashable) -> None:
+        """Drops the cached result of `key`, so the next call runs again."""
+        if self._results is not None:
+            with self._lock:
+                self._results.pop(key)
+
+    def execute(
+        self, key: Hashable, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Executes the provided function, or waits for the call in flight for `key`.
+
+        Args:
+            key (Hashable): Identifies calls that can share a result.
+            func (Callable[P, T]): The function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            T: The result of the shared call.
+
+        Raises:
+            DeadlineExceeded: If the deadline expired while waiting for another thread.
+            The exception raised by the shared call, to every caller.
+        """
+        with self._lock:
+            if self._results is not None:
+                result = self._results.get(key, MISSING)
+                if result is not MISSING:
+                    return result
+            future = self._calls.get(key)
+            leader = future is None and len(self._calls) < self.max_keys
+            if leader:
+                future = self._calls[key] = concurrent.futures.Future()
+
+        if future is None:
+            return func(*args, **kwargs)
+        if not leader:
+            try:
+                return future.result(remaining_time())
+            except concurrent.futures.TimeoutError:
+                raise panic(
+                    DeadlineExceeded, "Deadline expired while waiting for the call"
+                ) from None
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._calls[key]
+            if self._results is not None:
+                self._results.set(key, result)
+        future.set_result(result)
+        return result
+
+
+@overload
+def with_single_flight(
+    flight: AsyncSingleFlight,
+    key: Callable[
+        [Callable[..., Any], tuple[Any, ...], dict[str, Any]], Hashable
+    ] = ...,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]
+]: ...
+
+
+@overload
+def with_single_flight(
+    flight: SingleFlight,
+    key: Callable[
+        [Callable[..., Any], tuple[Any, ...], dict[str, Any]], Hashable
+    ] = ...,
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+
+
+def with_single_flight(
+    flight: AsyncSingleFlight | SingleFlight,
+    key: Callable[
+        [Callable[..., Any], tuple[Any, ...], dict[str, Any]], Hashable
+    ] = make_cache_key,
+) -> Callable[..., Any]:
+    """Decorator that coalesces concurrent calls with the same arguments.
+
+    Async flights expect async functions and thread flights expect sync
+    functions. Calls whose key cannot be hashed run without being coalesced.
+
+    Args:
+        flight (AsyncSingleFlight | SingleFlight): The single-flight instance to use.
+        key (Callable): Builds the key from the function and the arguments of a call.
+
+    Returns:
+        Callable: A decorator that wraps the function with the single-flight.
+    """
+
+    def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
+        if isinstance(flight, AsyncSingleFlight):
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                value = hashable_key(key, func, args, kwargs)
+                if value is MISSING:
+                    return await func(*args, **kwargs)
+                return await flight.execute(value, func, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            value = hashable_key(key, func, args, kwargs)
+            if value is MISSING:
+                return func(*args, **kwargs)
+            return flight.execute(value, func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
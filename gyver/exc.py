@@ -81,3 +81,31 @@ class FailedFileOperation(GyverError):
 
 class MergeConflict(GyverError):
     """Raised when a merge conflict is detected, e.g., during the merge_dicts operation."""
+
+
+class Rejected(GyverError):
+    """Raised when work is refused before it starts, e.g., by a limiter."""
+
+
+class BulkheadFull(Rejected):
+    """Raised when a bulkhead has no free slot and its queue is full or timed out."""
+
+
+class LimitExceeded(Rejected):
+    """Raised when a concurrency limiter is already running as many calls as it allows."""
+
+
+class RateLimited(Rejected):
+    """Raised when a rate limiter cannot grant tokens within the allowed time."""
+
+
+class DeadlineExceeded(GyverError, TimeoutError):
+    """Raised when the deadline of a call expired before or while it ran."""
+
+
+class NoActiveTransaction(GyverError, RuntimeError):
+    """Raised when an operation requires an atomic scope but none is active."""
+
+
+class GroupCommitClosed(Rejected):
+    """Raised when a unit is submitted to a group commit that was closed."""
@@ -112,6 +112,30 @@ class AsyncPool(Generic[T]):
         self.resources.put_nowait(Resource.from_resource(resource))
         await self._increase_available()
 
+    async def discard(self, resource: T) -> None:
+        """Releases a resource that should not return to the queue, e.g.,
+        a broken connection, and puts a new one in its place, waking up
+        callers waiting in `acquire`.
+
+        :param resource: The resource to be discarded.
+        :return: None
+        """
+        try:
+            await self.releaser(resource)
+        finally:
+            await self._replace()
+
+    async def _replace(self) -> None:
+        """Puts a new resource in the queue in place of a discarded one."""
+        try:
+            replacement = await self._initialize_resource()
+        except Exception:
+            # frees the slot so that a later acquire creates the resource
+            await self._increase_available()
+            raise
+        self.resources.put_nowait(replacement)
+        await self._increase_available()
+
     async def prefill(self, count: int | None = None) -> None:
         """
         Prefills the queue by the amount passed.
@@ -78,6 +78,29 @@ class ThreadPool(Generic[T]):
         self.resources.put_nowait(Resource.from_resource(resource))
         self._increase_available()
 
+    def discard(self, resource: T) -> None:
+        """Releases a resource that should not return to the queue, e.g.,
+        a broken connection, and puts a new one in its place, waking up
+        callers waiting in `acquire`.
+
+        :param resource: The resource to be discarded.
+        :return: None
+        """
+        try:
+            self.releaser(resource)
+        finally:
+            self._replace()
+
+    def _replace(self) -> None:
+        try:
+            replacement = self._initialize_resource()
+        except Exception:
+            # frees the slot so that a later acquire creates the resource
+            self._increase_available()
+            raise
+        self.resources.put_nowait(replacement)
+        self._increase_available()
+
     def prefill(self, count: int | None = None) -> None:
         count = count or self._pool_size
         count = min(count, self._pool_size)
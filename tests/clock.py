@@ -0,0 +1,14 @@
+class FakeClock:
+    """A manual clock for the code that takes a `clock` callable.
+
+    Tests move it by setting `now`; a non-zero `step` also advances it on
+    every read.
+    """
+
+    def __init__(self, start: float = 0.0, step: float = 0.0) -> None:
+        self.now = start
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
@@ -6,6 +6,8 @@ class MockClient:
     def __init__(self) -> None:
         self._active = True
         self._count = 0
+        self.savepoints: list[str] = []
+        self.rolled_back: list[str] = []
 
     def toggle_active(self):
         self._active = not self._active
@@ -43,6 +45,9 @@ class MockClient:
 
 
 class MockAdapter(AtomicAdapter[MockClient]):
+    def __init__(self) -> None:
+        self.created = 0
+
     def is_closed(self, client: MockClient) -> bool:
         return client.closed
 
@@ -50,6 +55,7 @@ class MockAdapter(AtomicAdapter[MockClient]):
         return client.deactivate()
 
     def new(self) -> MockClient:
+        self.created += 1
         return MockClient()
 
     def begin(self, client: MockClient) -> None:
@@ -66,6 +72,9 @@ class MockAdapter(AtomicAdapter[MockClient]):
 
 
 class MockAsyncAdapter(AtomicAsyncAdapter[MockClient]):
+    def __init__(self) -> None:
+        self.created = 0
+
     async def is_closed(self, client: MockClient) -> bool:
         return client.closed
 
@@ -73,6 +82,7 @@ class MockAsyncAdapter(AtomicAsyncAdapter[MockClient]):
         client.deactivate()
 
     async def new(self) -> MockClient:
+        self.created += 1
         return MockClient()
 
     async def begin(self, client: MockClient) -> None:
@@ -86,3 +96,54 @@ class MockAsyncAdapter(AtomicAsyncAdapter[MockClient]):
 
     async def in_atomic(self, client: MockClient) -> bool:
         return client.count > 0
+
+
+class MockSavepointAdapter(MockAdapter):
+    def savepoint(self, client: MockClient) -> str:
+        name = f"sp{len(client.savepoints) + 1}"
+        client.savepoints.append(name)
+        return name
+
+    def release_savepoint(self, client: MockClient, savepoint: str) -> None:
+        assert client.savepoints.pop() == savepoint
+
+    def rollback_savepoint(self, client: MockClient, savepoint: str) -> None:
+        assert client.savepoints.pop() == savepoint
+        client.rolled_back.append(savepoint)
+
+
+class MockSavepointAsyncAdapter(MockAsyncAdapter):
+    async def savepoint(self, client: MockClient) -> str:
+        name = f"sp{len(client.savepoints) + 1}"
+        client.savepoints.append(name)
+        return name
+
+    async def release_savepoint(self, client: MockClient, savepoint: str) -> None:
+        assert client.savepoints.pop() == savepoint
+
+    async def rollback_savepoint(self, client: MockClient, savepoint: str) -> None:
+        assert client.savepoints.pop() == savepoint
+        client.rolled_back.append(savepoint)
+
+
+class RecordingMixin:
+    def __init__(self) -> None:
+        super().__init__()
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self, client: MockClient) -> None:
+        self.commits += 1
+        await super().commit(client)  # type: ignore
+
+    async def rollback(self, client: MockClient) -> None:
+        self.rollbacks += 1
+        await super().rollback(client)  # type: ignore
+
+
+class RecordingAdapter(RecordingMixin, MockAsyncAdapter):
+    pass
+
+
+class RecordingSavepointAdapter(RecordingMixin, MockSavepointAsyncAdapter):
+    pass
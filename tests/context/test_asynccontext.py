@@ -3,7 +3,18 @@ import contextlib
 
 from gyver.context import AsyncContext
 
-from .mocks import MockAsyncAdapter
+from ..clock import FakeClock
+from .mocks import MockAsyncAdapter, MockClient
+
+
+class CheckCountingAdapter(MockAsyncAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.checks = 0
+
+    async def is_closed(self, client: MockClient) -> bool:
+        self.checks += 1
+        return await super().is_closed(client)
 
 
 async def test_asynccontext_acquisition():
@@ -89,3 +100,115 @@ async def test_asynccontext_releases_resource_even_on_error():
 
     assert client.closed  # type: ignore
     assert context.stack == 0
+
+
+async def test_asynccontext_lazy_open_defers_client():
+    adapter = MockAsyncAdapter()
+    context = AsyncContext(adapter)
+    async with context.open(lazy=True):
+        assert context.stack == 1
+        assert adapter.created == 0
+    assert context.stack == 0
+    assert adapter.created == 0
+
+    async with context.open(lazy=True):
+        client = await context.client()
+        async with context.begin() as nested:
+            assert nested is client
+        assert not client.closed
+    assert adapter.created == 1
+    assert client.closed
+
+
+async def test_asynccontext_reentrant_acquire_skips_lock():
+    adapter = MockAsyncAdapter()
+    context = AsyncContext(adapter)
+    async with context.begin() as client:
+        async with context._lock:
+            # would deadlock if nested scopes of the owner waited on the lock
+            async with context.begin() as nested:
+                async with context.begin() as deeper:
+                    assert context.stack == 3
+            assert nested is client
+            assert deeper is client
+        assert context.stack == 1
+        assert not client.closed
+    assert context.stack == 0
+    assert client.closed
+
+
+async def test_asynccontext_reentrant_with_other_tasks():
+    adapter = MockAsyncAdapter()
+    context = AsyncContext(adapter)
+    entered = asyncio.Event()
+    leave = asyncio.Event()
+
+    async def other():
+        async with context.begin() as client:
+            entered.set()
+            await leave.wait()
+        return client
+
+    async with context.begin() as client:
+        task = asyncio.create_task(other())
+        await entered.wait()
+        assert context.stack == 2
+    assert context.stack == 1
+
+    async with context.begin() as again:
+        assert again is client
+        assert context.stack == 2
+    leave.set()
+    assert await task is client
+    assert context.stack == 0
+    assert client.closed
+    assert adapter.created == 1
+
+
+async def test_asynccontext_release_from_other_task_clears_owner():
+    adapter = MockAsyncAdapter()
+    context = AsyncContext(adapter)
+
+    client = await asyncio.create_task(context.acquire())
+    await asyncio.create_task(context.release())
+
+    assert context.stack == 0
+    assert context._owner is None
+    assert client.closed
+
+    async with context.begin():
+        assert context._owner is not None
+        assert context._owner[0] is asyncio.current_task()
+
+
+async def test_asynccontext_replaces_closed_client():
+    adapter = CheckCountingAdapter()
+    clock = FakeClock()
+    context = AsyncContext(adapter, check_interval=5, clock=clock)
+    async with context.begin() as client:
+        client.deactivate()
+        async with context.begin() as nested:
+            # checked recently, handed out without a round trip
+            assert nested is client
+        assert adapter.checks == 0
+
+        clock.now = 5
+        async with context.begin() as replaced:
+            assert replaced is not client
+            assert not replaced.closed
+            async with context.begin() as nested:
+                assert nested is replaced
+        assert adapter.checks == 1
+        assert adapter.created == 2
+    assert replaced.closed
+    assert context.stack == 0
+
+
+async def test_asynccontext_check_interval_zero_checks_every_acquire():
+    adapter = CheckCountingAdapter()
+    context = AsyncContext(adapter, check_interval=0)
+    async with context.begin() as client:
+        for _ in range(3):
+            async with context.begin() as nested:
+                assert nested is client
+    assert adapter.checks == 3
@@ -1,14 +1,23 @@
 import asyncio
+import contextlib
 import threading
 
+import pytest
+
 from gyver.context.atomic_ import AsyncAtomicContext
 from gyver.context.atomic_ import AtomicContext
 from gyver.context.atomic_ import atomic
+from gyver.context.atomic_.hooks import TransactionHooks
 from gyver.context.context import AsyncContext
 from gyver.context.context import Context
+from gyver.exc import ErrorGroup
+from gyver.exc import NoActiveTransaction
 
 from .mocks import MockAdapter
 from .mocks import MockAsyncAdapter
+from .mocks import MockClient
+from .mocks import MockSavepointAdapter
+from .mocks import MockSavepointAsyncAdapter
 
 
 def test_atomic_context_acquire_release():
@@ -113,3 +122,214 @@ async def test_bound_async_context_client_yields_the_same_client_in_context():
     async with context.begin() as ctx_client:
         async with bound_context.begin() as bnd_ctx_client:
             assert ctx_client is bnd_ctx_client
+
+
+def test_nested_atomic_uses_savepoints():
+    context = Context(MockSavepointAdapter())
+    with atomic(context) as client:
+        with contextlib.suppress(ValueError):
+            with atomic(context):
+                assert client.savepoints == ["sp1"]
+                raise ValueError
+        with atomic(context):
+            with atomic(context):
+                assert client.savepoints == ["sp1", "sp2"]
+        assert client.savepoints == []
+        assert client.rolled_back == ["sp1"]
+        assert client.count == 1
+    assert client.count == 0
+    assert client.closed
+
+
+def test_atomic_context_nested_acquire_uses_savepoints():
+    context = AtomicContext(MockSavepointAdapter())
+    client = context.acquire()
+    context.acquire()
+    assert client.savepoints == ["sp1"]
+    context.release(commit=False)
+    assert client.rolled_back == ["sp1"]
+    assert client.count == 1
+    context.release()
+    assert client.count == 0
+
+
+def test_bound_context_reentry_uses_savepoints():
+    context = Context(MockSavepointAdapter())
+    bound = atomic(context)
+    with bound as client:
+        with bound:
+            assert client.savepoints == ["sp1"]
+        assert context.stack == 1
+    assert context.stack == 0
+    assert client.count == 0
+
+
+async def test_nested_async_atomic_uses_savepoints():
+    context = AsyncContext(MockSavepointAsyncAdapter())
+    async with atomic(context) as client:
+        with contextlib.suppress(ValueError):
+            async with atomic(context):
+                assert client.savepoints == ["sp1"]
+                raise ValueError
+        async with atomic(context):
+            assert client.savepoints == ["sp1"]
+        assert client.rolled_back == ["sp1"]
+        assert client.count == 1
+    assert client.count == 0
+    assert client.closed
+
+
+async def test_async_atomic_context_nested_acquire_uses_savepoints():
+    context = AsyncAtomicContext(MockSavepointAsyncAdapter())
+    client = await context.acquire()
+    await context.acquire()
+    assert client.savepoints == ["sp1"]
+    await context.release(commit=False)
+    assert client.rolled_back == ["sp1"]
+    await context.release()
+    assert client.count == 0
+    assert client.closed
+
+
+async def test_async_atomic_context_replaces_closed_client():
+    adapter = MockAsyncAdapter()
+    context = AsyncAtomicContext(adapter)
+    context.check_interval = 0
+    client = await context.acquire()
+    client.deactivate()
+    replaced = await context.acquire()
+    assert replaced is not client
+    assert adapter.created == 2
+    await context.release()
+    await context.release()
+    assert context.stack == 0
+
+
+async def test_async_bound_context_replaces_closed_client():
+    adapter = MockAsyncAdapter()
+    context = AsyncContext(adapter, check_interval=0)
+    async with atomic(context) as client:
+        client.deactivate()
+        async with atomic(context) as replaced:
+            assert replaced is not client
+            assert not replaced.closed
+    assert adapter.created == 2
+    assert context.stack == 0
+
+
+def test_on_commit_runs_once_after_outermost_commit():
+    context = Context(MockSavepointAdapter())
+    events = []
+    with atomic(context) as client:
+        scope = atomic(context)
+        with scope:
+            scope.on_commit(lambda: events.append(("inner", client.count)))
+        with contextlib.suppress(ValueError):
+            with scope:
+                scope.on_commit(lambda: events.append("discarded"))
+                scope.on_rollback(lambda: events.append("savepoint"))
+                raise ValueError
+        assert events == []
+    assert events == [("inner", 0), "savepoint"]
+
+
+def test_on_rollback_runs_after_outermost_rollback():
+    context = AtomicContext(MockAdapter())
+    events = []
+    with contextlib.suppress(ValueError):
+        with context:
+            context.on_commit(lambda: events.append("commit"))
+            context.on_rollback(lambda: events.append("rollback"))
+            raise ValueError
+    assert events == ["rollback"]
+
+
+def test_transaction_callbacks_require_atomic_scope():
+    context = AtomicContext(MockAdapter())
+    with pytest.raises(NoActiveTransaction):
+        context.on_commit(lambda: None)
+
+
+def test_transaction_callback_errors_are_grouped():
+    context = AtomicContext(MockAdapter())
+    events = []
+
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ErrorGroup):
+        with context:
+            context.on_commit(fail)
+            context.on_commit(lambda: events.append("commit"))
+    assert events == ["commit"]
+
+
+async def test_async_on_commit_awaits_callbacks():
+    context = AsyncContext(MockSavepointAsyncAdapter())
+    events = []
+
+    async def published():
+        events.append("published")
+
+    async with atomic(context) as client:
+        scope = atomic(context)
+        async with scope:
+            scope.on_commit(published)
+            scope.on_commit(lambda: events.append(client.count))
+        assert events == []
+    assert events == ["published", 0]
+
+    atomic_context = AsyncAtomicContext(MockAsyncAdapter())
+    with contextlib.suppress(ValueError):
+        async with atomic_context:
+            async with atomic_context:
+                atomic_context.on_rollback(published)
+            raise ValueError
+    assert events == ["published", 0, "published"]
+
+
+class FailingCommitAdapter(MockAdapter):
+    def commit(self, client: MockClient) -> None:
+        raise ConnectionError
+
+
+class FailingCommitAsyncAdapter(MockAsyncAdapter):
+    async def commit(self, client: MockClient) -> None:
+        raise ConnectionError
+
+
+def test_failed_commit_unregisters_transaction():
+    events = []
+    for context in (
+        AtomicContext(FailingCommitAdapter()),
+        atomic(Context(FailingCommitAdapter())),
+    ):
+        with pytest.raises(ConnectionError):
+            with context as client:
+                context.on_commit(lambda: events.append("commit"))
+        assert id(client) not in TransactionHooks._registry
+        assert context.stack == 0
+    assert events == []
+
+
+async def test_async_failed_commit_unregisters_transaction():
+    events = []
+    for context in (
+        AsyncAtomicContext(FailingCommitAsyncAdapter()),
+        atomic(AsyncContext(FailingCommitAsyncAdapter())),
+    ):
+        with pytest.raises(ConnectionError):
+            async with context as client:
+                context.on_commit(lambda: events.append("commit"))
+        assert id(client) not in TransactionHooks._registry
+        assert context.stack == 0
+    assert events == []
+
+
+def test_atomic_context_ignores_lazy_open():
+    adapter = MockAdapter()
+    context = AtomicContext(adapter)
+    with context.open(lazy=True):
+        assert adapter.created == 1
+        assert context.client.count == 1
+    assert context.stack == 0
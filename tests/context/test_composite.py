@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+
+from gyver.context import (
+    AsyncCompositeContext,
+    AsyncContext,
+    AsyncScopedContext,
+    Context,
+)
+from gyver.exc import ErrorGroup
+
+from .mocks import MockAdapter, MockClient, RecordingAdapter
+
+
+class PlainAsyncAdapter:
+    def __init__(self) -> None:
+        self.released: list[MockClient] = []
+
+    async def new(self) -> MockClient:
+        return MockClient()
+
+    async def release(self, client: MockClient) -> None:
+        self.released.append(client)
+        client.deactivate()
+
+    async def is_closed(self, client: MockClient) -> bool:
+        return client.closed
+
+
+class SlowAdapter(RecordingAdapter):
+    started = 0
+    both_started: asyncio.Event
+
+    async def new(self) -> MockClient:
+        # only completes if the other adapter is connecting at the same time
+        cls = type(self)
+        cls.started += 1
+        if cls.started == 2:
+            cls.both_started.set()
+        await cls.both_started.wait()
+        return await super().new()
+
+
+async def test_composite_acquires_concurrently_and_commits():
+    SlowAdapter.started = 0
+    SlowAdapter.both_started = asyncio.Event()
+    database, queue = SlowAdapter(), SlowAdapter()
+    composite = AsyncCompositeContext(AsyncContext(database), AsyncContext(queue))
+
+    async with composite.begin() as (db_client, queue_client):
+        assert db_client.count == 1
+        assert queue_client.count == 1
+
+    assert (database.commits, queue.commits) == (1, 1)
+    assert db_client.closed
+    assert queue_client.closed
+
+
+async def test_composite_rolls_back_everything_on_error():
+    database, cache = RecordingAdapter(), PlainAsyncAdapter()
+    sync_adapter = MockAdapter()
+    composite = AsyncCompositeContext(
+        AsyncContext(database), AsyncContext(cache), Context(sync_adapter)
+    )
+
+    with pytest.raises(ValueError):
+        async with composite as (db_client, cache_client, sync_client):
+            assert sync_client.count == 1
+            raise ValueError
+
+    assert database.rollbacks == 1
+    assert database.commits == 0
+    assert sync_client.count == 0
+    assert cache.released == [cache_client]
+    assert db_client.closed
+    assert sync_client.closed
+
+
+async def test_composite_rolls_back_remaining_when_commit_fails():
+    class FailingCommit(RecordingAdapter):
+        async def commit(self, client: MockClient) -> None:
+            raise ConnectionError
+
+    failing, other = FailingCommit(), RecordingAdapter()
+    cache = PlainAsyncAdapter()
+    composite = AsyncCompositeContext(
+        AsyncContext(failing), AsyncContext(other), AsyncContext(cache)
+    )
+
+    with pytest.raises(ConnectionError):
+        async with composite:
+            pass
+
+    assert other.commits == 0
+    assert other.rollbacks == 1
+    assert len(cache.released) == 1
+
+
+async def test_composite_releases_acquired_contexts_when_acquire_fails():
+    class FailingNew(RecordingAdapter):
+        async def new(self) -> MockClient:
+            raise ConnectionError
+
+    database = RecordingAdapter()
+    composite = AsyncCompositeContext(
+        AsyncContext(database), AsyncContext(FailingNew())
+    )
+    with pytest.raises(ConnectionError):
+        await composite.acquire()
+    assert database.rollbacks == 1
+
+    composite = AsyncCompositeContext(
+        AsyncContext(FailingNew()), AsyncContext(FailingNew())
+    )
+    with pytest.raises(ErrorGroup):
+        await composite.acquire()
+
+
+async def test_composite_without_transactions_only_releases():
+    database = RecordingAdapter()
+    composite = AsyncCompositeContext(AsyncContext(database), transactional=False)
+
+    async with composite as (client,):
+        assert client.count == 0
+
+    assert database.commits == 0
+    assert client.closed
+
+
+async def test_composite_keeps_task_scoped_clients_in_the_caller_task():
+    scoped_adapter = RecordingAdapter()
+    scoped = AsyncScopedContext(scoped_adapter)
+    other = RecordingAdapter()
+    composite = AsyncCompositeContext(scoped, AsyncContext(other))
+
+    async with composite as (client, _):
+        assert await scoped.client() is client
+        assert scoped.stack == 1
+
+    assert scoped_adapter.created == 1
+    assert scoped_adapter.commits == 1
+    assert client.count == 0
+    assert client.closed
+    assert scoped.stack == 0
+    assert other.commits == 1
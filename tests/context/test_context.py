@@ -96,3 +96,21 @@ def test_context_releases_resource_even_on_error():
 
     assert client.closed  # type: ignore
     assert context.stack == 0
+
+
+def test_context_lazy_open_defers_client():
+    adapter = MockAdapter()
+    context = Context(adapter)
+    with context.open(lazy=True):
+        assert context.stack == 1
+        assert adapter.created == 0
+    assert context.stack == 0
+    assert adapter.created == 0
+
+    with context.open(lazy=True):
+        client = context.client
+        with context.begin() as nested:
+            assert nested is client
+        assert not client.closed
+    assert adapter.created == 1
+    assert client.closed
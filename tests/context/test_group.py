@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from gyver.context import AsyncContext, AsyncGroupCommit
+from gyver.exc import GroupCommitClosed
+
+from .mocks import MockClient, RecordingAdapter, RecordingSavepointAdapter
+
+
+async def write(client: MockClient, value: int) -> int:
+    assert client.count > 0
+    return value * 2
+
+
+async def fail(client: MockClient) -> None:
+    raise ValueError
+
+
+async def test_group_commit_batches_by_size():
+    adapter = RecordingAdapter()
+    group = AsyncGroupCommit(AsyncContext(adapter), max_batch=5, max_delay=60)
+
+    futures = [group.submit(write, value) for value in range(10)]
+    assert group.pending == 0
+
+    assert await asyncio.gather(*futures) == [value * 2 for value in range(10)]
+    assert adapter.commits == 2
+    assert group.batches == 2
+    assert group.committed == 10
+
+
+async def test_group_commit_batches_by_delay():
+    adapter = RecordingAdapter()
+    group = AsyncGroupCommit(AsyncContext(adapter), max_batch=100, max_delay=0.01)
+
+    async def submitter(value: int) -> int:
+        return await group.submit(write, value)
+
+    results = await asyncio.gather(*(submitter(value) for value in range(20)))
+
+    assert results == [value * 2 for value in range(20)]
+    assert adapter.commits == 1
+
+
+async def test_group_commit_isolates_failures_with_savepoints():
+    adapter = RecordingSavepointAdapter()
+    group = AsyncGroupCommit(AsyncContext(adapter), max_delay=60)
+
+    first = group.submit(write, 1)
+    failed = group.submit(fail)
+    last = group.submit(write, 2)
+    await group.flush()
+
+    assert first.result() == 2
+    assert last.result() == 4
+    assert isinstance(failed.exception(), ValueError)
+    assert adapter.commits == 1
+    assert adapter.rollbacks == 0
+
+
+async def test_group_commit_reruns_batch_without_failed_unit():
+    adapter = RecordingAdapter()
+    group = AsyncGroupCommit(AsyncContext(adapter), max_delay=60)
+    calls = []
+
+    async def tracked(client: MockClient, value: int) -> int:
+        calls.append(value)
+        return value
+
+    first = group.submit(tracked, 1)
+    failed = group.submit(fail)
+    last = group.submit(tracked, 2)
+    await group.flush()
+
+    assert (first.result(), last.result()) == (1, 2)
+    assert isinstance(failed.exception(), ValueError)
+    assert calls == [1, 1, 2]
+    assert adapter.rollbacks == 1
+    assert adapter.commits == 1
+
+
+async def test_group_commit_fails_every_unit_if_commit_fails():
+    class FailingCommit(RecordingAdapter):
+        async def commit(self, client: MockClient) -> None:
+            await super().commit(client)
+            raise ConnectionError
+
+    group = AsyncGroupCommit(AsyncContext(FailingCommit()), max_delay=60)
+    futures = [group.submit(write, value) for value in range(3)]
+    await group.flush()
+
+    assert all(isinstance(future.exception(), ConnectionError) for future in futures)
+    assert group.batches == 0
+
+
+async def test_group_commit_skips_cancelled_units():
+    adapter = RecordingAdapter()
+    group = AsyncGroupCommit(AsyncContext(adapter), max_delay=60)
+    calls = []
+
+    async def tracked(client: MockClient, value: int) -> int:
+        calls.append(value)
+        return value
+
+    cancelled = group.submit(tracked, 1)
+    kept = group.submit(tracked, 2)
+    cancelled.cancel()
+    await group.flush()
+
+    assert calls == [2]
+    assert kept.result() == 2
+
+
+async def test_group_commit_close_flushes_and_rejects():
+    adapter = RecordingAdapter()
+    async with AsyncGroupCommit(AsyncContext(adapter), max_delay=60) as group:
+        future = group.submit(write, 1)
+
+    assert future.result() == 2
+    with pytest.raises(GroupCommitClosed):
+        group.submit(write, 2)
@@ -0,0 +1,125 @@
+import contextlib
+
+from gyver.context import (
+    AsyncContext,
+    AsyncInstrumentedAdapter,
+    Context,
+    InstrumentedAdapter,
+    Instrumentation,
+    atomic,
+)
+from gyver.context.atomic_.savepoint import supports_savepoints
+
+from ..clock import FakeClock
+from .mocks import (
+    MockAdapter,
+    MockAsyncAdapter,
+    MockClient,
+    MockSavepointAsyncAdapter,
+)
+
+
+def test_instrumented_adapter_records_timings():
+    events = []
+    instrumentation = Instrumentation(on_event=events.append, clock=FakeClock(step=1))
+    context = Context(InstrumentedAdapter(MockAdapter(), instrumentation))
+
+    with context.begin():
+        assert instrumentation.snapshot().active == 1
+    with contextlib.suppress(ValueError):
+        with atomic(context):
+            raise ValueError
+
+    stats = instrumentation.snapshot()
+    assert stats.acquired == stats.released == 2
+    assert stats.active == 0
+    assert stats.acquire_time == 2
+    assert stats.transactions == 1
+    assert stats.rollbacks == 1
+    assert stats.commits == 0
+    assert stats.transaction_time > 0
+    assert [event.name for event in events] == [
+        "acquire",
+        "release",
+        "acquire",
+        "begin",
+        "rollback",
+        "release",
+    ]
+
+    instrumentation.reset()
+    assert instrumentation.snapshot().acquired == 0
+
+
+class FlakyCommitAdapter(MockAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures = 1
+
+    def commit(self, client: MockClient) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError
+        super().commit(client)
+
+
+def test_instrumented_adapter_ends_failed_commits():
+    instrumentation = Instrumentation(clock=FakeClock(step=1))
+    adapter = InstrumentedAdapter(FlakyCommitAdapter(), instrumentation)
+    client = adapter.new()
+
+    adapter.begin(client)
+    with contextlib.suppress(ConnectionError):
+        adapter.commit(client)
+    for _ in range(2):
+        adapter.begin(client)
+        adapter.commit(client)
+    adapter.begin(client)
+    adapter.release(client)
+
+    stats = instrumentation.snapshot()
+    assert stats.transactions == 4
+    assert stats.commits == 2
+    assert stats.rollbacks == 1
+    assert instrumentation._transactions == {}
+
+
+def test_instrumented_adapter_exposes_only_wrapped_hooks():
+    adapter = InstrumentedAdapter(MockAdapter(), Instrumentation())
+
+    assert "in_atomic" in dir(adapter)
+    assert not supports_savepoints(adapter)
+    assert not hasattr(adapter, "is_transient")
+    assert not adapter.is_closed(adapter.new())
+
+
+async def test_async_instrumented_adapter_records_savepoints():
+    instrumentation = Instrumentation()
+    context = AsyncContext(
+        AsyncInstrumentedAdapter(MockSavepointAsyncAdapter(), instrumentation)
+    )
+    assert supports_savepoints(context.adapter)
+
+    async with atomic(context):
+        async with atomic(context):
+            async with atomic(context):
+                pass
+        with contextlib.suppress(ValueError):
+            async with atomic(context):
+                raise ValueError
+
+    stats = instrumentation.snapshot()
+    assert stats.transactions == stats.commits == 1
+    assert stats.max_depth == 2
+    assert stats.savepoint_rollbacks == 1
+    assert stats.max_transaction_time >= stats.transaction_time > 0
+
+
+async def test_async_instrumented_adapter_without_transactions():
+    instrumentation = Instrumentation()
+    adapter = AsyncInstrumentedAdapter(MockAsyncAdapter(), instrumentation)
+    context = AsyncContext(adapter)
+
+    async with context.begin() as client:
+        assert not await adapter.is_closed(client)
+    assert instrumentation.snapshot().released == 1
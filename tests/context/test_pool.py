@@ -0,0 +1,107 @@
+import asyncio
+
+from gyver.context import (
+    AsyncContext,
+    AsyncPoolAdapter,
+    AsyncScopedContext,
+    Context,
+    PoolAdapter,
+)
+from gyver.pools import AsyncPool, ThreadPool
+
+from .mocks import MockClient
+
+
+def make_pool(created: list[MockClient]) -> ThreadPool[MockClient]:
+    def factory():
+        client = MockClient()
+        created.append(client)
+        return client
+
+    return ThreadPool(factory, MockClient.deactivate, pool_size=2)
+
+
+def make_async_pool(created: list[MockClient]) -> AsyncPool[MockClient]:
+    async def factory():
+        client = MockClient()
+        created.append(client)
+        return client
+
+    async def releaser(client: MockClient):
+        client.deactivate()
+
+    return AsyncPool(factory, releaser, pool_size=2)
+
+
+def test_pool_adapter_reuses_clients():
+    created = []
+    context = Context(PoolAdapter(make_pool(created)))
+
+    with context.begin() as first:
+        pass
+    with context.begin() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    assert not created[0].closed
+
+
+def test_pool_adapter_discards_broken_clients():
+    created = []
+    pool = make_pool(created)
+    context = Context(PoolAdapter(pool, is_broken=lambda client: client.closed))
+
+    client = context.acquire()
+    client.deactivate()
+    replacement = context.acquire()
+    context.release()
+    context.release()
+
+    assert replacement is not client
+    assert len(created) == 2
+    assert pool.resources.qsize() == 1
+
+
+async def test_async_pool_adapter_reuses_clients():
+    created = []
+    context = AsyncContext(AsyncPoolAdapter(make_async_pool(created)))
+
+    async with context.begin() as first:
+        pass
+    async with context.begin() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+
+
+async def test_async_pool_adapter_discards_broken_clients():
+    created = []
+    pool = make_async_pool(created)
+
+    async def is_broken(client: MockClient) -> bool:
+        return client.closed
+
+    adapter = AsyncPoolAdapter(pool, is_broken)
+    client = await adapter.new()
+    assert not await adapter.is_closed(client)
+    client.deactivate()
+    assert await adapter.is_closed(client)
+
+    await asyncio.gather(adapter.new(), adapter.new())
+    assert len(created) == 3
+
+
+async def test_async_pool_adapter_with_scoped_context():
+    created = []
+    context = AsyncScopedContext(AsyncPoolAdapter(make_async_pool(created)))
+
+    async def worker():
+        async with context.begin():
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(worker(), worker())
+    await asyncio.gather(worker(), worker())
+
+    assert len(created) == 2
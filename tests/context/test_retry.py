@@ -0,0 +1,140 @@
+import pytest
+
+from gyver.context import AsyncAtomicRetry, AsyncContext, AtomicRetry, Context, atomic
+from gyver.ds import ConstantBackoff
+
+from .mocks import MockAdapter, MockAsyncAdapter, MockClient
+
+
+class Conflict(Exception):
+    pass
+
+
+class MockRetryAdapter(MockAdapter):
+    def is_transient(self, error: Exception) -> bool:
+        return isinstance(error, Conflict)
+
+
+class MockRetryAsyncAdapter(MockAsyncAdapter):
+    def is_transient(self, error: Exception) -> bool:
+        return isinstance(error, Conflict)
+
+
+def make_flaky(failures: int, exc: type[Exception] = Conflict):
+    calls = 0
+
+    def func(client: MockClient, value: str):
+        nonlocal calls
+        calls += 1
+        assert client.count
+        if calls <= failures:
+            raise exc(calls)
+        return value
+
+    return func
+
+
+def test_atomic_retry_reruns_transient_errors():
+    retries = []
+    retry = AtomicRetry(
+        Context(MockRetryAdapter()),
+        backoff=ConstantBackoff(0),
+        on_retry=lambda attempt, error, delay: retries.append(attempt),
+    )
+
+    assert retry.execute(make_flaky(2), "done") == "done"
+    assert retries == [1, 2]
+    assert retry.calls == 1
+    assert retry.retries == 2
+    assert retry.exhausted == 0
+
+
+def test_atomic_retry_gives_up():
+    retry = AtomicRetry(
+        Context(MockRetryAdapter()), max_attempts=2, backoff=ConstantBackoff(0)
+    )
+
+    with pytest.raises(Conflict, match="2"):
+        retry.execute(make_flaky(5), "done")
+    assert retry.exhausted == 1
+
+    with pytest.raises(ValueError, match="1"):
+        retry.execute(make_flaky(1, ValueError), "done")
+    assert retry.retries == 1
+
+
+def test_atomic_retry_does_not_retry_nested_transactions():
+    context = Context(MockRetryAdapter())
+    retry = AtomicRetry(context, backoff=ConstantBackoff(0))
+    func = make_flaky(1)
+
+    with pytest.raises(Conflict):
+        with atomic(context):
+            retry.execute(func, "done")
+    assert retry.retries == 0
+
+
+def test_unbound_atomic_retry_retries_inside_transactions():
+    context = Context(MockRetryAdapter())
+    retry = AtomicRetry(context, backoff=ConstantBackoff(0), bound=False)
+
+    with atomic(context):
+        assert retry.execute(make_flaky(1), "done") == "done"
+    assert retry.retries == 1
+
+
+def test_atomic_retry_requires_classifier():
+    with pytest.raises(ValueError):
+        AtomicRetry(Context(MockAdapter()))
+
+    retry = AtomicRetry(
+        Context(MockAdapter()),
+        backoff=ConstantBackoff(0),
+        is_transient=lambda error: isinstance(error, ValueError),
+    )
+    assert retry.execute(make_flaky(1, ValueError), "done") == "done"
+
+
+async def test_async_atomic_retry_reruns_transient_errors():
+    retry = AsyncAtomicRetry(
+        AsyncContext(MockRetryAsyncAdapter()), backoff=ConstantBackoff(0)
+    )
+    flaky = make_flaky(2)
+
+    async def func(client: MockClient, value: str):
+        return flaky(client, value)
+
+    assert await retry.execute(func, "done") == "done"
+    assert retry.retries == 2
+
+    retry.max_attempts = 1
+    flaky = make_flaky(1)
+    with pytest.raises(Conflict):
+        await retry.execute(func, "done")
+    assert retry.exhausted == 1
+
+
+async def test_async_atomic_retry_does_not_retry_nested_transactions():
+    context = AsyncContext(MockRetryAsyncAdapter())
+    retry = AsyncAtomicRetry(context, backoff=ConstantBackoff(0))
+
+    async def func(client: MockClient):
+        raise Conflict
+
+    with pytest.raises(Conflict):
+        async with atomic(context):
+            await retry.execute(func)
+    assert retry.retries == 0
+
+
+async def test_async_unbound_atomic_retry_retries_inside_transactions():
+    context = AsyncContext(MockRetryAsyncAdapter())
+    retry = AsyncAtomicRetry(context, backoff=ConstantBackoff(0), bound=False)
+    flaky = make_flaky(1)
+
+    async def func(client: MockClient, value: str):
+        return flaky(client, value)
+
+    async with atomic(context):
+        assert await retry.execute(func, "done") == "done"
+    assert retry.retries == 1
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from gyver.context import AsyncContext, AsyncRoutingContext, Context, RoutingContext
+
+from .mocks import MockAdapter, MockAsyncAdapter
+
+
+def make_router(replicas: int = 2, **kwargs) -> RoutingContext:
+    return RoutingContext(
+        Context(MockAdapter()),
+        [Context(MockAdapter()) for _ in range(replicas)],
+        **kwargs,
+    )
+
+
+def test_reads_round_robin_across_replicas():
+    router = make_router()
+    used = []
+    for _ in range(4):
+        with router.begin():
+            used.append(next(i for i, r in enumerate(router.replicas) if r.is_active()))
+    assert used == [0, 1, 0, 1]
+    assert not router.primary.is_active()
+
+
+def test_reads_go_to_least_loaded_replica():
+    router = make_router(strategy="least_loaded")
+    with router.begin():
+        with router.begin():
+            assert all(replica.is_active() for replica in router.replicas)
+    with router.begin():
+        assert router.replicas[0].is_active()
+
+
+def test_writes_make_the_session_sticky():
+    router = make_router()
+    with router.session():
+        with router.begin():
+            assert not router.primary.is_active()
+        with router.atomic() as client:
+            assert client.count == 1
+            with router.begin() as read_client:
+                assert read_client is client
+        assert router.is_sticky()
+        with router.begin():
+            assert router.primary.is_active()
+    assert not router.is_sticky()
+
+    with router.write():
+        assert router.primary.is_active()
+    with router.begin():
+        assert not router.primary.is_active()
+
+
+def test_nested_sessions_share_stickiness():
+    router = make_router()
+    with router.session():
+        with router.write():
+            pass
+        with router.session():
+            assert router.is_sticky()
+            with router.begin():
+                assert router.primary.is_active()
+        assert router.is_sticky()
+    assert not router.is_sticky()
+
+    with router.session():
+        with router.session():
+            with router.write():
+                pass
+        # the write in the nested session still pins the enclosing one
+        assert router.is_sticky()
+        with router.begin():
+            assert router.primary.is_active()
+
+
+def test_reads_inside_writes_use_primary_without_session():
+    router = make_router()
+    with router.atomic() as client:
+        assert router.is_sticky()
+        with router.begin() as read_client:
+            assert read_client is client
+    assert not router.is_sticky()
+    with router.begin():
+        assert not router.primary.is_active()
+
+
+def test_sessions_are_kept_per_router():
+    router, other = make_router(), make_router()
+    with router.session(), other.session():
+        with router.atomic():
+            pass
+        assert router.is_sticky()
+        assert not other.is_sticky()
+    assert not router.is_sticky()
+
+
+def test_reads_use_primary_without_replicas():
+    router = make_router(replicas=0)
+    with router.begin():
+        assert router.primary.is_active()
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        make_router(strategy="random")
+
+
+async def test_async_router_routes_and_sticks_per_task():
+    router = AsyncRoutingContext(
+        AsyncContext(MockAsyncAdapter()),
+        [AsyncContext(MockAsyncAdapter())],
+    )
+
+    async def reader():
+        with router.session():
+            async with router.begin():
+                return router.replicas[0].is_active()
+
+    async def writer():
+        with router.session():
+            async with router.atomic() as client:
+                assert client.count == 1
+            async with router.begin():
+                return router.primary.is_active()
+
+    assert await asyncio.gather(reader(), writer()) == [True, True]
+
+    async with router.write():
+        assert router.primary.is_active()
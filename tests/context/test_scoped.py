@@ -0,0 +1,238 @@
+import asyncio
+import contextlib
+import threading
+
+from gyver.context import AsyncScopedContext, ScopedContext, atomic
+
+from .mocks import MockAdapter, MockAsyncAdapter, RecordingAdapter
+
+
+async def test_async_scoped_context_reuses_client_within_task():
+    context = AsyncScopedContext(MockAsyncAdapter())
+    async with context.open():
+        async with context.begin() as client:
+            assert context.stack == 2
+            assert await context.acquire() is client
+            await context.release()
+        assert context.stack == 1
+    assert context.stack == 0
+    assert not context.is_active()
+    assert client.closed
+
+
+async def test_async_scoped_context_isolates_tasks():
+    context = AsyncScopedContext(MockAsyncAdapter())
+    clients = []
+
+    async def worker():
+        async with context.begin() as client:
+            await asyncio.sleep(0.01)
+            assert context.stack == 1
+            assert await context.client() is client
+            clients.append(client)
+        assert client.closed
+
+    await asyncio.gather(*(worker() for _ in range(5)))
+
+    assert len({id(client) for client in clients}) == 5
+    assert context.stack == 0
+
+
+async def test_async_scoped_context_child_task_gets_own_client():
+    context = AsyncScopedContext(MockAsyncAdapter())
+
+    async def child():
+        assert context.stack == 0
+        async with context.begin() as client:
+            return client
+
+    async with context.begin() as parent:
+        client = await asyncio.create_task(child())
+        assert client is not parent
+        assert client.closed
+        assert not parent.closed
+        assert context.stack == 1
+    assert parent.closed
+
+
+async def test_async_scoped_context_releases_on_error():
+    context = AsyncScopedContext(MockAsyncAdapter())
+
+    with contextlib.suppress(ValueError):
+        async with context.begin() as client:
+            raise ValueError
+
+    assert client.closed  # type: ignore
+    assert context.stack == 0
+    await context.release()
+    assert context.stack == 0
+
+
+async def test_async_scoped_context_with_atomic():
+    context = AsyncScopedContext(MockAsyncAdapter())
+
+    async def worker():
+        async with atomic(context) as client:
+            await asyncio.sleep(0.01)
+            assert client.count == 1
+        return client
+
+    clients = await asyncio.gather(*(worker() for _ in range(3)))
+    assert len({id(client) for client in clients}) == 3
+    assert all(client.count == 0 for client in clients)
+
+
+async def test_shared_atomic_scope_isolates_tasks():
+    adapter = RecordingAdapter()
+    scope = atomic(AsyncScopedContext(adapter))
+    entered = asyncio.Event()
+    clients = []
+
+    async def worker(first: bool):
+        async with scope as client:
+            clients.append(client)
+            assert client.count == 1
+            assert scope.stack == 1
+            if first:
+                entered.set()
+                await asyncio.sleep(0.01)
+            else:
+                await entered.wait()
+        assert client.count == 0
+        assert client.closed
+
+    await asyncio.gather(worker(True), worker(False))
+
+    assert len({id(client) for client in clients}) == 2
+    assert adapter.commits == 2
+
+
+def test_scoped_context_reuses_client_within_thread():
+    context = ScopedContext(MockAdapter())
+    with context.open():
+        with context.begin() as client:
+            assert context.stack == 2
+            assert context.acquire() is client
+            context.release()
+        assert context.is_active()
+    assert context.stack == 0
+    assert client.closed
+
+
+def test_scoped_context_isolates_threads():
+    context = ScopedContext(MockAdapter())
+    barrier = threading.Barrier(5)
+    clients = []
+
+    def worker():
+        with context.begin() as client:
+            barrier.wait()
+            assert context.stack == 1
+            assert context.client is client
+            clients.append(client)
+        assert client.closed
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 5
+    assert context.stack == 0
+
+
+def test_shared_atomic_scope_isolates_threads():
+    adapter = MockAdapter()
+    scope = atomic(ScopedContext(adapter))
+    barrier = threading.Barrier(2, timeout=5)
+    clients = []
+    errors = []
+
+    def worker():
+        try:
+            with scope as client:
+                barrier.wait()
+                clients.append(client)
+                assert client.count == 1
+                assert scope.stack == 1
+                barrier.wait()
+            assert client.count == 0
+            assert client.closed
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len({id(client) for client in clients}) == 2
+
+
+def test_scoped_context_replaces_closed_client():
+    context = ScopedContext(MockAdapter())
+    closed = context.client
+    closed.deactivate()
+
+    with context.begin() as client:
+        assert client is not closed
+        with atomic(context) as atomic_client:
+            assert atomic_client is client
+            assert client.count == 1
+        assert client.count == 0
+    assert client.closed
+
+    with contextlib.suppress(ValueError):
+        with context.begin() as client:
+            raise ValueError
+    assert client.closed
+    context.release()
+    assert context.stack == 0
+
+
+async def test_async_scoped_context_replaces_closed_client():
+    adapter = MockAsyncAdapter()
+    context = AsyncScopedContext(adapter, check_interval=0)
+
+    async with context.begin() as client:
+        client.deactivate()
+        async with context.begin() as replaced:
+            assert replaced is not client
+            assert await context.client() is replaced
+    assert adapter.created == 2
+    assert context.stack == 0
+
+
+async def test_async_scoped_context_lazy_open():
+    adapter = MockAsyncAdapter()
+    context = AsyncScopedContext(adapter)
+    async with context.open(lazy=True):
+        async with context.open(lazy=True):
+            assert context.stack == 2
+        assert adapter.created == 0
+    assert context.stack == 0
+
+    async with context.open(lazy=True):
+        async with context.begin() as client:
+            assert context.stack == 2
+        assert await context.client() is client
+    assert adapter.created == 1
+    assert client.closed
+
+
+def test_scoped_context_lazy_open():
+    adapter = MockAdapter()
+    context = ScopedContext(adapter)
+    with context.open(lazy=True):
+        assert context.stack == 1
+    assert adapter.created == 0
+
+    with context.open(lazy=True):
+        with context.begin() as client:
+            assert context.stack == 2
+        assert not client.closed
+    assert adapter.created == 1
+    assert client.closed
@@ -1,14 +1,18 @@
 import dataclasses
+import gc
+import weakref
 from enum import Enum
-from typing import Any, Literal, TypeAlias
+from typing import Any, Literal, Optional, TypeAlias
 
 import pytest
 from attrs import asdict, define
+from attrs import field as attrs_field
 from config import InvalidCast
 
 from gyver import config
 from gyver.attrs import asdict as gasdict
 from gyver.attrs import define as gdefine
+from gyver.attrs import info as gfield
 from gyver.attrs.utils.functions import disassemble_type
 from gyver.config.adapter.attrs import AttrsResolverStrategy
 from gyver.config.adapter.dataclass import DataclassResolverStrategy
@@ -17,6 +21,8 @@ from gyver.config.adapter.gattrs import GyverAttrsResolverStrategy
 from gyver.config.adapter.mark import as_config, mark
 from gyver.config.adapter.memo import MemoFactory
 from gyver.config.adapter.pydantic import PydanticResolverStrategy
+from gyver.config.adapter.registry import StrategyRegistry, strategy_registry
+from gyver.ds import LRUCache
 from gyver.model import Model, v1
 from gyver.utils import json
 
@@ -308,6 +314,159 @@ def test_config_factory_support_for_nested_classes():
     )
 
 
+def test_config_factory_compiles_load_plan_once(monkeypatch: pytest.MonkeyPatch):
+    @dataclasses.dataclass
+    class Inner:
+        port: int
+
+    @dataclasses.dataclass
+    class Outer:
+        inner: Inner
+        host: str = "localhost"
+
+    iterated = []
+    iterfield = DataclassResolverStrategy.iterfield
+
+    def counting_iterfield(config_class: type):
+        iterated.append(config_class)
+        return iterfield(config_class)
+
+    monkeypatch.setattr(
+        DataclassResolverStrategy, "iterfield", staticmethod(counting_iterfield)
+    )
+    mapping = config.EnvMapping({"INNER__PORT": "8000"})
+
+    first = config.AdapterConfigFactory(config.Config(mapping=mapping)).load(Outer)
+    mapping = config.EnvMapping({"INNER__PORT": "9000", "HOST": "db"})
+    second = config.AdapterConfigFactory(config.Config(mapping=mapping)).load(Outer)
+
+    assert first == Outer(Inner(8000))
+    assert second == Outer(Inner(9000), "db")
+    assert iterated == [Outer, Inner]
+
+    config.AdapterConfigFactory.clear_plans()
+    config.AdapterConfigFactory(config.Config(mapping=mapping)).load(Outer)
+    assert iterated == [Outer, Inner, Outer, Inner]
+
+
+def test_config_factory_bounds_load_plans(monkeypatch: pytest.MonkeyPatch):
+    plans = LRUCache(2)
+    monkeypatch.setattr("gyver.config.adapter.factory._PLANS", plans)
+
+    @dataclasses.dataclass
+    class Tenant:
+        name: str
+
+    mapping = config.EnvMapping({f"TENANT{i}_NAME": f"t{i}" for i in range(5)})
+    factory = config.AdapterConfigFactory(config.Config(mapping=mapping))
+    for i in range(5):
+        assert factory.load(Tenant, f"tenant{i}") == Tenant(f"t{i}")
+    assert len(plans) == 2
+
+
+def test_config_factory_evaluates_default_factories_on_every_load():
+    @gdefine
+    class Tagged:
+        tags: list[str] = gfield(default_factory=list)
+
+    @define
+    class AttrsTagged:
+        tags: list[str] = attrs_field(factory=list)
+
+    factory = config.AdapterConfigFactory(config.Config(mapping=config.EnvMapping({})))
+
+    for model_cls in (Tagged, AttrsTagged):
+        first, second = factory.load(model_cls), factory.load(model_cls)
+        assert first.tags == second.tags == []
+        assert first.tags is not second.tags
+
+
+def test_strategy_registry_caches_resolution():
+    registry = StrategyRegistry()
+    checked = []
+
+    def matcher(klass: type) -> bool:
+        checked.append(klass)
+        return klass is PersonConfig
+
+    registry.register(matcher, DataclassResolverStrategy)
+
+    assert registry.resolve(PersonConfig) is DataclassResolverStrategy
+    assert registry.resolve(PersonConfig) is DataclassResolverStrategy
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            registry.resolve(str)
+    assert checked == [PersonConfig, str]
+
+    optional = Optional[int]  # noqa: UP007, typing.Union is not a class
+    with pytest.raises(ValueError):
+        AdapterConfigFactory.get_strategy_class(disassemble_type(optional))
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(strategy_registry, "_entries", list(strategy_registry._entries))
+    monkeypatch.setattr(strategy_registry, "_resolved", weakref.WeakKeyDictionary())
+    yield
+    AdapterConfigFactory.clear_plans()
+
+
+def test_config_factory_supports_custom_strategies(isolated_registry: None):
+    class Custom:
+        __custom_fields__ = ("name",)
+
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    @gdefine
+    class CustomStrategy:
+        field: str
+
+        def cast(self) -> type:
+            return str
+
+        def names(self) -> tuple[str, ...]:
+            return (self.field,)
+
+        def init_name(self) -> str:
+            return self.field
+
+        def default(self) -> Any:
+            return config.MISSING
+
+        @staticmethod
+        def iterfield(config_class: type):
+            yield from config_class.__custom_fields__
+
+    AdapterConfigFactory.register_strategy(
+        lambda klass: hasattr(klass, "__custom_fields__"),
+        CustomStrategy,  # type: ignore
+    )
+    cfg = config.Config(mapping=config.EnvMapping({"NAME": "custom"}))
+
+    assert config.AdapterConfigFactory(cfg).load(Custom).name == "custom"
+
+
+def test_config_factory_supports_msgspec_structs():
+    msgspec = pytest.importorskip("msgspec")
+
+    class Inner(msgspec.Struct):
+        port: int
+
+    class Settings(msgspec.Struct):
+        inner: Inner
+        name: str
+        debug: bool = False
+
+    cfg = config.Config(
+        mapping=config.EnvMapping({"NAME": "api", "INNER__PORT": "8000"})
+    )
+
+    assert config.AdapterConfigFactory(cfg).load(Settings) == Settings(
+        Inner(8000), "api"
+    )
+
+
 def test_parametrize_loads_parameters_as_expected():
     def mock_function(val1: str, val2: int, val3) -> tuple[str, int, Any]:
         return val1, val2, val3
@@ -525,3 +684,17 @@ def test_memo_factory_primary_is_loaded_if_prefix_is_empty():
     assert memo_factory.load(
         Person, __prefix__="person", __primary__=True
     ) is memo_factory.load(Person)
+
+
+def test_strategy_registry_does_not_keep_classes_alive():
+    registry = StrategyRegistry()
+    registry.register(lambda klass: True, DataclassResolverStrategy)
+
+    class Temporary:
+        pass
+
+    registry.resolve(Temporary)
+    assert len(registry._resolved) == 1
+    del Temporary
+    gc.collect()
+    assert len(registry._resolved) == 0
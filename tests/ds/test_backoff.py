@@ -0,0 +1,40 @@
+import pytest
+
+from gyver.ds import ConstantBackoff, DecorrelatedJitterBackoff, ExponentialBackoff
+
+
+def test_constant_backoff_always_returns_the_same_delay():
+    policy = ConstantBackoff(3)
+
+    assert [policy.compute(attempt, 3) for attempt in range(4)] == [3, 3, 3, 3]
+
+
+def test_exponential_backoff_grows_up_to_cap():
+    policy = ExponentialBackoff(base=1, factor=2, cap=10)
+
+    delays = [policy.compute(attempt, 0) for attempt in range(6)]
+
+    assert delays == [1, 2, 4, 8, 10, 10]
+
+
+def test_exponential_backoff_does_not_overflow():
+    policy = ExponentialBackoff(base=1, factor=1000, cap=30)
+
+    assert policy.compute(5000, 0) == 30
+
+
+@pytest.mark.parametrize("attempt", range(8))
+def test_exponential_backoff_with_jitter_stays_within_bounds(attempt: int):
+    policy = ExponentialBackoff(base=1, factor=2, cap=20, jitter=True)
+
+    assert 0 <= policy.compute(attempt, 0) <= min(20, 2**attempt)
+
+
+def test_decorrelated_jitter_stays_within_bounds():
+    policy = DecorrelatedJitterBackoff(base=1, cap=15)
+    previous = 0.0
+
+    for attempt in range(50):
+        delay = policy.compute(attempt, previous)
+        assert 1 <= delay <= min(15, max(1, previous * 3))
+        previous = delay
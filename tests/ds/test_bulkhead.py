@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from gyver.ds import (
+    AsyncBulkhead,
+    Bulkhead,
+    CircuitBreaker,
+    with_bulkhead,
+    with_circuit_breaker,
+)
+from gyver.exc import BulkheadFull
+
+
+async def test_async_bulkhead_limits_concurrency():
+    bulkhead = AsyncBulkhead(max_concurrent=2)
+    running = 0
+    peak = 0
+
+    async def func():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "done"
+
+    results = await asyncio.gather(*(bulkhead.execute(func) for _ in range(6)))
+
+    assert results == ["done"] * 6
+    assert peak == 2
+    assert bulkhead.active == 0
+    assert bulkhead.queued == 0
+
+
+async def test_async_bulkhead_rejects_when_queue_is_full():
+    bulkhead = AsyncBulkhead(max_concurrent=1, max_queue=1)
+    event = asyncio.Event()
+
+    async def func():
+        await event.wait()
+
+    first = asyncio.create_task(bulkhead.execute(func))
+    second = asyncio.create_task(bulkhead.execute(func))
+    await asyncio.sleep(0)
+
+    with pytest.raises(BulkheadFull):
+        await bulkhead.execute(func)
+
+    event.set()
+    await asyncio.gather(first, second)
+    assert bulkhead.active == 0
+
+
+async def test_async_bulkhead_queue_timeout():
+    bulkhead = AsyncBulkhead(max_concurrent=1, queue_timeout=0.01)
+    event = asyncio.Event()
+
+    async def func():
+        await event.wait()
+
+    task = asyncio.create_task(bulkhead.execute(func))
+    await asyncio.sleep(0)
+
+    with pytest.raises(BulkheadFull):
+        await bulkhead.execute(func)
+    assert bulkhead.queued == 0
+
+    event.set()
+    await task
+    assert bulkhead.active == 0
+
+
+async def test_async_bulkhead_releases_slot_on_error():
+    bulkhead = AsyncBulkhead(max_concurrent=1)
+
+    async def func():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await bulkhead.execute(func)
+
+    assert bulkhead.active == 0
+
+
+async def test_async_bulkhead_cancelled_waiter_leaves_queue():
+    bulkhead = AsyncBulkhead(max_concurrent=1)
+    event = asyncio.Event()
+
+    async def func():
+        await event.wait()
+
+    holder = asyncio.create_task(bulkhead.execute(func))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(bulkhead.execute(func))
+    await asyncio.sleep(0)
+    assert bulkhead.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bulkhead.queued == 0
+    event.set()
+    await holder
+    assert bulkhead.active == 0
+
+
+def test_bulkhead_limits_concurrency_across_threads():
+    bulkhead = Bulkhead(max_concurrent=2)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def func():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    threads = [
+        threading.Thread(target=bulkhead.execute, args=(func,)) for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert bulkhead.active == 0
+
+
+def test_bulkhead_rejects_without_queue():
+    bulkhead = Bulkhead(max_concurrent=1, max_queue=0)
+
+    with bulkhead:
+        with pytest.raises(BulkheadFull):
+            bulkhead.acquire()
+
+    assert bulkhead.active == 0
+
+
+def test_bulkhead_queue_timeout():
+    bulkhead = Bulkhead(max_concurrent=1, queue_timeout=0.01)
+
+    with bulkhead:
+        with pytest.raises(BulkheadFull):
+            bulkhead.execute(lambda: None)
+        assert bulkhead.queued == 0
+
+
+def test_with_bulkhead_decorates_sync_functions():
+    bulkhead = Bulkhead(max_concurrent=1)
+
+    @with_bulkhead(bulkhead)
+    def func(value: int) -> int:
+        assert bulkhead.active == 1
+        return value * 2
+
+    assert func(2) == 4
+    assert bulkhead.active == 0
+
+
+async def test_with_bulkhead_composes_with_circuit_breaker():
+    bulkhead = AsyncBulkhead(max_concurrent=1, max_queue=0)
+    breaker = CircuitBreaker(freeze_function=partial(asyncio.sleep, 0.01))
+    calls = 0
+
+    @with_circuit_breaker(breaker)
+    @with_bulkhead(bulkhead)
+    async def func():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError
+        return "success"
+
+    assert await func() == "success"
+    assert calls == 2
+    assert bulkhead.active == 0
@@ -0,0 +1,60 @@
+from gyver.ds import LRUCache, TTLCache
+
+from ..clock import FakeClock
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_get_and_pop_defaults():
+    cache = LRUCache()
+    cache.set("a", 1)
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", 0) == 0
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+
+    cache.set("b", 2)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9
+    assert cache.get("a") == 1
+    assert "a" in cache
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert len(cache) == 0
+
+
+def test_ttl_cache_is_bounded_and_pops():
+    cache = TTLCache(ttl=10, maxsize=1, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.get("a", "missing") == "missing"
+    assert cache.pop("b") == 2
+    assert cache.pop("b") is None
+
+    cache.set("c", 3)
+    cache.clear()
+    assert len(cache) == 0
@@ -1,10 +1,11 @@
 import asyncio
 from functools import partial
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from gyver.ds import CircuitBreaker, with_circuit_breaker
+from gyver.ds import CircuitBreaker, TTLCache, deadline, with_circuit_breaker
+from gyver.exc import DeadlineExceeded
 
 
 @pytest.fixture
@@ -244,3 +245,162 @@ async def test_reentry_during_frozen_state(circuit_breaker: CircuitBreaker):
     # Trigger initial freeze
     with pytest.raises(ValueError):
         await asyncio.gather(circuit_breaker.execute(failing_func), check())
+
+
+class RecordingPolicy:
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, float]] = []
+
+    def compute(self, attempt: int, previous: float) -> float:
+        self.calls.append((attempt, previous))
+        return 0.01 * (attempt + 1)
+
+
+async def test_open_policy_backs_off_progressively():
+    """Test that consecutive trips without a success use growing attempt numbers."""
+    policy = RecordingPolicy()
+    cb = CircuitBreaker(open_policy=policy)
+
+    async def failing_func():
+        raise ValueError("fail")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await cb.execute(failing_func)
+        await cb._freeze_future
+
+    assert policy.calls == [(0, 0), (1, 0.01), (2, 0.02)]
+    assert cb.trips == 3
+
+
+async def test_open_policy_resets_on_success():
+    """Test that a successful call resets the trip count."""
+    policy = RecordingPolicy()
+    cb = CircuitBreaker(open_policy=policy)
+    should_fail = True
+
+    async def func():
+        nonlocal should_fail
+        if should_fail:
+            should_fail = False
+            raise ValueError("fail")
+        return "success"
+
+    assert await cb.execute(func) == "success"
+    assert cb.trips == 0
+
+    should_fail = True
+    assert await cb.execute(func) == "success"
+    assert policy.calls == [(0, 0), (0, 0)]
+
+
+async def test_open_policy_keeps_trips_without_reset_on_success():
+    """Test that disabling reset_on_success keeps backing off."""
+    policy = RecordingPolicy()
+    cb = CircuitBreaker(open_policy=policy, reset_on_success=False)
+    should_fail = True
+
+    async def func():
+        nonlocal should_fail
+        if should_fail:
+            should_fail = False
+            raise ValueError("fail")
+        return "success"
+
+    await cb.execute(func)
+    should_fail = True
+    await cb.execute(func)
+
+    assert [attempt for attempt, _ in policy.calls] == [0, 1]
+    assert cb.trips == 2
+
+
+async def test_fallback_is_served_while_frozen():
+    """Test that the fallback answers instead of waiting while frozen."""
+    fallback_calls = []
+
+    async def fallback(value):
+        fallback_calls.append(value)
+        return f"fallback {value}"
+
+    cb = CircuitBreaker(freeze_function=partial(asyncio.sleep, 0.05), fallback=fallback)
+
+    async def failing_func(value):
+        raise ValueError(value)
+
+    assert await cb.execute(failing_func, 1) == "fallback 1"
+    assert cb.is_frozen
+    assert await cb.execute(failing_func, 2) == "fallback 2"
+    assert fallback_calls == [1, 2]
+    await cb._freeze_future
+
+
+async def test_stale_cache_is_served_while_frozen():
+    """Test that the last good result of the same call is served while frozen."""
+    cb = CircuitBreaker(
+        freeze_function=partial(asyncio.sleep, 0.05), stale_cache=TTLCache(ttl=60)
+    )
+    healthy = True
+
+    async def func(key, *, suffix=""):
+        if not healthy:
+            raise ValueError(key)
+        return f"{key}{suffix}"
+
+    assert await cb.execute(func, "a", suffix="!") == "a!"
+
+    healthy = False
+    assert await cb.execute(func, "a", suffix="!") == "a!"
+    assert cb.is_frozen
+
+    # a call that was never cached waits for the circuit and retries
+    with pytest.raises(ValueError, match="b"):
+        await cb.execute(func, "b")
+
+
+async def test_stale_cache_skips_unhashable_arguments():
+    """Test that calls with unhashable arguments are not cached."""
+    cache = TTLCache(ttl=60)
+    cb = CircuitBreaker(stale_cache=cache)
+
+    async def func(values):
+        return sum(values)
+
+    assert await cb.execute(func, [1, 2]) == 3
+    assert len(cache) == 0
+
+
+async def test_timeout_counts_as_failure():
+    """Test that calls slower than the timeout fail and freeze the circuit."""
+    cb = CircuitBreaker(timeout=0.01, freeze_function=partial(asyncio.sleep, 0.01))
+
+    async def func():
+        await asyncio.sleep(1)
+
+    with pytest.raises(DeadlineExceeded):
+        await cb.execute(func)
+    assert cb.trips == 1
+
+
+async def test_caller_deadline_does_not_count_as_failure():
+    """Test that calls cut short by the caller's deadline do not freeze the circuit."""
+    cb = CircuitBreaker(timeout=60)
+
+    async def func():
+        await asyncio.sleep(1)
+
+    with deadline(0.01), pytest.raises(DeadlineExceeded):
+        await cb.execute(func)
+    assert not cb.is_frozen
+    assert cb.trips == 0
+
+
+async def test_expired_deadline_does_not_freeze():
+    """Test that calls are rejected without freezing once the deadline expired."""
+    cb = CircuitBreaker()
+    func = AsyncMock()
+
+    with deadline(0), pytest.raises(DeadlineExceeded):
+        await cb.execute(func)
+    func.assert_not_called()
+    assert not cb.is_frozen
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+
+from gyver.ds import (
+    AdaptiveLimiter,
+    AsyncBulkhead,
+    Bulkhead,
+    ConstantBackoff,
+    Retry,
+    TokenBucket,
+    check_deadline,
+    current_deadline,
+    deadline,
+    execute_with_deadline,
+    remaining_time,
+    wait_with_deadline,
+)
+from gyver.exc import BulkheadFull, DeadlineExceeded, RateLimited
+
+
+def test_remaining_time_without_deadline():
+    assert current_deadline() is None
+    assert remaining_time() is None
+    assert remaining_time(3) == 3
+
+
+def test_nested_deadline_keeps_the_tighter_one():
+    with deadline(10) as outer:
+        assert current_deadline() is outer
+        with deadline(60) as inner:
+            assert inner is outer
+        with deadline(1) as inner:
+            assert inner is not outer
+            assert remaining_time(5) <= 1
+        with deadline(None) as inner:
+            assert inner is outer
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_expired_deadline_raises():
+    with deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            remaining_time()
+        with pytest.raises(DeadlineExceeded):
+            check_deadline()
+    with deadline(60):
+        check_deadline()
+
+
+async def test_deadline_is_inherited_by_tasks():
+    async def func():
+        return current_deadline()
+
+    with deadline(10) as current:
+        assert await asyncio.create_task(func()) is current
+
+
+async def test_execute_with_deadline_exposes_remaining_time():
+    async def func():
+        return remaining_time()
+
+    remaining = await execute_with_deadline(1, func)
+    assert remaining is not None and 0 < remaining <= 1
+    assert await execute_with_deadline(None, func) is None
+
+
+async def test_execute_with_deadline_cancels_slow_calls():
+    cancelled = False
+
+    async def func():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    with pytest.raises(DeadlineExceeded):
+        await execute_with_deadline(0.01, func)
+    assert cancelled
+
+
+async def test_execute_with_deadline_does_not_start_after_expiry():
+    called = False
+
+    async def func():
+        nonlocal called
+        called = True
+
+    with deadline(0), pytest.raises(DeadlineExceeded):
+        await execute_with_deadline(None, func)
+    assert not called
+
+
+async def test_wait_with_deadline_shield_keeps_awaitable():
+    future = asyncio.get_running_loop().create_future()
+
+    with deadline(0.01), pytest.raises(DeadlineExceeded):
+        await wait_with_deadline(future, None, shield=True)
+    assert not future.cancelled()
+
+    future.set_result("done")
+    assert await wait_with_deadline(future, None) == "done"
+
+
+async def test_async_bulkhead_queue_respects_deadline():
+    bulkhead = AsyncBulkhead(max_concurrent=1)
+    await bulkhead.acquire()
+
+    with deadline(0.01), pytest.raises(DeadlineExceeded):
+        await bulkhead.acquire()
+    assert bulkhead.queued == 0
+
+    bulkhead.queue_timeout = 0.01
+    with deadline(60), pytest.raises(BulkheadFull):
+        await bulkhead.acquire()
+
+    with deadline(0), pytest.raises(DeadlineExceeded):
+        await bulkhead.acquire()
+
+
+def test_bulkhead_queue_respects_deadline():
+    bulkhead = Bulkhead(max_concurrent=1)
+    bulkhead.acquire()
+
+    with deadline(0.01), pytest.raises(DeadlineExceeded):
+        bulkhead.acquire()
+    assert bulkhead.queued == 0
+
+    bulkhead.queue_timeout = 0.01
+    with deadline(60), pytest.raises(BulkheadFull):
+        bulkhead.acquire()
+
+
+async def test_limiter_rejects_expired_deadline():
+    limiter = AdaptiveLimiter()
+
+    async def func():
+        return "done"
+
+    with deadline(0), pytest.raises(DeadlineExceeded):
+        await limiter.execute(func)
+    assert limiter.inflight == 0
+
+
+async def test_rate_limiter_wait_respects_deadline():
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.try_acquire()
+
+    with deadline(0.01), pytest.raises(DeadlineExceeded):
+        await bucket.async_acquire()
+    with deadline(0.01), pytest.raises(DeadlineExceeded):
+        bucket.acquire()
+    with deadline(60), pytest.raises(RateLimited):
+        await bucket.async_acquire(timeout=0.01)
+
+
+async def test_retry_stops_before_deadline():
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        raise ValueError(calls)
+
+    retry = Retry(max_attempts=5, backoff=ConstantBackoff(1))
+    with deadline(0.5), pytest.raises(ValueError, match="1"):
+        await retry.execute(func)
+    assert calls == 1
+
+    with deadline(0), pytest.raises(DeadlineExceeded):
+        await retry.execute(func)
+    assert calls == 1
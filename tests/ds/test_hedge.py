@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from gyver.ds import Hedger, with_hedging
+
+
+def make_backend(*delays: float):
+    """Returns a function whose n-th call takes delays[n] seconds."""
+    calls: list[int] = []
+    cancelled: list[int] = []
+
+    async def func():
+        call = len(calls)
+        calls.append(call)
+        try:
+            await asyncio.sleep(delays[call])
+        except asyncio.CancelledError:
+            cancelled.append(call)
+            raise
+        return call
+
+    return func, calls, cancelled
+
+
+async def test_fast_calls_are_not_hedged():
+    hedger = Hedger(delay=0.05)
+    func, calls, _ = make_backend(0)
+
+    assert await hedger.execute(func) == 0
+    assert calls == [0]
+    assert hedger.hedged == 0
+
+
+async def test_slow_call_is_hedged_and_loser_cancelled():
+    hedger = Hedger(delay=0.01, max_ratio=1)
+    func, calls, cancelled = make_backend(1, 0)
+
+    assert await hedger.execute(func) == 1
+    await asyncio.sleep(0)
+    assert calls == [0, 1]
+    assert cancelled == [0]
+    assert hedger.hedged == 1
+
+
+async def test_first_attempt_can_still_win_after_hedging():
+    hedger = Hedger(delay=0.01, max_ratio=1)
+    func, _, cancelled = make_backend(0.02, 1)
+
+    assert await hedger.execute(func) == 0
+    await asyncio.sleep(0)
+    assert cancelled == [1]
+
+
+async def test_hedge_rate_is_capped():
+    hedger = Hedger(delay=0, max_ratio=0.5)
+    func, calls, _ = make_backend(0.01, 0.01, 0.01, 0.01, 0.01, 0.01)
+
+    for _ in range(2):
+        await hedger.execute(func)
+
+    # 2 calls at 50% allow a single hedge
+    assert hedger.hedged == 1
+    assert len(calls) == 3
+
+
+async def test_failed_attempt_waits_for_the_hedge():
+    hedger = Hedger(delay=0.01, max_ratio=1)
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.02)
+            raise ValueError
+        await asyncio.sleep(0.03)
+        return "hedge"
+
+    assert await hedger.execute(func) == "hedge"
+
+
+async def test_all_attempts_failing_raises():
+    hedger = Hedger(delay=0)
+
+    @with_hedging(hedger)
+    async def func():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await func()
+
+
+async def test_hedge_delay_uses_measured_quantile():
+    hedger = Hedger(quantile=0.5, min_samples=4, default_delay=1)
+    assert hedger.hedge_delay == 1
+
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        hedger._record(latency)
+
+    assert hedger.hedge_delay == 0.2
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from gyver.ds import AdaptiveLimiter, AIMDLimit, GradientLimit, with_limiter
+from gyver.exc import LimitExceeded
+
+from ..clock import FakeClock
+
+
+def test_aimd_increases_under_load_and_backs_off_on_drops():
+    algorithm = AIMDLimit(initial_limit=10, max_limit=11, backoff_ratio=0.5)
+
+    assert algorithm.update(10, 0.1, 5, False) == 11
+    assert algorithm.update(11, 0.1, 6, False) == 11
+    assert algorithm.update(10, 0.1, 1, False) == 10
+    assert algorithm.update(10, 0.1, 5, True) == 5
+    assert algorithm.update(10, 2, 5, False) == 5
+    assert algorithm.update(1, 0.1, 1, True) == 1
+
+
+def test_gradient_shrinks_when_latency_grows():
+    algorithm = GradientLimit(initial_limit=20, smoothing=1)
+    limit = 20.0
+
+    for _ in range(10):
+        limit = algorithm.update(limit, 0.01, 20, False)
+    grown = limit
+    assert grown > 20
+
+    for _ in range(5):
+        limit = algorithm.update(limit, 0.1, int(limit), False)
+
+    assert limit < grown
+
+
+def test_gradient_ignores_samples_without_load():
+    algorithm = GradientLimit(initial_limit=20)
+
+    assert algorithm.update(20, 0.01, 1, False) == 20
+
+
+def test_gradient_shrinks_on_drops():
+    algorithm = GradientLimit(initial_limit=20, smoothing=1, min_limit=5)
+
+    assert algorithm.update(100, 0.01, 1, True) == 60
+    assert algorithm.update(5, 0.01, 1, True) == 5
+
+
+def test_gradient_drops_shrink_small_limits():
+    algorithm = GradientLimit(initial_limit=3, smoothing=1)
+
+    assert algorithm.update(3, 0.01, 1, True) == 2
+    assert algorithm.update(1.5, 0.01, 1, True) == 1
+
+
+async def test_adaptive_limiter_rejects_excess_work():
+    limiter = AdaptiveLimiter(AIMDLimit(initial_limit=2))
+    event = asyncio.Event()
+
+    async def func():
+        await event.wait()
+        return "done"
+
+    tasks = [asyncio.create_task(limiter.execute(func)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert limiter.inflight == 2
+
+    with pytest.raises(LimitExceeded):
+        await limiter.execute(func)
+
+    event.set()
+    assert await asyncio.gather(*tasks) == ["done", "done"]
+    assert limiter.inflight == 0
+    assert limiter.limit == 4
+
+
+async def test_adaptive_limiter_uses_measured_latency():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(
+        AIMDLimit(initial_limit=4, latency_threshold=1, backoff_ratio=0.5),
+        clock=clock,
+    )
+
+    async def slow():
+        clock.now += 5
+
+    await limiter.execute(slow)
+
+    assert limiter.limit == 2
+
+
+async def test_adaptive_limiter_counts_drops_with_predicate():
+    limiter = AdaptiveLimiter(
+        AIMDLimit(initial_limit=4, backoff_ratio=0.5),
+        is_drop=lambda exc: isinstance(exc, TimeoutError),
+    )
+
+    @with_limiter(limiter)
+    async def func(exc: Exception):
+        raise exc
+
+    with pytest.raises(KeyError):
+        await func(KeyError())
+    assert limiter.limit == 4
+
+    with pytest.raises(TimeoutError):
+        await func(TimeoutError())
+    assert limiter.limit == 2
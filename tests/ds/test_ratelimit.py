@@ -0,0 +1,103 @@
+import pytest
+
+from gyver.ds import GCRA, KeyedRateLimiter, TokenBucket
+from gyver.ds.ratelimit import _RateLimiter
+from gyver.exc import InvalidParamValue, RateLimited
+
+from ..clock import FakeClock
+
+
+def test_token_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    clock.now += 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    clock.now += 10
+    assert bucket.tokens == 3
+
+
+def test_token_bucket_multiple_tokens():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=5, clock=clock)
+
+    assert bucket.try_acquire(4)
+    assert not bucket.try_acquire(2)
+    assert bucket._reserve(2) == 1
+
+    with pytest.raises(InvalidParamValue):
+        bucket.try_acquire(6)
+
+
+def test_rate_limiters_validate_params():
+    with pytest.raises(InvalidParamValue):
+        TokenBucket(rate=0)
+    with pytest.raises(InvalidParamValue):
+        GCRA(rate=1, burst=0)
+
+
+def test_rate_limiters_must_implement_reserve():
+    class Incomplete(_RateLimiter):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
+
+
+def test_gcra_allows_burst_and_spaces_requests():
+    clock = FakeClock()
+    limiter = GCRA(rate=10, burst=3, clock=clock)
+
+    assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    clock.now += 0.1
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert limiter._reserve(1) == pytest.approx(0.1)
+
+    with pytest.raises(InvalidParamValue):
+        limiter.try_acquire(4)
+
+
+def test_acquire_waits_for_tokens():
+    bucket = TokenBucket(rate=100, burst=1)
+    bucket.acquire()
+
+    bucket.acquire(timeout=1)
+
+    assert not bucket.try_acquire()
+
+
+def test_acquire_raises_when_timeout_is_too_short():
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.acquire()
+
+    with pytest.raises(RateLimited):
+        bucket.acquire(timeout=0.01)
+
+
+async def test_async_acquire():
+    limiter = GCRA(rate=100, burst=1)
+    await limiter.async_acquire()
+    await limiter.async_acquire(timeout=1)
+
+    with pytest.raises(RateLimited):
+        await limiter.async_acquire(timeout=0)
+
+
+async def test_keyed_rate_limiter_isolates_and_bounds_keys():
+    clock = FakeClock()
+    limiter = KeyedRateLimiter(lambda: TokenBucket(1, 1, clock=clock), max_keys=2)
+
+    assert limiter.try_acquire("a")
+    assert not limiter.try_acquire("a")
+    assert limiter.try_acquire("b")
+    limiter.acquire("c", timeout=0)
+    assert len(limiter) == 2
+
+    # "a" was evicted, so it starts over with a full bucket
+    await limiter.async_acquire("a", timeout=0)
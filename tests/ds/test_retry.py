@@ -0,0 +1,146 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from gyver.ds import (
+    CircuitBreaker,
+    ConstantBackoff,
+    Retry,
+    RetryBudget,
+    current_deadline,
+    with_retry,
+)
+from gyver.exc import DeadlineExceeded
+
+from ..clock import FakeClock
+
+
+def make_flaky(failures: int, exc: type[Exception] = ValueError):
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        if calls <= failures:
+            raise exc(calls)
+        return calls
+
+    return func
+
+
+async def test_retry_until_success():
+    retry = Retry(max_attempts=3, backoff=ConstantBackoff(0))
+
+    assert await retry.execute(make_flaky(2)) == 3
+
+
+async def test_retry_gives_up_after_max_attempts():
+    retry = Retry(max_attempts=3, backoff=ConstantBackoff(0))
+
+    with pytest.raises(ValueError, match="3"):
+        await retry.execute(make_flaky(5))
+
+
+async def test_retry_only_retryable_exceptions():
+    retry = Retry(
+        backoff=ConstantBackoff(0),
+        retry_on=lambda exc: isinstance(exc, ConnectionError),
+    )
+
+    with pytest.raises(KeyError):
+        await retry.execute(make_flaky(1, KeyError))
+    assert await retry.execute(make_flaky(1, ConnectionError)) == 2
+
+
+async def test_retry_respects_deadline():
+    clock = FakeClock()
+    retry = Retry(max_attempts=10, backoff=ConstantBackoff(0), deadline=1, clock=clock)
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        clock.now += 0.4
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await retry.execute(func)
+    assert calls == 3
+
+
+async def test_retry_deadline_bounds_each_attempt():
+    retry = Retry(max_attempts=10, backoff=ConstantBackoff(0), deadline=0.05)
+    deadlines = []
+
+    async def func():
+        deadlines.append(current_deadline())
+        await asyncio.sleep(1)
+
+    with pytest.raises(DeadlineExceeded):
+        await retry.execute(func)
+    assert len(deadlines) == 1
+    assert deadlines[0] is not None
+
+
+async def test_retry_stops_when_circuit_is_frozen():
+    breaker = CircuitBreaker(freeze_function=partial(asyncio.sleep, 0.05))
+    retry = Retry(max_attempts=5, backoff=ConstantBackoff(0), circuit_breaker=breaker)
+    tripped = asyncio.Event()
+
+    async def trip():
+        tripped.set()
+        raise ValueError
+
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        raise ConnectionError
+
+    trip_task = asyncio.create_task(breaker.execute(trip))
+    await tripped.wait()
+    await asyncio.sleep(0)
+    assert breaker.is_frozen
+
+    with pytest.raises(ConnectionError):
+        await retry.execute(func)
+    assert calls == 1
+
+    with pytest.raises(ValueError):
+        await trip_task
+
+
+async def test_retry_budget_caps_retries():
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.5, min_per_second=0, ttl=10, clock=clock)
+    retry = Retry(max_attempts=2, backoff=ConstantBackoff(0), budget=budget)
+
+    for _ in range(4):
+        with pytest.raises(ValueError):
+            await retry.execute(make_flaky(5))
+
+    # 4 calls at 50% allow 2 retries
+    assert budget.balance == 0
+
+    clock.now += 11
+    assert budget.balance == 0
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+
+def test_retry_budget_keeps_minimum_allowance():
+    budget = RetryBudget(ratio=0, min_per_second=1, ttl=2, clock=FakeClock())
+
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+
+async def test_with_retry_decorator():
+    func = with_retry(Retry(backoff=ConstantBackoff(0)))(make_flaky(1))
+
+    assert await func() == 2
@@ -0,0 +1,152 @@
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gyver.ds import CircuitBreaker, ConstantBackoff
+from gyver.ds.shared import SharedCircuitState
+
+from ..clock import FakeClock
+
+
+@pytest.fixture
+def state_path(tmp_path: Path) -> Path:
+    return tmp_path / "circuit.state"
+
+
+def test_trip_is_visible_to_every_handle(state_path: Path):
+    clock = FakeClock(start=100.0)
+    first = SharedCircuitState(state_path, probe_timeout=1, clock=clock)
+    second = SharedCircuitState(state_path, probe_timeout=1, clock=clock)
+
+    assert second.claim() == 0
+    first.trip(5)
+
+    assert second.trips == 1
+    assert second.claim() == 5
+
+    first.close()
+    second.close()
+
+
+def test_single_half_open_probe(state_path: Path):
+    clock = FakeClock(start=100.0)
+    first = SharedCircuitState(state_path, probe_timeout=1, clock=clock)
+    second = SharedCircuitState(state_path, probe_timeout=1, clock=clock)
+    first.trip(5)
+
+    clock.now += 5
+    assert first.claim() == 0
+    assert second.claim() == 1
+    # the holder of the probe is let through
+    assert first.claim() == 0
+
+    # the probe did not report back in time, another one is allowed
+    clock.now += 1
+    assert second.claim() == 0
+
+    second.reset()
+    assert first.is_closed()
+    assert first.claim() == 0
+
+    first.close()
+    second.close()
+
+
+def test_reset_is_ignored_while_open(state_path: Path):
+    clock = FakeClock(start=100.0)
+    state = SharedCircuitState(state_path, clock=clock)
+    state.trip(5)
+
+    state.reset()
+    assert state.trips == 1
+
+    clock.now += 5
+    state.reset()
+    assert state.trips == 0
+    state.close()
+
+
+def test_trip_is_visible_across_processes(state_path: Path):
+    script = (
+        "from gyver.ds.shared import SharedCircuitState;"
+        f"SharedCircuitState({str(state_path)!r}).trip(60)"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    state = SharedCircuitState(state_path)
+    assert state.trips == 1
+    assert state.claim() > 0
+    state.close()
+
+
+async def test_breakers_share_trips(state_path: Path):
+    fallback_calls = 0
+
+    async def fallback():
+        nonlocal fallback_calls
+        fallback_calls += 1
+        return "fallback"
+
+    first = CircuitBreaker(
+        open_policy=ConstantBackoff(0.05),
+        shared_state=SharedCircuitState(state_path, probe_timeout=0.05),
+    )
+    second = CircuitBreaker(
+        open_policy=ConstantBackoff(0.05),
+        shared_state=SharedCircuitState(state_path, probe_timeout=0.05),
+        fallback=fallback,
+    )
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError
+        return "success"
+
+    first_task = asyncio.create_task(first.execute(func))
+    await asyncio.sleep(0.01)
+
+    # the second breaker never reached the dependency and served its fallback
+    assert await second.execute(func) == "fallback"
+    assert second.is_frozen
+    assert calls == 1
+
+    assert await first_task == "success"
+    assert first.shared_state is not None
+    assert first.shared_state.is_closed()
+    await second._freeze_future
+    assert await second.execute(func) == "success"
+
+
+async def test_breaker_recovers_after_open_period(state_path: Path):
+    async def fallback():
+        return "fallback"
+
+    cb = CircuitBreaker(
+        open_policy=ConstantBackoff(0.05),
+        shared_state=SharedCircuitState(state_path, probe_timeout=60),
+        fallback=fallback,
+    )
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError
+        return "success"
+
+    assert await cb.execute(func) == "fallback"
+    assert cb._freeze_future is not None
+    await cb._freeze_future
+
+    # the probe claimed when unfreezing belongs to this breaker, so the next
+    # call reaches the dependency instead of waiting for `probe_timeout`
+    assert await cb.execute(func) == "success"
+    assert cb.shared_state is not None
+    assert cb.shared_state.is_closed()
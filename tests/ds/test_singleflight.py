@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from gyver.ds import AsyncSingleFlight, SingleFlight, deadline, with_single_flight
+from gyver.exc import DeadlineExceeded
+
+from ..clock import FakeClock
+
+
+async def test_async_single_flight_coalesces_calls():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def func(value):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        *(flight.execute("key", func, i) for i in range(5)),
+        flight.execute("other", func, "other"),
+    )
+
+    assert results == [0, 0, 0, 0, 0, "other"]
+    assert calls == 2
+    assert flight.inflight == 0
+
+
+async def test_async_single_flight_shares_errors():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError(calls)
+
+    results = await asyncio.gather(
+        *(flight.execute("key", func) for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    with pytest.raises(ValueError, match="2"):
+        await flight.execute("key", func)
+
+
+async def test_async_single_flight_survives_caller_cancellation():
+    flight = AsyncSingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.create_task(flight.execute("key", func))
+    second = asyncio.create_task(flight.execute("key", func))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+    assert first.cancelled()
+
+
+async def test_async_single_flight_ttl():
+    clock = FakeClock()
+    flight = AsyncSingleFlight(ttl=1, clock=clock)
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.execute("key", func) == 1
+    assert await flight.execute("key", func) == 1
+    clock.now = 1
+    assert await flight.execute("key", func) == 2
+    flight.forget("key")
+    assert await flight.execute("key", func) == 3
+
+
+async def test_async_single_flight_max_keys():
+    flight = AsyncSingleFlight(max_keys=1)
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(
+        flight.execute("a", func), flight.execute("b", func), flight.execute("b", func)
+    )
+
+    assert calls == 3
+
+
+def test_single_flight_coalesces_threads():
+    flight = SingleFlight()
+    calls = 0
+    barrier = threading.Barrier(5)
+    results = []
+
+    def func():
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return "done"
+
+    def worker():
+        barrier.wait()
+        results.append(flight.execute("key", func))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["done"] * 5
+    assert calls == 1
+    assert flight.inflight == 0
+
+
+def test_single_flight_shares_errors_and_ttl():
+    clock = FakeClock()
+    flight = SingleFlight(ttl=1, clock=clock)
+    calls = 0
+
+    def func(fail: bool):
+        nonlocal calls
+        calls += 1
+        if fail:
+            raise ValueError(calls)
+        return calls
+
+    with pytest.raises(ValueError):
+        flight.execute("key", func, True)
+    assert flight.execute("key", func, False) == 2
+    assert flight.execute("key", func, False) == 2
+    clock.now = 1
+    assert flight.execute("key", func, False) == 3
+
+
+def test_single_flight_wait_respects_deadline():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait()
+        return "done"
+
+    thread = threading.Thread(target=flight.execute, args=("key", slow))
+    thread.start()
+    started.wait()
+    try:
+        with deadline(0.01), pytest.raises(DeadlineExceeded):
+            flight.execute("key", slow)
+    finally:
+        release.set()
+        thread.join()
+
+
+async def test_with_single_flight_decorator():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    @with_single_flight(flight)
+    async def func(value):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return value
+
+    assert await asyncio.gather(func(1), func(1), func(2)) == [1, 1, 2]
+    assert calls == 2
+    # unhashable arguments are not coalesced
+    assert await asyncio.gather(func([1]), func([1])) == [[1], [1]]
+    assert calls == 4
+
+
+def test_with_single_flight_sync_decorator():
+    flight = SingleFlight(ttl=60)
+    calls = 0
+
+    @with_single_flight(flight)
+    def func(value):
+        nonlocal calls
+        calls += 1
+        return value
+
+    assert func(1) == 1
+    assert func(1) == 1
+    assert func([1]) == [1]
+    assert calls == 2
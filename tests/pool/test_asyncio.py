@@ -57,6 +57,30 @@ async def test_pool_release(async_pool: AsyncPool[MockResource]):
     assert next_resource is resource
 
 
+async def test_pool_discard(async_pool: AsyncPool[MockResource]):
+    resource = await async_pool.acquire()
+
+    await async_pool.discard(resource)
+
+    next_resource = await async_pool.acquire()
+
+    assert not resource.active
+    assert next_resource is not resource
+
+
+async def test_pool_discard_wakes_waiting_acquire():
+    pool = AsyncPool(get_factory(), MockResource.close, pool_size=1)
+    resource = await pool.acquire()
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.01)
+
+    await pool.discard(resource)
+    replacement = await asyncio.wait_for(waiter, timeout=1)
+
+    assert replacement is not resource
+    assert replacement.active
+
+
 async def test_pool_prefill(async_pool: AsyncPool[MockResource]):
     await async_pool.prefill(3)
 
@@ -57,6 +57,33 @@ def test_pool_release(thread_pool):
     assert next_resource is resource
 
 
+def test_pool_discard(thread_pool):
+    resource = thread_pool.acquire()
+
+    thread_pool.discard(resource)
+
+    next_resource = thread_pool.acquire()
+
+    assert not resource.active
+    assert next_resource is not resource
+
+
+def test_pool_discard_wakes_waiting_acquire():
+    pool = ThreadPool(get_factory(), MockResource.close, pool_size=1)
+    resource = pool.acquire()
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    waiter.start()
+    time.sleep(0.05)
+
+    pool.discard(resource)
+    waiter.join(timeout=1)
+
+    assert not waiter.is_alive()
+    assert acquired[0] is not resource
+    assert acquired[0].active
+
+
 def test_pool_prefill(thread_pool):
     thread_pool.prefill(3)
 